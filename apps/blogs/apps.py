@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class BlogConfig(AppConfig):
     name = "apps.blogs"
+
+    def ready(self):
+        from apps.blogs import signals  # noqa:F401,PLC0415
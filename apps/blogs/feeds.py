@@ -0,0 +1,100 @@
+import hashlib
+import uuid
+from calendar import timegm
+
+from django.conf import settings
+from django.contrib.syndication.views import Feed
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.feedgenerator import Atom1Feed, Rss201rev2Feed
+from django.utils.html import strip_tags
+from django.utils.http import http_date
+
+from wagtail.templatetags.wagtailcore_tags import richtext
+
+BLOG_FEED_CACHE_PREFIX = "blogs:feed"
+BLOG_FEED_VERSION_CACHE_KEY = f"{BLOG_FEED_CACHE_PREFIX}:version"
+
+
+class BlogRssFeed(Feed):
+    feed_type = Rss201rev2Feed
+    cache_name = "rss"
+
+    def title(self, obj):
+        return obj.title
+
+    def link(self, obj):
+        return obj.full_url
+
+    def description(self, obj):
+        return strip_tags(obj.intro)
+
+    def items(self, obj):
+        return obj.get_latest_blogs(limit=settings.BLOG_FEED_ITEMS)
+
+    def item_title(self, item):
+        return item.title
+
+    def item_link(self, item):
+        return item.full_url
+
+    def item_description(self, item):
+        return str(richtext(item.body))
+
+    def item_pubdate(self, item):
+        return item.first_published_at
+
+    def item_updateddate(self, item):
+        return item.last_published_at
+
+
+class BlogAtomFeed(BlogRssFeed):
+    feed_type = Atom1Feed
+    cache_name = "atom"
+    subtitle = BlogRssFeed.description
+
+
+def invalidate_blog_feeds() -> None:
+    """Invalidate all cached feeds by moving to a new cache version"""
+    cache.set(BLOG_FEED_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+
+
+def get_cached_feed(request: HttpRequest, index_page, feed_class: type[BlogRssFeed]) -> dict:
+    """
+    Return the generated feed for a blog index page, along with its validators.
+
+    Feeds are generated at most once per publish, unpublish or move of any page, after which
+    every poll is served from the cache.
+    """
+    version = cache.get_or_set(BLOG_FEED_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+    cache_key = f"{BLOG_FEED_CACHE_PREFIX}:{version}:{index_page.pk}:{feed_class.cache_name}"
+
+    feed = cache.get(cache_key)
+    if feed is None:
+        generator = feed_class().get_feed(index_page, request)
+        content = generator.writeString("utf-8").encode("utf-8")
+        feed = {
+            "content": content,
+            "content_type": generator.content_type,
+            "etag": quote_etag(hashlib.sha256(content).hexdigest()),
+            "last_modified": timegm(generator.latest_post_date().utctimetuple()),
+        }
+        cache.set(cache_key, feed, settings.BLOG_FEED_CACHE_TIMEOUT)
+
+    return feed
+
+
+def serve_feed(request: HttpRequest, index_page, feed_class: type[BlogRssFeed]) -> HttpResponse:
+    """Serve a cached feed, replying 304 Not Modified to matching conditional requests"""
+    feed = get_cached_feed(request, index_page, feed_class)
+
+    response = get_conditional_response(
+        request, etag=feed["etag"], last_modified=feed["last_modified"]
+    )
+    if response is None:
+        response = HttpResponse(feed["content"], content_type=feed["content_type"])
+
+    response.headers["ETag"] = feed["etag"]
+    response.headers["Last-Modified"] = http_date(feed["last_modified"])
+    return response
@@ -1,21 +1,25 @@
+import multiprocessing
 import os
-import tempfile
-from datetime import UTC, date, datetime
+import time
+from collections import defaultdict
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from functools import partial
 from pathlib import Path
 
+from django.conf import settings
 from django.core.exceptions import PermissionDenied, ValidationError
 from django.core.files.images import ImageFile
 from django.core.management.base import BaseCommand
 from django.db import IntegrityError
 
-import frontmatter
-import markdown
-from PIL import Image as PILImage
 from wagtail.models import Page
 
-from apps.blogs.models import BlogDetailPage, BlogIndexPage
+from apps.blogs.models import BlogContentSource, BlogDetailPage, BlogIndexPage
+from apps.blogs.utils import compress_image, file_hash, parse_post
+from apps.blogs.utils.related_posts import defer_related_posts, rebuild_related_posts
 from apps.core.models import CustomImage
 from apps.core.utils import WagtailSetupUtils
+from apps.core.utils.prerender import defer_prerendering, prerender_all_pages
 
 
 class Command(BaseCommand):
@@ -45,12 +49,26 @@ class Command(BaseCommand):
             action="store_true",
             help="Force deletion of existing blog pages, even if they're not BlogIndexPage types",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Number of processes used to parse markdown and compress images",
+        )
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Only import posts and images which have changed since the last import, "
+            "and remove posts whose markdown file no longer exists",
+        )
 
     def handle(self, *args, **options):
         content_file = Path(options["content_file"])
         content_dir = Path(options["content_dir"])
         images_dir = Path(options["images_dir"])
         force = options["force"]
+        workers = max(1, options["workers"])
+        incremental = options["incremental"]
         utils = WagtailSetupUtils(self)
 
         if not utils.check_model_tables_exist([BlogDetailPage, BlogIndexPage]):
@@ -65,17 +83,33 @@ class Command(BaseCommand):
         if not parent_page:
             return
 
-        utils.styled_output("Cleaning up existing blog content...")
-        utils.cleanup_pages_by_type([BlogDetailPage, BlogIndexPage])
+        # Related posts and pre-rendered pages are rebuilt once at the end, rather than after every
+        # post is changed
+        with defer_related_posts(), defer_prerendering():
+            blog_index = None
+            if incremental:
+                blog_index = BlogIndexPage.objects.child_of(parent_page).first()
+                if blog_index:
+                    utils.styled_output(f"Syncing changes into existing blog: {blog_index.title}")
 
-        if not utils.check_slug_availability(parent_page, "blog", force):
-            return
+            if not blog_index:
+                utils.styled_output("Cleaning up existing blog content...")
+                utils.cleanup_pages_by_type([BlogDetailPage, BlogIndexPage])
 
-        blog_index = self._create_blog_index(content_file, utils, parent_page)
-        if not blog_index:
-            return
+                if not utils.check_slug_availability(parent_page, "blog", force):
+                    return
+
+                blog_index = self._create_blog_index(content_file, utils, parent_page)
+                if not blog_index:
+                    return
+
+            self._import_markdown_files(
+                utils, blog_index, content_dir, images_dir, workers, incremental=incremental
+            )
 
-        self._import_markdown_files(utils, blog_index, content_dir, images_dir)
+        rebuild_related_posts()
+        if settings.PRERENDER_ENABLED:
+            prerender_all_pages()
 
         utils.styled_output(f"Successfully imported {BlogDetailPage.objects.count()} blog posts")
         utils.styled_output("Blog available at: /blog/")
@@ -100,14 +134,27 @@ class Command(BaseCommand):
             return blog_index
 
     def _import_markdown_files(
-        self, utils: WagtailSetupUtils, blog_index: Page, content_dir: Path, images_dir: Path
+        self,
+        utils: WagtailSetupUtils,
+        blog_index: Page,
+        content_dir: Path,
+        images_dir: Path,
+        workers: int,
+        incremental: bool = False,
     ) -> None:
-        """Import markdown files as blog posts"""
+        """
+        Import markdown files as blog posts.
+
+        Parsing and image compression are CPU bound, so they run in a process pool. Pages are
+        created by this process alone, as the page tree can't be written to concurrently, in file
+        order as soon as each post is parsed, so later posts are parsed and images compressed
+        while earlier pages are written.
+        """
         if not content_dir.exists():
             utils.styled_output(f"Content directory not found: {content_dir}", "WARNING")
             return
 
-        markdown_files = [f.name for f in content_dir.iterdir() if f.suffix == ".md"]
+        markdown_files = sorted(f for f in content_dir.iterdir() if f.suffix == ".md")
 
         if not markdown_files:
             utils.styled_output(f"No markdown files found in {content_dir}", "WARNING")
@@ -115,61 +162,209 @@ class Command(BaseCommand):
 
         utils.styled_output(f"Found {len(markdown_files)} markdown files")
 
-        for filename in markdown_files:
-            file_path = content_dir / filename
-            self._import_single_post(utils, blog_index, file_path, filename, images_dir)
+        post_hashes = {file_path: file_hash(file_path) for file_path in markdown_files}
+        post_sources = self._get_sources(BlogContentSource.KIND_POST)
+        changed_images = {}
+
+        if incremental:
+            self._delete_removed_posts(utils, post_sources, markdown_files)
+            markdown_files = [
+                file_path
+                for file_path in markdown_files
+                if self._has_changed(post_sources.get(file_path.name), post_hashes[file_path])
+            ]
+            changed_images = self._find_changed_images(images_dir)
+            utils.styled_output(
+                f"{len(markdown_files)} changed posts and {len(changed_images)} changed images"
+            )
+            if not markdown_files and not changed_images:
+                return
+
+        timings = defaultdict(float)
+        started = time.perf_counter()
+
+        # Spawn rather than fork, so workers don't inherit this process's database connections
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            image_futures = {
+                source.path: executor.submit(compress_image, images_dir / source.path)
+                for source, _ in changed_images.values()
+            }
+            post_futures = {executor.submit(parse_post, path): path for path in markdown_files}
+            existing_images = set(CustomImage.objects.values_list("title", flat=True))
+
+            db_started = time.perf_counter()
+            for source, content_hash in changed_images.values():
+                self._replace_image(
+                    utils, source, images_dir, content_hash, image_futures[source.path], timings
+                )
+            timings["db"] += time.perf_counter() - db_started
+
+            unparsed = list(post_futures)
+            for future, file_path in post_futures.items():
+                # Queue compression for the images of every post parsed so far, not just this one
+                wait([future])
+                parsed = [parsed_future for parsed_future in unparsed if parsed_future.done()]
+                unparsed = [pending for pending in unparsed if not pending.done()]
+                self._submit_image_compression(
+                    executor, parsed, images_dir, existing_images, image_futures, timings
+                )
+
+                db_started = time.perf_counter()
+                self._import_single_post(
+                    utils,
+                    blog_index,
+                    future,
+                    file_path,
+                    post_hashes[file_path],
+                    post_sources.get(file_path.name),
+                    images_dir,
+                    image_futures,
+                    timings,
+                )
+                timings["db"] += time.perf_counter() - db_started
+
+        utils.styled_output(
+            f"Import timings with {workers} worker(s): "
+            f"parse {timings['parse']:.2f}s and images {timings['images']:.2f}s of worker time, "
+            f"database {timings['db']:.2f}s, total {time.perf_counter() - started:.2f}s"
+        )
+
+    @staticmethod
+    def _get_sources(kind: str) -> dict[str, BlogContentSource]:
+        """Get the recorded content sources of a kind, keyed by file name"""
+        sources = BlogContentSource.objects.filter(kind=kind).select_related("page", "image")
+        return {source.path: source for source in sources}
+
+    @staticmethod
+    def _has_changed(source: BlogContentSource | None, content_hash: str) -> bool:
+        """Check whether a file needs importing again"""
+        return source is None or source.page_id is None or source.content_hash != content_hash
+
+    @staticmethod
+    def _delete_removed_posts(
+        utils: WagtailSetupUtils,
+        post_sources: dict[str, BlogContentSource],
+        markdown_files: list[Path],
+    ) -> None:
+        """Delete posts whose markdown file has been removed"""
+        filenames = {file_path.name for file_path in markdown_files}
+
+        for path, source in post_sources.items():
+            if path in filenames:
+                continue
+
+            if source.page:
+                # Deleting the page cascades to its source
+                utils.styled_output(f"\t- Deleting removed post: {source.page.title}")
+                source.page.delete()
+            else:
+                source.delete()
+
+    def _find_changed_images(self, images_dir: Path) -> dict[str, tuple[BlogContentSource, str]]:
+        """Find previously imported images whose file has changed, with their new hash"""
+        changed_images = {}
+
+        for path, source in self._get_sources(BlogContentSource.KIND_IMAGE).items():
+            image_path = images_dir / path
+            if not source.image or not image_path.exists():
+                continue
+
+            content_hash = file_hash(image_path)
+            if content_hash != source.content_hash:
+                changed_images[path] = (source, content_hash)
+
+        return changed_images
+
+    @staticmethod
+    def _submit_image_compression(
+        executor: ProcessPoolExecutor,
+        parsed_futures: list[Future],
+        images_dir: Path,
+        existing_images: set[str],
+        image_futures: dict[str, Future],
+        timings: dict[str, float],
+    ) -> None:
+        """Queue compression for the new featured images of parsed posts"""
+        for future in parsed_futures:
+            if future.exception():
+                continue
+
+            post = future.result()
+            timings["parse"] += post["elapsed"]
+            image_name = post["featured_image_name"]
+            if (
+                image_name
+                and image_name not in existing_images
+                and image_name not in image_futures
+                and (images_dir / image_name).exists()
+            ):
+                image_futures[image_name] = executor.submit(
+                    compress_image, images_dir / image_name
+                )
 
     def _import_single_post(
         self,
         utils: WagtailSetupUtils,
         blog_index: Page,
+        post_future: Future,
         file_path: Path,
-        filename: str,
+        content_hash: str,
+        source: BlogContentSource | None,
         images_dir: Path,
+        image_futures: dict[str, Future],
+        timings: dict[str, float],
     ) -> None:
-        """Import a single markdown file as a blog post"""
+        """Create or update a single blog post from a parsed markdown file"""
+        filename = file_path.name
         try:
-            with file_path.open(encoding="utf-8") as f:
-                post = frontmatter.load(f)
-
-            # Extract metadata from frontmatter
-            title = post.metadata.get(
-                "title", filename.replace(".md", "").replace("-", " ").title()
-            )
-            slug = post.metadata.get("slug", filename.replace(".md", ""))
-            date_str = post.metadata.get("date")
-            intro = post.metadata.get("intro", "")
-            featured_image_name = str(post.metadata.get("featured_image"))
-            featured_image_alt = str(post.metadata.get("featured_image_alt", ""))
-            featured_image_caption = str(post.metadata.get("featured_image_caption", ""))
-
-            date_obj = self._parse_date(date_str)
-
-            # Convert markdown to HTML
-            md = markdown.Markdown(extensions=["extra", "codehilite"])
-            body_html = md.convert(post.content)
+            post = post_future.result()
 
             featured_image = None
-            if featured_image_name and images_dir.exists():
+            if post["featured_image_name"] and images_dir.exists():
                 featured_image = self._import_image(
                     utils,
-                    featured_image_name,
+                    post["featured_image_name"],
                     images_dir,
-                    featured_image_alt,
-                    featured_image_caption,
+                    image_futures.get(post["featured_image_name"]),
+                    timings,
+                    post["featured_image_alt"],
+                    post["featured_image_caption"],
                 )
 
-            blog_post = BlogDetailPage(
-                title=title,
-                slug=slug,
-                date=date_obj,
-                intro=intro,
-                body=body_html,
-                featured_image=featured_image,
-            )
+            fields = {
+                "title": post["title"],
+                "slug": post["slug"],
+                "date": post["date"],
+                "intro": post["intro"],
+                "body": post["body"],
+                "featured_image": featured_image,
+            }
+
+            # Update the existing page in place, adopting pages imported before sources were
+            # recorded, so the URL and page history are kept
+            blog_post = source.page if source else None
+            if blog_post is None:
+                blog_post = (
+                    BlogDetailPage.objects.child_of(blog_index).filter(slug=post["slug"]).first()
+                )
 
-            utils.create_and_publish_page(blog_index, blog_post)
-            utils.styled_output(f"\t- Imported: {title}")
+            if blog_post:
+                for field, value in fields.items():
+                    setattr(blog_post, field, value)
+                utils.publish_page_changes(blog_post)
+                utils.styled_output(f"\t- Updated: {post['title']}")
+            else:
+                blog_post = BlogDetailPage(**fields)
+                utils.create_and_publish_page(blog_index, blog_post)
+                utils.styled_output(f"\t- Imported: {post['title']}")
+
+            BlogContentSource.objects.update_or_create(
+                kind=BlogContentSource.KIND_POST,
+                path=filename,
+                defaults={"content_hash": content_hash, "page": blog_post},
+            )
 
         except (OSError, UnicodeDecodeError) as e:
             utils.styled_output(f"Failed to read file {filename}: {e}", "ERROR")
@@ -178,31 +373,17 @@ class Command(BaseCommand):
         except (ValueError, TypeError, AttributeError) as e:
             utils.styled_output(f"Failed to process content in {filename}: {e}", "ERROR")
 
-    @staticmethod
-    def _parse_date(date_str: str | None) -> date:
-        """Parse date from various formats"""
-        if date_str:
-            try:
-                return datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=UTC).date()
-            except ValueError:
-                try:
-                    return (
-                        datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S").replace(tzinfo=UTC).date()
-                    )
-                except ValueError:
-                    return datetime.now(UTC).date()
-        else:
-            return datetime.now(UTC).date()
-
     def _import_image(
         self,
         utils: WagtailSetupUtils,
         image_name: str,
         images_dir: Path,
+        compress_future: Future | None,
+        timings: dict[str, float],
         alt_text: str = "",
         caption: str = "",
     ) -> "CustomImage | None":
-        """Import and compress an image file into Wagtail's image library"""
+        """Import a compressed image file into Wagtail's image library"""
         image_path = Path(images_dir) / image_name
 
         if not Path.exists(image_path):
@@ -220,9 +401,19 @@ class Command(BaseCommand):
                     utils.styled_output(
                         f"\t- Updated existing image with alt: '{existing_image.alt_text}'"
                     )
+                BlogContentSource.objects.get_or_create(
+                    kind=BlogContentSource.KIND_IMAGE,
+                    path=image_name,
+                    defaults={
+                        "content_hash": partial(file_hash, image_path),
+                        "image": existing_image,
+                    },
+                )
                 return existing_image
 
-            compressed_image_path = self._compress_image(utils, image_path)
+            compressed_image_path = self._get_compressed_image(
+                utils, image_path, compress_future, timings
+            )
 
             file_path = compressed_image_path if compressed_image_path else image_path
             with file_path.open("rb") as f:
@@ -236,6 +427,12 @@ class Command(BaseCommand):
                 wagtail_image.save()
                 utils.styled_output(f"\t- Saved image with alt: '{wagtail_image.alt_text}'")
 
+            BlogContentSource.objects.update_or_create(
+                kind=BlogContentSource.KIND_IMAGE,
+                path=image_name,
+                defaults={"content_hash": file_hash(image_path), "image": wagtail_image},
+            )
+
             # Clean up temporary compressed file if created
             if compressed_image_path and compressed_image_path != image_path:
                 Path.unlink(compressed_image_path)
@@ -254,36 +451,66 @@ class Command(BaseCommand):
         else:
             return wagtail_image
 
-    @staticmethod
-    def _compress_image(utils: WagtailSetupUtils, image_path: Path) -> Path | None:
-        """Compress an image using Pillow"""
+    def _replace_image(
+        self,
+        utils: WagtailSetupUtils,
+        source: BlogContentSource,
+        images_dir: Path,
+        content_hash: str,
+        compress_future: Future,
+        timings: dict[str, float],
+    ) -> None:
+        """Replace the file of a previously imported image whose source file has changed"""
+        image_path = images_dir / source.path
+        wagtail_image = source.image
+
         try:
-            with PILImage.open(image_path) as original_img:
-                # Convert to RGB if necessary (for JPEG)
-                processed_img = original_img
-                if original_img.mode in ("RGBA", "LA", "P"):
-                    processed_img = original_img.convert("RGB")
-
-                # Calculate new dimensions (max 1920px width, maintain aspect ratio)
-                max_width = 1920
-                if processed_img.width > max_width:
-                    ratio = max_width / processed_img.width
-                    new_height = int(processed_img.height * ratio)
-                    processed_img = processed_img.resize(
-                        (max_width, new_height), PILImage.Resampling.LANCZOS
-                    )
+            compressed_image_path = self._get_compressed_image(
+                utils, image_path, compress_future, timings
+            )
 
-                temp_fd, temp_path = tempfile.mkstemp(suffix=".png")
-                os.close(temp_fd)
+            file_path = compressed_image_path if compressed_image_path else image_path
+            with file_path.open("rb") as f:
+                wagtail_image.renditions.all().delete()
+                wagtail_image.file.delete(save=False)
+                wagtail_image.file = ImageFile(f, name=source.path)
+                # Recalculated from the new file when next needed
+                wagtail_image.file_size = None
+                wagtail_image.file_hash = ""
+                wagtail_image.save()
 
-                # Save with compression
-                processed_img.save(temp_path, "PNG", quality=85, optimize=True)
+            source.content_hash = content_hash
+            source.save()
 
-                return Path(temp_path)
+            if compressed_image_path and compressed_image_path != image_path:
+                Path.unlink(compressed_image_path)
+
+            utils.styled_output(f"\t- Replaced changed image: {source.path}")
 
+        except OSError as e:
+            utils.styled_output(f"Failed to read image file {source.path}: {e}", "ERROR")
+        except (ValidationError, IntegrityError) as e:
+            utils.styled_output(f"Failed to save image {source.path} to database: {e}", "ERROR")
+
+    @staticmethod
+    def _get_compressed_image(
+        utils: WagtailSetupUtils,
+        image_path: Path,
+        compress_future: Future | None,
+        timings: dict[str, float],
+    ) -> Path | None:
+        """Wait for the worker compressing an image, compressing it here if none was queued"""
+        try:
+            if compress_future is None:
+                compressed_image_path, elapsed = compress_image(image_path)
+            else:
+                compressed_image_path, elapsed = compress_future.result()
         except OSError as e:
             utils.styled_output(f"Failed to open image file {image_path}: {e}", "WARNING")
             return None
         except (ValueError, TypeError) as e:
             utils.styled_output(f"Image processing failed for {image_path}: {e}", "WARNING")
             return None
+        else:
+            timings["images"] += elapsed
+            return compressed_image_path
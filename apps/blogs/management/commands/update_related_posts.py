@@ -0,0 +1,21 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.blogs.utils.related_posts import rebuild_related_posts
+from apps.core.utils import WagtailSetupUtils
+
+
+class Command(BaseCommand):
+    help = "Recompute related posts for every live blog post"
+
+    def handle(self, *args, **options):
+        utils = WagtailSetupUtils(self)
+        started = time.perf_counter()
+
+        post_count = rebuild_related_posts()
+
+        utils.styled_output(
+            f"Computed related posts for {post_count} blog posts "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
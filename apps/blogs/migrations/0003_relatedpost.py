@@ -0,0 +1,51 @@
+# Generated by Django 5.2.6 on 2026-10-19 17:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blogs", "0002_blogcontentsource"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RelatedPost",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("rank", models.PositiveSmallIntegerField()),
+                ("score", models.FloatField()),
+                (
+                    "page",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="related_post_links",
+                        to="blogs.blogdetailpage",
+                    ),
+                ),
+                (
+                    "related_page",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="blogs.blogdetailpage",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["page", "rank"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("page", "rank"), name="unique_related_post_rank"
+                    )
+                ],
+            },
+        ),
+    ]
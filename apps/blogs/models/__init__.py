@@ -1,2 +1,4 @@
+from .blog_content_source import BlogContentSource as BlogContentSource
 from .blog_detail_page import BlogDetailPage as BlogDetailPage
 from .blog_index_page import BlogIndexPage as BlogIndexPage
+from .related_post import RelatedPost as RelatedPost
@@ -0,0 +1,36 @@
+from django.db import models
+
+
+class BlogContentSource(models.Model):
+    """
+    Content hash of a markdown post or image imported by setup_blogs.
+
+    Used by incremental imports to skip files which haven't changed since they were last imported.
+    """
+
+    KIND_POST = "post"
+    KIND_IMAGE = "image"
+    KIND_CHOICES = [(KIND_POST, "Post"), (KIND_IMAGE, "Image")]
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    path = models.CharField(max_length=255, help_text="File name within the content directory")
+    content_hash = models.CharField(max_length=64)
+    page = models.ForeignKey(
+        "blogs.BlogDetailPage",
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    image = models.ForeignKey(
+        "core.CustomImage", null=True, blank=True, on_delete=models.CASCADE, related_name="+"
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "path"], name="unique_blog_content_source")
+        ]
+
+    def __str__(self):
+        return f"{self.get_kind_display()}: {self.path}"
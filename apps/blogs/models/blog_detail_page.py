@@ -3,9 +3,12 @@ from django.db import models
 from wagtail.admin.panels import FieldPanel
 from wagtail.fields import RichTextField
 from wagtail.models import Page
+from wagtail.search import index
 
+from apps.core.mixins import CachedPageMixin, PrerenderedPageMixin
 
-class BlogDetailPage(Page):
+
+class BlogDetailPage(CachedPageMixin, PrerenderedPageMixin, Page):
     template = "blogs/blog_detail.html"
 
     date = models.DateField("Post date")
@@ -22,3 +25,31 @@ class BlogDetailPage(Page):
         FieldPanel("body"),
         FieldPanel("featured_image"),
     ]
+
+    search_fields = [
+        *Page.search_fields,
+        index.SearchField("intro"),
+        index.SearchField("body"),
+        index.FilterField("date"),
+    ]
+
+    def get_context(self, request, *args, **kwargs):
+        context = super().get_context(request, *args, **kwargs)
+        context["related_posts"] = self.get_related_posts()
+        return context
+
+    def get_related_posts(self):
+        """Return the precomputed related posts which are still live, most similar first"""
+        links = self.related_post_links.filter(related_page__live=True).select_related(
+            "related_page"
+        )
+        return [link.related_page for link in links]
+
+    def get_prerender_dependents(self):
+        # The blog index and home page list posts, and other posts may list this as related
+        site = self.get_site()
+        return [
+            self.get_parent(),
+            *([site.root_page] if site else []),
+            *BlogDetailPage.objects.filter(related_post_links__related_page=self),
+        ]
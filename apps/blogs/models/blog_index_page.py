@@ -1,11 +1,14 @@
 from wagtail.admin.panels import FieldPanel
+from wagtail.contrib.routable_page.models import RoutablePageMixin, path
 from wagtail.fields import RichTextField
 from wagtail.models import Page
 
+from apps.blogs.feeds import BlogAtomFeed, BlogRssFeed, serve_feed
 from apps.blogs.models.blog_detail_page import BlogDetailPage
+from apps.core.mixins import CachedPageMixin, PrerenderedPageMixin
 
 
-class BlogIndexPage(Page):
+class BlogIndexPage(CachedPageMixin, PrerenderedPageMixin, RoutablePageMixin, Page):
     template = "blogs/blog_index.html"
 
     intro = RichTextField(blank=True)
@@ -21,5 +24,18 @@ class BlogIndexPage(Page):
         context["blog_pages"] = blog_pages
         return context
 
+    def get_prerender_dependents(self):
+        # The home page lists the latest posts
+        site = self.get_site()
+        return [site.root_page] if site else []
+
     def get_latest_blogs(self, limit=3):
         return BlogDetailPage.objects.child_of(self).live().order_by("-first_published_at")[:limit]
+
+    @path("feed/", name="rss_feed")
+    def rss_feed(self, request):
+        return serve_feed(request, self, BlogRssFeed)
+
+    @path("feed/atom/", name="atom_feed")
+    def atom_feed(self, request):
+        return serve_feed(request, self, BlogAtomFeed)
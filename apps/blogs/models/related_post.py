@@ -0,0 +1,28 @@
+from django.db import models
+
+
+class RelatedPost(models.Model):
+    """
+    Precomputed nearest neighbour of a blog post by TF-IDF cosine similarity.
+
+    Rows are written by apps.blogs.utils.related_posts, so related posts can be read with a single
+    indexed lookup when a post is rendered.
+    """
+
+    page = models.ForeignKey(
+        "blogs.BlogDetailPage", on_delete=models.CASCADE, related_name="related_post_links"
+    )
+    related_page = models.ForeignKey(
+        "blogs.BlogDetailPage", on_delete=models.CASCADE, related_name="+"
+    )
+    rank = models.PositiveSmallIntegerField()
+    score = models.FloatField()
+
+    class Meta:
+        ordering = ["page", "rank"]
+        constraints = [
+            models.UniqueConstraint(fields=["page", "rank"], name="unique_related_post_rank")
+        ]
+
+    def __str__(self):
+        return f"{self.page_id} -> {self.related_page_id} ({self.score:.3f})"
@@ -0,0 +1,43 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from wagtail.signals import page_published, page_unpublished, post_page_move
+
+from apps.blogs.feeds import invalidate_blog_feeds
+from apps.blogs.models import BlogDetailPage, RelatedPost
+from apps.blogs.utils.related_posts import related_posts_deferred, update_related_posts
+from apps.core.utils.prerender import schedule_prerender_pages
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+@receiver(post_page_move)
+def invalidate_blog_caches(sender, **kwargs):
+    """Invalidate cached blog feeds when the page tree changes"""
+    invalidate_blog_feeds()
+
+
+def _refresh_related_posts(page_id, linked_page_ids=()):
+    """Update related posts, then render the posts whose related posts changed"""
+    schedule_prerender_pages(update_related_posts(page_id, linked_page_ids))
+
+
+@receiver(page_published, sender=BlogDetailPage)
+@receiver(page_unpublished, sender=BlogDetailPage)
+def refresh_related_posts(sender, instance, **kwargs):
+    """Update related posts once a blog post's changes have been committed"""
+    if not related_posts_deferred():
+        transaction.on_commit(partial(_refresh_related_posts, instance.pk))
+
+
+@receiver(pre_delete, sender=BlogDetailPage)
+def refresh_related_posts_on_delete(sender, instance, **kwargs):
+    """Update posts which linked to a blog post once its deletion has been committed"""
+    if not related_posts_deferred():
+        linked_page_ids = list(
+            RelatedPost.objects.filter(related_page=instance).values_list("page_id", flat=True)
+        )
+        transaction.on_commit(partial(_refresh_related_posts, instance.pk, linked_page_ids))
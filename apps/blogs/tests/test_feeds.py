@@ -0,0 +1,94 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from wagtail.models import Site
+
+from apps.blogs.feeds import BlogRssFeed
+from apps.blogs.models.blog_detail_page import BlogDetailPage
+from apps.blogs.models.blog_index_page import BlogIndexPage
+
+
+class BlogFeedTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.root_page = Site.objects.get(is_default_site=True).root_page
+
+        self.blog_index = BlogIndexPage(title="Blog Index", slug="blog")
+        self.root_page.add_child(instance=self.blog_index)
+
+        self.blog_detail = BlogDetailPage(
+            title="Test Blog Post",
+            slug="test-post",
+            date=timezone.now().date(),
+            intro="Test intro",
+            body="<p>Test content</p>",
+        )
+        self.blog_index.add_child(instance=self.blog_detail)
+        self.blog_detail.save_revision().publish()
+
+        self.rss_url = self.blog_index.url + self.blog_index.reverse_subpage("rss_feed")
+        self.atom_url = self.blog_index.url + self.blog_index.reverse_subpage("atom_feed")
+
+    def test_rss_feed(self):
+        """Test the RSS feed lists published posts"""
+        response = self.client.get(self.rss_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("application/rss+xml"))
+        self.assertContains(response, "Test Blog Post")
+        self.assertContains(response, "Test content")
+
+    def test_atom_feed(self):
+        """Test the Atom feed lists published posts"""
+        response = self.client.get(self.atom_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("application/atom+xml"))
+        self.assertContains(response, "Test Blog Post")
+
+    def test_feed_validators(self):
+        """Test feeds are served with ETag and Last-Modified headers"""
+        response = self.client.get(self.rss_url)
+        self.assertIn("ETag", response)
+        self.assertIn("Last-Modified", response)
+
+    def test_feed_not_modified_etag(self):
+        """Test a matching If-None-Match gets a 304 response"""
+        etag = self.client.get(self.rss_url)["ETag"]
+        response = self.client.get(self.rss_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+
+    def test_feed_not_modified_since(self):
+        """Test a matching If-Modified-Since gets a 304 response"""
+        last_modified = self.client.get(self.rss_url)["Last-Modified"]
+        response = self.client.get(self.rss_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+    def test_feed_generated_once(self):
+        """Test repeated polls are served from the cache"""
+        with mock.patch.object(
+            BlogRssFeed, "get_feed", autospec=True, side_effect=BlogRssFeed.get_feed
+        ) as get_feed:
+            self.client.get(self.rss_url)
+            self.client.get(self.rss_url)
+        self.assertEqual(get_feed.call_count, 1)
+
+    def test_feed_regenerated_on_publish(self):
+        """Test publishing a post updates the feed and its ETag"""
+        etag = self.client.get(self.rss_url)["ETag"]
+
+        new_post = BlogDetailPage(
+            title="Another Post",
+            slug="another-post",
+            date=timezone.now().date(),
+            intro="Another intro",
+        )
+        self.blog_index.add_child(instance=new_post)
+        new_post.save_revision().publish()
+
+        response = self.client.get(self.rss_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Another Post")
@@ -0,0 +1,110 @@
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from PIL import Image as PILImage
+from wagtail.models import Revision
+
+from apps.blogs.models import BlogContentSource, BlogDetailPage
+
+POST_CONTENT = """---
+title: "Unicorn News"
+slug: "unicorn-news"
+date: "2025-09-01"
+intro: "An intro"
+featured_image: "unicorn.png"
+featured_image_alt: "A unicorn"
+---
+
+{body}
+"""
+
+
+class SetupBlogsIncrementalTestCase(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+        media_settings = override_settings(MEDIA_ROOT=Path(self.temp_dir.name, "media"))
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+
+        self.content_dir = Path(self.temp_dir.name, "posts")
+        self.images_dir = Path(self.temp_dir.name, "images")
+        self.content_dir.mkdir()
+        self.images_dir.mkdir()
+
+        self.post_path = self.content_dir / "unicorn-news.md"
+        self.post_path.write_text(POST_CONTENT.format(body="Original body"), encoding="utf-8")
+        self.write_image("white")
+
+        self.import_posts()
+        self.post = BlogDetailPage.objects.get(slug="unicorn-news")
+
+    def write_image(self, colour):
+        PILImage.new("RGB", (20, 20), colour).save(self.images_dir / "unicorn.png")
+
+    def import_posts(self):
+        call_command(
+            "setup_blogs",
+            content_dir=str(self.content_dir),
+            images_dir=str(self.images_dir),
+            incremental=True,
+            workers=1,
+            stdout=StringIO(),
+        )
+
+    def get_revision_count(self):
+        return Revision.page_revisions.filter(object_id=str(self.post.pk)).count()
+
+    def test_unchanged_rerun(self):
+        """Test importing unchanged files again writes nothing"""
+        revision_count = self.get_revision_count()
+        sources = list(BlogContentSource.objects.values_list("path", "content_hash"))
+
+        self.import_posts()
+
+        self.assertEqual(self.get_revision_count(), revision_count)
+        self.assertEqual(
+            list(BlogContentSource.objects.values_list("path", "content_hash")), sources
+        )
+        self.assertEqual(BlogDetailPage.objects.count(), 1)
+
+    def test_edited_post(self):
+        """Test an edited post is published as a new revision of the same page"""
+        revision_count = self.get_revision_count()
+        self.post_path.write_text(POST_CONTENT.format(body="Edited body"), encoding="utf-8")
+
+        self.import_posts()
+
+        post = BlogDetailPage.objects.get(slug="unicorn-news")
+        self.assertEqual(post.pk, self.post.pk)
+        self.assertIn("Edited body", post.body)
+        self.assertEqual(self.get_revision_count(), revision_count + 1)
+
+    def test_replaced_image(self):
+        """Test a changed image file replaces the file of the existing image"""
+        source = BlogContentSource.objects.get(kind=BlogContentSource.KIND_IMAGE)
+        self.write_image("black")
+
+        self.import_posts()
+
+        replaced = BlogContentSource.objects.get(kind=BlogContentSource.KIND_IMAGE)
+        self.assertEqual(replaced.image_id, source.image_id)
+        self.assertNotEqual(replaced.content_hash, source.content_hash)
+        with replaced.image.open_file() as f, PILImage.open(f) as image:
+            self.assertEqual(image.convert("RGB").getpixel((0, 0)), (0, 0, 0))
+
+    def test_removed_post(self):
+        """Test the page of a removed markdown file is deleted along with its source"""
+        self.post_path.unlink()
+
+        self.import_posts()
+
+        self.assertFalse(BlogDetailPage.objects.filter(pk=self.post.pk).exists())
+        self.assertFalse(
+            BlogContentSource.objects.filter(kind=BlogContentSource.KIND_POST).exists()
+        )
@@ -0,0 +1,83 @@
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from wagtail.models import Site
+
+from apps.blogs.models.blog_detail_page import BlogDetailPage
+from apps.blogs.models.blog_index_page import BlogIndexPage
+from apps.blogs.utils.search import HIGHLIGHT_START, HIGHLIGHT_STOP, format_headline
+
+
+class BlogSearchViewTestCase(TestCase):
+    def setUp(self):
+        self.root_page = Site.objects.get(is_default_site=True).root_page
+
+        self.blog_index = BlogIndexPage(title="Blog Index", slug="blog")
+        self.root_page.add_child(instance=self.blog_index)
+
+        self.unicorn_post = BlogDetailPage(
+            title="Spotting Unicorns",
+            slug="spotting-unicorns",
+            date=timezone.now().date(),
+            intro="Where to look",
+            body="<p>Unicorns are often seen grazing near rainbows.</p>",
+        )
+        self.blog_index.add_child(instance=self.unicorn_post)
+
+        self.dragon_post = BlogDetailPage(
+            title="Dragon Facts",
+            slug="dragon-facts",
+            date=timezone.now().date(),
+            intro="Fire and scales",
+            body="<p>Dragons prefer caves.</p>",
+        )
+        self.blog_index.add_child(instance=self.dragon_post)
+
+    def test_search_finds_matching_posts(self):
+        """Test search returns only posts matching the query"""
+        response = self.client.get(reverse("blog_search"), {"q": "rainbows"})
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "blogs/blog_search.html")
+        self.assertContains(response, "Spotting Unicorns")
+        self.assertNotContains(response, "Dragon Facts")
+
+    def test_search_highlights_matches(self):
+        """Test matching terms are highlighted in the results"""
+        response = self.client.get(reverse("blog_search"), {"q": "rainbows"})
+        self.assertContains(response, "<mark>rainbows</mark>")
+
+    def test_search_excludes_unpublished_posts(self):
+        """Test draft posts are not returned"""
+        self.unicorn_post.unpublish()
+        response = self.client.get(reverse("blog_search"), {"q": "rainbows"})
+        self.assertNotContains(response, "Spotting Unicorns")
+
+    def test_search_htmx_returns_fragment(self):
+        """Test HTMX requests only receive the results fragment"""
+        response = self.client.get(
+            reverse("blog_search"), {"q": "dragons"}, HTTP_HX_REQUEST="true"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "blogs/fragments/search_results_fragment.html")
+        self.assertTemplateNotUsed(response, "blogs/blog_search.html")
+        self.assertContains(response, "Dragon Facts")
+
+    def test_search_empty_query(self):
+        """Test an empty query renders the search page without results"""
+        response = self.client.get(reverse("blog_search"))
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, "Spotting Unicorns")
+
+    def test_search_invalid_page(self):
+        """Test an out of range page number falls back to the last page"""
+        response = self.client.get(reverse("blog_search"), {"q": "dragons", "page": "99"})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Dragon Facts")
+
+
+class FormatHeadlineTestCase(TestCase):
+    def test_format_headline_escapes_content(self):
+        """Test markup in post content is stripped and escaped around highlights"""
+        headline = f"<p>Fish &amp; {HIGHLIGHT_START}chips{HIGHLIGHT_STOP} &lt;script&gt;</p>"
+        self.assertEqual(format_headline(headline), "Fish &amp; <mark>chips</mark> &lt;script&gt;")
@@ -0,0 +1,81 @@
+import tempfile
+from datetime import date
+from pathlib import Path
+
+from django.test import TestCase
+
+from PIL import Image as PILImage
+
+from apps.blogs.utils.markdown_import import compress_image, file_hash, parse_date, parse_post
+
+
+class ParsePostTestCase(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def write_post(self, filename, content):
+        file_path = Path(self.temp_dir.name, filename)
+        file_path.write_text(content, encoding="utf-8")
+        return file_path
+
+    def test_parse_post_with_frontmatter(self):
+        """Test frontmatter fields are extracted and markdown is converted to HTML"""
+        file_path = self.write_post(
+            "my-post.md",
+            '---\ntitle: "My Post"\nslug: "custom-slug"\ndate: "2025-09-01"\n'
+            'intro: "An intro"\nfeatured_image: "image.png"\n'
+            'featured_image_alt: "Alt text"\n---\n\nSome **bold** text',
+        )
+
+        post = parse_post(file_path)
+
+        self.assertEqual(post["title"], "My Post")
+        self.assertEqual(post["slug"], "custom-slug")
+        self.assertEqual(post["date"], date(2025, 9, 1))
+        self.assertEqual(post["intro"], "An intro")
+        self.assertIn("<strong>bold</strong>", post["body"])
+        self.assertEqual(post["featured_image_name"], "image.png")
+        self.assertEqual(post["featured_image_alt"], "Alt text")
+        self.assertEqual(post["featured_image_caption"], "")
+
+    def test_parse_post_defaults_from_filename(self):
+        """Test title and slug fall back to the filename without a featured image"""
+        file_path = self.write_post("unicorn-news.md", "Just content")
+
+        post = parse_post(file_path)
+
+        self.assertEqual(post["title"], "Unicorn News")
+        self.assertEqual(post["slug"], "unicorn-news")
+        self.assertEqual(post["featured_image_name"], "")
+
+    def test_parse_date_formats(self):
+        """Test dates with and without a time are parsed"""
+        self.assertEqual(parse_date("2025-01-02"), date(2025, 1, 2))
+        self.assertEqual(parse_date("2025-01-02 10:30:00"), date(2025, 1, 2))
+
+    def test_file_hash_changes_with_content(self):
+        """Test the content hash is stable for the same content and changes with it"""
+        file_path = self.write_post("hashed.md", "Original")
+        original_hash = file_hash(file_path)
+
+        self.assertEqual(file_hash(file_path), original_hash)
+
+        file_path.write_text("Changed", encoding="utf-8")
+        self.assertNotEqual(file_hash(file_path), original_hash)
+
+
+class CompressImageTestCase(TestCase):
+    def test_compress_image_resizes_wide_images(self):
+        """Test images wider than the maximum are resized to a temporary PNG"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            image_path = Path(temp_dir, "wide.png")
+            PILImage.new("RGBA", (3840, 100)).save(image_path)
+
+            compressed_path, elapsed = compress_image(image_path)
+            self.addCleanup(compressed_path.unlink)
+
+            with PILImage.open(compressed_path) as compressed:
+                self.assertEqual(compressed.size, (1920, 50))
+                self.assertEqual(compressed.mode, "RGB")
+            self.assertGreaterEqual(elapsed, 0)
@@ -0,0 +1,138 @@
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from wagtail.models import Site
+
+from apps.blogs.models import BlogDetailPage, BlogIndexPage, RelatedPost
+from apps.blogs.utils.related_posts import (
+    build_tfidf_matrix,
+    corpus,
+    defer_related_posts,
+    nearest_neighbours,
+    rebuild_related_posts,
+    tokenize,
+    update_related_posts,
+)
+
+
+class TfidfTestCase(TestCase):
+    def test_tokenize(self):
+        """Test text is lowercased and stop words and short words are dropped"""
+        self.assertEqual(tokenize("The Unicorns of the Forest"), ["unicorns", "forest"])
+
+    def test_build_tfidf_matrix_normalised(self):
+        """Test each document vector has unit length"""
+        matrix = build_tfidf_matrix([["unicorn", "unicorn", "horn"], ["dragon"], []])
+        norms = matrix.multiply(matrix).sum(axis=1)
+        self.assertAlmostEqual(float(norms[0]), 1.0)
+        self.assertAlmostEqual(float(norms[1]), 1.0)
+        self.assertAlmostEqual(float(norms[2]), 0.0)
+
+    def test_nearest_neighbours(self):
+        """Test neighbours are ordered by similarity and exclude unrelated documents"""
+        matrix = build_tfidf_matrix(
+            [
+                ["unicorn", "rainbow", "forest"],
+                ["unicorn", "rainbow"],
+                ["unicorn", "cave"],
+                ["dragon", "cave"],
+                ["volcano"],
+            ]
+        )
+        neighbours = nearest_neighbours(matrix, [0, 4], 3)
+        self.assertEqual([column for column, _ in neighbours[0]], [1, 2])
+        self.assertGreater(neighbours[0][0][1], neighbours[0][1][1])
+        self.assertEqual(neighbours[4], [])
+
+
+@override_settings(RELATED_POSTS_COUNT=2)
+class RelatedPostsTestCase(TestCase):
+    def setUp(self):
+        self.root_page = Site.objects.get(is_default_site=True).root_page
+
+        self.blog_index = BlogIndexPage(title="Blog Index", slug="blog")
+        self.root_page.add_child(instance=self.blog_index)
+
+        self.unicorns = self.create_post("Unicorn Sightings", "Unicorns grazing by rainbows")
+        self.rainbows = self.create_post("Rainbow Hunting", "Rainbows attract unicorns")
+        self.dragons = self.create_post("Dragon Caves", "Dragons sleep in caves")
+
+    def create_post(self, title, body):
+        post = BlogDetailPage(
+            title=title, date=timezone.now().date(), intro="", body=f"<p>{body}</p>"
+        )
+        self.blog_index.add_child(instance=post)
+        return post
+
+    def test_rebuild_related_posts(self):
+        """Test related posts are computed for every live post"""
+        self.assertEqual(rebuild_related_posts(), 3)
+        self.assertEqual(self.unicorns.get_related_posts(), [self.rainbows])
+        self.assertEqual(self.dragons.get_related_posts(), [])
+
+    def test_related_posts_single_query(self):
+        """Test related posts are read with a single query"""
+        rebuild_related_posts()
+        with self.assertNumQueries(1):
+            self.unicorns.get_related_posts()
+
+    def test_update_on_publish(self):
+        """Test publishing a post adds it to the related posts of similar posts"""
+        rebuild_related_posts()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            new_post = self.create_post("More Unicorns", "Unicorns and rainbows everywhere")
+            new_post.save_revision().publish()
+
+        self.assertIn(new_post, self.unicorns.get_related_posts())
+        self.assertTrue(RelatedPost.objects.filter(page=new_post).exists())
+
+    def test_update_on_unpublish(self):
+        """Test unpublished posts are removed from related posts"""
+        rebuild_related_posts()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.rainbows.unpublish()
+
+        self.assertNotIn(self.rainbows, self.unicorns.get_related_posts())
+        self.assertFalse(RelatedPost.objects.filter(page=self.rainbows).exists())
+
+    def test_update_related_posts_limits_work(self):
+        """Test an unrelated post doesn't cause related posts to be recomputed"""
+        rebuild_related_posts()
+
+        volcano = self.create_post("Volcanoes", "Lava flows")
+
+        # Only the new post itself is recomputed
+        self.assertEqual(update_related_posts(volcano.pk), [volcano.pk])
+
+    def test_update_on_delete(self):
+        """Test posts which linked to a deleted post are recomputed"""
+        rebuild_related_posts()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.rainbows.delete()
+
+        self.assertEqual(self.unicorns.get_related_posts(), [])
+
+    def test_deferred_updates(self):
+        """Test publishing doesn't update related posts while updates are deferred"""
+        with self.captureOnCommitCallbacks(execute=True), defer_related_posts():
+            self.unicorns.save_revision().publish()
+
+        self.assertFalse(RelatedPost.objects.exists())
+
+    def test_corpus_only_tokenizes_changed_posts(self):
+        """Test only posts published since the corpus was cached are tokenized again"""
+        corpus.get_documents()
+
+        self.unicorns.body = "<p>Unicorns in the snow</p>"
+        self.unicorns.save_revision().publish()
+
+        with patch("apps.blogs.utils.related_posts.tokenize", wraps=tokenize) as tokenize_mock:
+            page_ids, documents = corpus.get_documents()
+
+        tokenize_mock.assert_called_once()
+        self.assertIn("snow", documents[page_ids.index(self.unicorns.pk)])
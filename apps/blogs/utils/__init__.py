@@ -0,0 +1,6 @@
+from .markdown_import import (
+    compress_image as compress_image,
+    file_hash as file_hash,
+    parse_date as parse_date,
+    parse_post as parse_post,
+)
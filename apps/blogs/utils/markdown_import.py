@@ -0,0 +1,97 @@
+import hashlib
+import os
+import tempfile
+import time
+from datetime import UTC, date, datetime
+from pathlib import Path
+
+import frontmatter
+import markdown
+from PIL import Image as PILImage
+
+# These helpers run inside worker processes, so they must stay picklable module-level functions
+# and must not touch the database or import Django models.
+
+MAX_IMAGE_WIDTH = 1920
+
+
+def parse_post(file_path: Path) -> dict:
+    """Parse a markdown file into the fields needed to build a blog post"""
+    started = time.perf_counter()
+
+    with file_path.open(encoding="utf-8") as f:
+        post = frontmatter.load(f)
+
+    stem = file_path.stem
+    featured_image_name = post.metadata.get("featured_image")
+
+    # Convert markdown to HTML
+    md = markdown.Markdown(extensions=["extra", "codehilite"])
+    body_html = md.convert(post.content)
+
+    return {
+        "title": post.metadata.get("title", stem.replace("-", " ").title()),
+        "slug": post.metadata.get("slug", stem),
+        "date": parse_date(post.metadata.get("date")),
+        "intro": post.metadata.get("intro", ""),
+        "body": body_html,
+        "featured_image_name": str(featured_image_name) if featured_image_name else "",
+        "featured_image_alt": str(post.metadata.get("featured_image_alt", "")),
+        "featured_image_caption": str(post.metadata.get("featured_image_caption", "")),
+        "elapsed": time.perf_counter() - started,
+    }
+
+
+def file_hash(file_path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's contents"""
+    digest = hashlib.sha256()
+    with file_path.open("rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def parse_date(date_str: str | None) -> date:
+    """Parse date from various formats"""
+    if date_str:
+        try:
+            return datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=UTC).date()
+        except ValueError:
+            try:
+                return datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S").replace(tzinfo=UTC).date()
+            except ValueError:
+                return datetime.now(UTC).date()
+    else:
+        return datetime.now(UTC).date()
+
+
+def compress_image(image_path: Path) -> tuple[Path, float]:
+    """
+    Compress an image using Pillow.
+
+    Returns the path of a temporary PNG file, which the caller is responsible for removing, and
+    the time spent compressing it.
+    """
+    started = time.perf_counter()
+
+    with PILImage.open(image_path) as original_img:
+        # Convert to RGB if necessary (for JPEG)
+        processed_img = original_img
+        if original_img.mode in ("RGBA", "LA", "P"):
+            processed_img = original_img.convert("RGB")
+
+        # Calculate new dimensions (max 1920px width, maintain aspect ratio)
+        if processed_img.width > MAX_IMAGE_WIDTH:
+            ratio = MAX_IMAGE_WIDTH / processed_img.width
+            new_height = int(processed_img.height * ratio)
+            processed_img = processed_img.resize(
+                (MAX_IMAGE_WIDTH, new_height), PILImage.Resampling.LANCZOS
+            )
+
+        temp_fd, temp_path = tempfile.mkstemp(suffix=".png")
+        os.close(temp_fd)
+
+        # Save with compression
+        processed_img.save(temp_path, "PNG", quality=85, optimize=True)
+
+    return Path(temp_path), time.perf_counter() - started
@@ -0,0 +1,254 @@
+import re
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Min
+from django.utils.html import strip_tags
+
+import numpy as np
+from scipy import sparse
+from wagtail.models import Page
+
+from apps.blogs.models import BlogDetailPage, RelatedPost
+
+TOKEN_RE = re.compile(r"[a-z][a-z0-9]{2,}")
+STOP_WORDS = frozenset(
+    (  # noqa:SIM905
+        "about after all also and any are because been but can could did does for from had has "
+        "have her his how into its just more most not now one only other our out over she some "
+        "such than that the their them then there these they this those through was were what "
+        "when where which while who why will with would you your"
+    ).split()
+)
+
+# Rows of the similarity matrix computed at once, bounding memory to CHUNK_SIZE x posts
+CHUNK_SIZE = 500
+
+_deferred = ContextVar("related_posts_deferred", default=False)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase terms, ignoring stop words"""
+    return [token for token in TOKEN_RE.findall(text.lower()) if token not in STOP_WORDS]
+
+
+def build_tfidf_matrix(documents: list[list[str]]) -> sparse.csr_matrix:
+    """
+    Build L2 normalised TF-IDF vectors for tokenized documents, one row per document.
+
+    Term frequencies are sublinear (1 + log tf) and inverse document frequencies are smoothed,
+    matching the usual scikit-learn defaults.
+    """
+    vocabulary: dict[str, int] = {}
+    indices = []
+    indptr = [0]
+    for tokens in documents:
+        indices.extend(vocabulary.setdefault(token, len(vocabulary)) for token in tokens)
+        indptr.append(len(indices))
+
+    counts = sparse.csr_matrix(
+        (np.ones(len(indices), dtype=np.float64), indices, indptr),
+        shape=(len(documents), len(vocabulary)),
+    )
+    counts.sum_duplicates()
+
+    counts.data = 1 + np.log(counts.data)
+    document_frequency = np.bincount(counts.indices, minlength=len(vocabulary))
+    idf = np.log((1 + len(documents)) / (1 + document_frequency)) + 1
+    tfidf = counts @ sparse.diags(idf)
+
+    norms = np.sqrt(np.asarray(tfidf.multiply(tfidf).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return (sparse.diags(1 / norms) @ tfidf).tocsr()
+
+
+def nearest_neighbours(
+    matrix: sparse.csr_matrix, rows: list[int], k: int
+) -> dict[int, list[tuple[int, float]]]:
+    """Return the top k most similar other rows, with their cosine similarity, for each row"""
+    neighbours = {}
+    for start in range(0, len(rows), CHUNK_SIZE):
+        chunk = rows[start : start + CHUNK_SIZE]
+        # Rows are normalised, so the dot product is the cosine similarity
+        similarities = (matrix[chunk] @ matrix.T).toarray()
+        similarities[np.arange(len(chunk)), chunk] = 0
+
+        count = min(k, matrix.shape[0] - 1)
+        for row, row_similarities in zip(chunk, similarities, strict=True):
+            if count <= 0:
+                neighbours[row] = []
+                continue
+            top = np.argpartition(-row_similarities, count - 1)[:count]
+            top = top[np.argsort(-row_similarities[top], kind="stable")]
+            neighbours[row] = [
+                (int(column), float(row_similarities[column]))
+                for column in top
+                if row_similarities[column] > 0
+            ]
+    return neighbours
+
+
+class Corpus:
+    """
+    Per process cache of the tokenized text of every live blog post.
+
+    Posts are only loaded and tokenized again once they've been published since they were
+    cached, so updating related posts after a publish reads the text of the changed post rather
+    than of every post.
+    """
+
+    def __init__(self):
+        # Last published time and tokens of each post, by id
+        self.documents: dict[int, tuple] = {}
+        self.lock = threading.Lock()
+
+    def get_documents(self) -> tuple[list[int], list[list[str]]]:
+        """Return the ids of live blog posts and their tokens, in the same order"""
+        published = dict(
+            BlogDetailPage.objects.live().order_by("pk").values_list("pk", "last_published_at")
+        )
+        with self.lock:
+            documents = self.documents
+        stale = [
+            pk
+            for pk, published_at in published.items()
+            if pk not in documents or documents[pk][0] != published_at
+        ]
+
+        loaded = {
+            pk: (published[pk], tokenize(f"{title} {intro} {strip_tags(body)}"))
+            for pk, title, intro, body in BlogDetailPage.objects.filter(pk__in=stale).values_list(
+                "pk", "title", "intro", "body"
+            )
+        }
+        # Posts deleted since they were listed are left out
+        documents = {
+            pk: document
+            for pk in published
+            if (document := loaded.get(pk) or documents.get(pk)) is not None
+        }
+        with self.lock:
+            self.documents = documents
+
+        page_ids = list(documents)
+        return page_ids, [tokens for _, tokens in documents.values()]
+
+
+corpus = Corpus()
+
+
+def _load_corpus() -> tuple[list[int], sparse.csr_matrix]:
+    """Return the ids of live blog posts and their TF-IDF matrix, in the same order"""
+    page_ids, documents = corpus.get_documents()
+    return page_ids, build_tfidf_matrix(documents)
+
+
+def _lock_pages(page_ids: Iterable[int]) -> None:
+    """
+    Lock pages until the current transaction ends, in a consistent order to avoid deadlocks.
+
+    Concurrent updates replace the related posts of overlapping pages, so each waits for the
+    other to commit rather than inserting ranks the other has just inserted.
+    """
+    list(
+        Page.objects.select_for_update()
+        .filter(pk__in=set(page_ids))
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+
+
+def _save_neighbours(page_ids: list[int], neighbours: dict[int, list[tuple[int, float]]]) -> None:
+    """Replace the related posts of the given rows"""
+    RelatedPost.objects.filter(page_id__in=[page_ids[row] for row in neighbours]).delete()
+    RelatedPost.objects.bulk_create(
+        RelatedPost(
+            page_id=page_ids[row],
+            related_page_id=page_ids[column],
+            rank=rank,
+            score=score,
+        )
+        for row, row_neighbours in neighbours.items()
+        for rank, (column, score) in enumerate(row_neighbours)
+    )
+
+
+def rebuild_related_posts() -> int:
+    """Recompute related posts for every live blog post, returning the number of posts"""
+    page_ids, matrix = _load_corpus()
+    neighbours = nearest_neighbours(
+        matrix, list(range(len(page_ids))), settings.RELATED_POSTS_COUNT
+    )
+
+    with transaction.atomic():
+        _lock_pages(page_ids)
+        RelatedPost.objects.all().delete()
+        _save_neighbours(page_ids, neighbours)
+
+    return len(page_ids)
+
+
+def update_related_posts(page_id: int, linked_page_ids: Iterable[int] = ()) -> list[int]:
+    """
+    Update related posts after a blog post has been published, unpublished or deleted.
+
+    Only the post itself and the posts whose related posts it could enter or leave are
+    recomputed, returning their ids. Posts which linked to a deleted post must be passed in,
+    as their links are deleted along with it. Document frequencies shift slightly as posts are
+    added, so scores of untouched posts can drift until the next full rebuild.
+    """
+    page_ids, matrix = _load_corpus()
+    positions = {pk: row for row, pk in enumerate(page_ids)}
+    k = settings.RELATED_POSTS_COUNT
+
+    affected = set(linked_page_ids)
+    affected.update(
+        RelatedPost.objects.filter(related_page_id=page_id).values_list("page_id", flat=True)
+    )
+
+    if page_id in positions:
+        affected.add(page_id)
+        current = {
+            row["page_id"]: row
+            for row in RelatedPost.objects.values("page_id").annotate(
+                min_score=Min("score"), links=Count("pk")
+            )
+        }
+
+        # Similar posts which have room for another link, or whose weakest link is weaker
+        similarities = (matrix @ matrix[positions[page_id]].T).toarray().ravel()
+        for row in np.flatnonzero(similarities > 0):
+            links = current.get(page_ids[row])
+            if links is None or links["links"] < k or similarities[row] > links["min_score"]:
+                affected.add(page_ids[row])
+
+    rows = [positions[pk] for pk in affected if pk in positions]
+    with transaction.atomic():
+        _lock_pages([page_id, *affected])
+        RelatedPost.objects.filter(page_id=page_id).delete()
+        _save_neighbours(page_ids, nearest_neighbours(matrix, rows, k))
+
+    return [page_ids[row] for row in rows]
+
+
+def related_posts_deferred() -> bool:
+    """Return whether related post updates are currently deferred"""
+    return _deferred.get()
+
+
+@contextmanager
+def defer_related_posts() -> Iterator[None]:
+    """
+    Skip incremental related post updates, such as while importing many posts at once.
+
+    The caller should rebuild related posts afterwards.
+    """
+    token = _deferred.set(True)
+    try:
+        yield
+    finally:
+        _deferred.reset(token)
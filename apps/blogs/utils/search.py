@@ -0,0 +1,64 @@
+import html
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchHeadline, SearchQuery
+from django.core.paginator import Page, Paginator
+from django.db.models import Value
+from django.db.models.functions import Concat
+from django.utils.html import escape, strip_tags
+from django.utils.safestring import SafeString, mark_safe
+
+from apps.blogs.models import BlogDetailPage
+
+# Private use characters, so the markers can't clash with post content and survive escaping
+HIGHLIGHT_START = "\ue000"
+HIGHLIGHT_STOP = "\ue001"
+
+
+def search_blog_posts(query: str):
+    """Search live blog posts, ordered by relevance"""
+    return BlogDetailPage.objects.live().search(query)
+
+
+def get_search_page(query: str, page_number: str | None) -> Page:
+    """Return a page of live blog posts matching a query, with its posts already fetched"""
+    search_results = search_blog_posts(query) if query else []
+    results_page = Paginator(search_results, settings.BLOG_SEARCH_PAGE_SIZE).get_page(page_number)
+    results_page.object_list = list(results_page.object_list)
+    return results_page
+
+
+async def aget_search_highlights(pages, query: str) -> dict[int, SafeString]:
+    """
+    Return highlighted excerpts of the intro and body of each page, keyed by page id.
+
+    Only the given pages are highlighted, so this should be called with a single page of results.
+    """
+    search_config = settings.WAGTAILSEARCH_BACKENDS["default"]["SEARCH_CONFIG"]
+    headlines = (
+        BlogDetailPage.objects.filter(pk__in=[page.pk for page in pages])
+        .annotate(
+            headline=SearchHeadline(
+                Concat("intro", Value(" "), "body"),
+                SearchQuery(query, search_type="websearch", config=search_config),
+                config=search_config,
+                start_sel=HIGHLIGHT_START,
+                stop_sel=HIGHLIGHT_STOP,
+                max_words=35,
+                min_words=15,
+                max_fragments=2,
+                fragment_delimiter=" … ",
+            )
+        )
+        .values_list("pk", "headline")
+    )
+    return {pk: format_headline(headline) async for pk, headline in headlines}
+
+
+def format_headline(headline: str) -> SafeString:
+    """Convert a headline from ts_headline into escaped text with <mark> highlights"""
+    text = escape(html.unescape(strip_tags(headline)))
+    # Everything but the highlight markers has been escaped
+    return mark_safe(  # noqa:S308
+        text.replace(HIGHLIGHT_START, "<mark>").replace(HIGHLIGHT_STOP, "</mark>")
+    )
@@ -0,0 +1,31 @@
+from django.shortcuts import render
+from django.views.decorators.vary import vary_on_headers
+
+from asgiref.sync import sync_to_async
+
+from apps.blogs.utils.search import aget_search_highlights, get_search_page
+
+
+@vary_on_headers("HX-Request", "HX-History-Restore-Request")
+async def search_view(request):
+    query = request.GET.get("q", "").strip()
+
+    # Wagtail's search backend is sync only, so searching runs in a thread
+    results_page = await sync_to_async(get_search_page)(query, request.GET.get("page"))
+
+    highlights = await aget_search_highlights(results_page.object_list, query) if query else {}
+    results = [(page, highlights.get(page.pk)) for page in results_page.object_list]
+
+    context = {
+        "search_query": query,
+        "results_page": results_page,
+        "results": results,
+    }
+
+    # History restores need the whole page, not just the results, and context processors may
+    # query the database, so templates render in a thread
+    if request.headers.get("HX-Request") and not request.headers.get("HX-History-Restore-Request"):
+        template = "blogs/fragments/search_results_fragment.html"
+    else:
+        template = "blogs/blog_search.html"
+    return await sync_to_async(render)(request, template, context)
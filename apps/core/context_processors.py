@@ -4,7 +4,7 @@ import time
 
 from django.conf import settings
 
-from wagtail.models import Site
+from apps.core.utils.sites import get_site_for_request
 
 BROWSERSYNC_URL = "http://{host}:{port}/browser-sync/browser-sync-client.js?t={time}"
 
@@ -65,9 +65,15 @@ def demo(request):
     return {"DEMO_SITE": settings.DEMO_SITE}
 
 
+def donation_ticker(request):
+    """
+    Add whether the live donation ticker is enabled to the global template context.
+    """
+    return {"DONATION_TICKER_ENABLED": settings.DONATION_TICKER_ENABLED}
+
+
 def site_context(request):
-    try:
-        site = Site.find_for_request(request)
-        return {"current_site": site}
-    except:
-        return {"current_site": None}
+    """
+    Add the Wagtail site serving the request to the global template context.
+    """
+    return {"current_site": get_site_for_request(request)}
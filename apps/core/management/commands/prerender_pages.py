@@ -0,0 +1,20 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.core.utils import WagtailSetupUtils
+from apps.core.utils.prerender import prerender_all_pages
+
+
+class Command(BaseCommand):
+    help = "Render every live page which can be pre-rendered to static HTML"
+
+    def handle(self, *args, **options):
+        utils = WagtailSetupUtils(self)
+        started = time.perf_counter()
+
+        page_count = prerender_all_pages()
+
+        utils.styled_output(
+            f"Pre-rendered {page_count} pages in {time.perf_counter() - started:.2f}s"
+        )
@@ -20,6 +20,11 @@ class Command(BaseCommand):
             default="apps/core/content/home.yaml",
             help="The file containing the home index content",
         )
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Keep the existing homepage and site if a homepage has already been set up",
+        )
 
     def handle(self, *args, **options):
         content_file = Path(options["content_file"])
@@ -27,6 +32,10 @@ class Command(BaseCommand):
 
         utils.styled_output("Setting up homepage...")
 
+        if options["incremental"] and HomePage.objects.live().exists():
+            utils.styled_output("Homepage already exists, skipping")
+            return
+
         # Clean up existing content
         utils.styled_output("Cleaning up existing content...")
         Site.objects.all().delete()
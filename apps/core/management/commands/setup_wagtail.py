@@ -16,11 +16,17 @@ class Command(BaseCommand):
             action="store_true",
             help="Show detailed output from each command",
         )
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Keep existing pages and only import content which has changed",
+        )
 
     def handle(self, *args, **options):
         commands = ["setup_home", "setup_blogs", "setup_sightings"]
         skip_on_error = options.get("skip_on_error", False)
         verbose = options.get("verbose", False)
+        incremental = options.get("incremental", False)
 
         self.stdout.write(self.style.SUCCESS("Starting setup process..."))
 
@@ -30,7 +36,7 @@ class Command(BaseCommand):
                     self.style.WARNING(f"[{i}/{len(commands)}] Running {command_name}...")
                 )
 
-                call_command(command_name, verbosity=2 if verbose else 1)
+                call_command(command_name, verbosity=2 if verbose else 1, incremental=incremental)
 
                 self.stdout.write(self.style.SUCCESS(f"{command_name} completed successfully"))
 
@@ -0,0 +1,427 @@
+import asyncio
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import (
+    HttpResponse,
+    HttpResponseNotFound,
+    HttpResponsePermanentRedirect,
+    HttpResponseRedirect,
+)
+from django.urls import Resolver404, resolve
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from wagtail.contrib.redirects.models import Redirect
+
+from apps.core.templatetags.webpack_tags import webpack_static
+from apps.core.utils.not_found_cache import NotFoundCache, get_not_found_key
+from apps.core.utils.page_cache import (
+    aget_page_cache_generation,
+    get_page_cache_generation,
+    get_page_cache_key,
+    is_anonymous_request,
+    is_response_cacheable,
+    patch_public_cache_control,
+)
+from apps.core.utils.prerender import get_request_prerender_file
+from apps.core.utils.redirects import redirect_index
+from apps.core.utils.sites import get_site_for_request
+
+
+class SyncAndAsyncMiddleware:
+    """
+    Base for middleware which runs natively under both WSGI and ASGI.
+
+    Django calls __acall__ when the rest of the chain is async, so under ASGI requests aren't
+    handed to a thread for each middleware, only for the cache and database calls which need one.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.handle(request)
+
+    def handle(self, request):
+        """Return the response to a request under WSGI"""
+        raise NotImplementedError
+
+    async def __acall__(self, request):
+        """Return the response to a request under ASGI"""
+        raise NotImplementedError
+
+
+class CurrentSiteMiddleware(SyncAndAsyncMiddleware):
+    """
+    Set request.site to the Wagtail site serving the request, see apps.core.utils.sites.
+
+    Replaces the Django middleware, which looked up a separate django.contrib.sites Site.
+    """
+
+    def handle(self, request):
+        request.site = get_site_for_request(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        request.site = await sync_to_async(get_site_for_request)(request)
+        return await self.get_response(request)
+
+
+class PreloadLinkMiddleware(SyncAndAsyncMiddleware):
+    """
+    Add a Link header preloading the webpack bundles every page uses, see WEBPACK_PRELOAD_ASSETS.
+
+    Browsers can fetch the bundles before parsing the page, and proxies which support it can send
+    them as 103 Early Hints.
+    """
+
+    def handle(self, request):
+        response = self.get_response(request)
+        self.add_link_header(request, response)
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        self.add_link_header(request, response)
+        return response
+
+    @staticmethod
+    def add_link_header(request, response) -> None:
+        """Add the Link header to full page responses which don't have one"""
+        if (
+            response.status_code == 200
+            and response.get("Content-Type", "").startswith("text/html")
+            and not request.headers.get("HX-Request")
+            and "Link" not in response
+        ):
+            response.headers["Link"] = ", ".join(
+                f"<{webpack_static(asset_name)}>; rel=preload; as={destination}"
+                for asset_name, destination in settings.WEBPACK_PRELOAD_ASSETS.items()
+            )
+
+
+class PrerenderedPageMiddleware(SyncAndAsyncMiddleware):
+    """
+    Serve pre-rendered HTML files of pages to anonymous visitors, skipping Wagtail entirely.
+
+    Requests with a query string, with a session cookie or made while rendering pages are passed
+    through, as are requests for pages without a file.
+    """
+
+    def handle(self, request):
+        prerender_file = self.get_prerender_file(request)
+        if prerender_file is not None:
+            try:
+                content = prerender_file.read_bytes()
+            except OSError:
+                pass
+            else:
+                return self.prerendered_response(content)
+
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        prerender_file = self.get_prerender_file(request)
+        if prerender_file is not None:
+            try:
+                content = await sync_to_async(prerender_file.read_bytes, thread_sensitive=False)()
+            except OSError:
+                pass
+            else:
+                return self.prerendered_response(content)
+
+        return await self.get_response(request)
+
+    @staticmethod
+    def get_prerender_file(request):
+        """Return the file which may hold the response to a request, if it can be served one"""
+        if (
+            settings.PRERENDER_ENABLED
+            and request.method == "GET"
+            and not request.GET
+            and not getattr(request, "is_dummy", False)
+            and is_anonymous_request(request)
+        ):
+            return get_request_prerender_file(request)
+        return None
+
+    @staticmethod
+    def prerendered_response(content: bytes) -> HttpResponse:
+        """Return a pre-rendered page, which shared caches can store"""
+        response = HttpResponse(content)
+        response.headers["X-Prerendered"] = "1"
+        patch_public_cache_control(response)
+        return response
+
+
+class PageCacheMiddleware(SyncAndAsyncMiddleware):
+    """
+    Cache responses from pages for anonymous visitors, see apps.core.utils.page_cache.
+
+    Entries are fresh until PAGE_CACHE_TIMEOUT passes or the cache generation changes. Only one
+    request at a time re-renders a page, while others are served the stale entry for up to
+    PAGE_CACHE_STALE_TIMEOUT longer, or wait up to PAGE_CACHE_LOCK_WAIT for a page which isn't
+    cached at all. Requests for anything other than a Wagtail page are passed straight through,
+    as their responses are never cached.
+    """
+
+    poll_interval = 0.05
+
+    def handle(self, request):
+        if not self.is_cacheable_request(request):
+            return self.get_response(request)
+
+        cache_key = get_page_cache_key(request)
+        generation = get_page_cache_generation()
+        entry = cache.get(cache_key)
+
+        if self.is_fresh(entry, generation):
+            return self.response_from_entry(request, entry, "HIT")
+
+        lock_key = f"{cache_key}:lock"
+        if cache.add(lock_key, 1, settings.PAGE_CACHE_LOCK_TIMEOUT):
+            try:
+                response = self.get_response(request)
+                if cache_entry := self.get_entry(request, response, generation):
+                    cache.set(cache_key, cache_entry, self.get_entry_timeout())
+            finally:
+                cache.delete(lock_key)
+            response.headers["X-Page-Cache"] = "MISS"
+            return response
+
+        # Another request is already rendering this page
+        if self.is_stale_servable(entry):
+            return self.response_from_entry(request, entry, "STALE")
+
+        deadline = time.monotonic() + settings.PAGE_CACHE_LOCK_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+            entry = cache.get(cache_key)
+            if self.is_fresh(entry, generation):
+                return self.response_from_entry(request, entry, "HIT")
+
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        if not self.is_cacheable_request(request):
+            return await self.get_response(request)
+
+        cache_key = get_page_cache_key(request)
+        generation = await aget_page_cache_generation()
+        entry = await cache.aget(cache_key)
+
+        if self.is_fresh(entry, generation):
+            return self.response_from_entry(request, entry, "HIT")
+
+        lock_key = f"{cache_key}:lock"
+        if await cache.aadd(lock_key, 1, settings.PAGE_CACHE_LOCK_TIMEOUT):
+            try:
+                response = await self.get_response(request)
+                if cache_entry := self.get_entry(request, response, generation):
+                    await cache.aset(cache_key, cache_entry, self.get_entry_timeout())
+            finally:
+                await cache.adelete(lock_key)
+            response.headers["X-Page-Cache"] = "MISS"
+            return response
+
+        # Another request is already rendering this page
+        if self.is_stale_servable(entry):
+            return self.response_from_entry(request, entry, "STALE")
+
+        deadline = time.monotonic() + settings.PAGE_CACHE_LOCK_WAIT
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            entry = await cache.aget(cache_key)
+            if self.is_fresh(entry, generation):
+                return self.response_from_entry(request, entry, "HIT")
+
+        return await self.get_response(request)
+
+    def is_cacheable_request(self, request) -> bool:
+        """Return whether a request is an anonymous GET for a page, so may be cached"""
+        return (
+            settings.PAGE_CACHE_ENABLED
+            and request.method == "GET"
+            and not getattr(request, "is_dummy", False)
+            and is_anonymous_request(request)
+            and self.is_page_request(request)
+        )
+
+    @staticmethod
+    def is_page_request(request) -> bool:
+        """Return whether a request's path is served by Wagtail, so its response may be cached"""
+        try:
+            resolver_match = resolve(request.path_info, getattr(request, "urlconf", None))
+        except Resolver404:
+            return False
+        return resolver_match.url_name == "wagtail_serve"
+
+    @staticmethod
+    def is_fresh(entry: dict | None, generation: str) -> bool:
+        """Return whether a cache entry is from the current generation and hasn't expired"""
+        return (
+            entry is not None
+            and entry["generation"] == generation
+            and time.time() < entry["expires"]
+        )
+
+    @staticmethod
+    def is_stale_servable(entry: dict | None) -> bool:
+        """Return whether a cache entry can still be served while its page is re-rendered"""
+        return (
+            entry is not None
+            and time.time() < entry["expires"] + settings.PAGE_CACHE_STALE_TIMEOUT
+        )
+
+    @staticmethod
+    def get_entry(request, response, generation: str) -> dict | None:
+        """
+        Return the cache entry for a response, if it's the same for everyone.
+
+        Shared caches are allowed to store the response too.
+        """
+        if not is_response_cacheable(request, response):
+            return None
+
+        patch_public_cache_control(response)
+        return {
+            "generation": generation,
+            "expires": time.time() + settings.PAGE_CACHE_TIMEOUT,
+            "content": response.content,
+            "headers": list(response.headers.items()),
+        }
+
+    @staticmethod
+    def get_entry_timeout() -> int:
+        """Return how long the cache keeps entries, including while they're served stale"""
+        return settings.PAGE_CACHE_TIMEOUT + settings.PAGE_CACHE_STALE_TIMEOUT
+
+    @staticmethod
+    def response_from_entry(request, entry: dict, status: str) -> HttpResponse:
+        """Build a response from a cache entry, replying 304 to matching conditional requests"""
+        response = HttpResponse(entry["content"])
+        for header, value in entry["headers"]:
+            response.headers[header] = value
+        response.headers["X-Page-Cache"] = status
+
+        return get_conditional_response(
+            request,
+            etag=response.get("ETag"),
+            last_modified=parse_http_date_safe(response.get("Last-Modified")),
+            response=response,
+        )
+
+
+class NotFoundCacheMiddleware(SyncAndAsyncMiddleware):
+    """
+    Answer requests for recently missed paths with the 404 already rendered for them.
+
+    Wagtail routing, redirect lookups and rendering the 404 page are all skipped, so repeated
+    requests for missing URLs from crawlers don't reach the database. See
+    apps.core.utils.not_found_cache.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.not_found = NotFoundCache(
+            settings.NOT_FOUND_CACHE_SIZE, settings.NOT_FOUND_CACHE_TIMEOUT
+        )
+
+    def handle(self, request):
+        if not self.is_cacheable_request(request):
+            return self.get_response(request)
+
+        key = get_not_found_key(request)
+        entry = self.not_found.get(key)
+        if entry is not None:
+            return self.response_from_entry(entry)
+
+        response = self.get_response(request)
+        if self.is_cacheable_response(request, response):
+            self.not_found.add(key, response)
+        return response
+
+    async def __acall__(self, request):
+        if not self.is_cacheable_request(request):
+            return await self.get_response(request)
+
+        key = get_not_found_key(request)
+        entry = await sync_to_async(self.not_found.get)(key)
+        if entry is not None:
+            return self.response_from_entry(entry)
+
+        response = await self.get_response(request)
+        if self.is_cacheable_response(request, response):
+            await sync_to_async(self.not_found.add)(key, response)
+        return response
+
+    @staticmethod
+    def is_cacheable_request(request) -> bool:
+        """Return whether the response to a request may be answered from the cache"""
+        return settings.NOT_FOUND_CACHE_ENABLED and request.method in ("GET", "HEAD")
+
+    def is_cacheable_response(self, request, response) -> bool:
+        """Return whether a response is a 404 for a missing page, the same for everyone"""
+        return (
+            response.status_code == 404
+            and not response.streaming
+            and not response.cookies
+            and self.is_page_path(request)
+        )
+
+    @staticmethod
+    def is_page_path(request) -> bool:
+        """Return whether a request was for a page, or didn't match any URL at all"""
+        resolver_match = getattr(request, "resolver_match", None)
+        return resolver_match is None or resolver_match.url_name == "wagtail_serve"
+
+    @staticmethod
+    def response_from_entry(entry: dict) -> HttpResponseNotFound:
+        """Build a 404 response from the entry for a missing path"""
+        response = HttpResponseNotFound(entry["content"], content_type=entry["content_type"])
+        response.headers["X-Not-Found-Cache"] = "HIT"
+        return response
+
+
+class RedirectMiddleware(SyncAndAsyncMiddleware):
+    """
+    Redirect 404 responses using the in-process redirect index, see apps.core.utils.redirects.
+
+    Replaces Wagtail's middleware, which queried the database for every 404.
+    """
+
+    def handle(self, request):
+        response = self.get_response(request)
+        if response.status_code != 404:
+            return response
+        return self.get_redirect(request) or response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        if response.status_code != 404:
+            return response
+        return await sync_to_async(self.get_redirect)(request) or response
+
+    @staticmethod
+    def get_redirect(request) -> HttpResponseRedirect | None:
+        """Return a redirect for a request's path, if there is one"""
+        site = get_site_for_request(request)
+        path = Redirect.normalise_path(request.get_full_path())
+        redirect = redirect_index.find(site.pk if site else None, path)
+        if redirect is None:
+            return None
+
+        link, is_permanent = redirect
+        if is_permanent:
+            return HttpResponsePermanentRedirect(link)
+        return HttpResponseRedirect(link)
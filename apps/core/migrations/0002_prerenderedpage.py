@@ -0,0 +1,35 @@
+# Generated by Django 5.2.6 on 2026-10-19 18:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0001_initial"),
+        ("wagtailcore", "0095_groupsitepermission"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PrerenderedPage",
+            fields=[
+                (
+                    "page",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="+",
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                (
+                    "path",
+                    models.CharField(help_text="File path within PRERENDER_ROOT", max_length=512),
+                ),
+                ("rendered_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,20 @@
+class PrerenderedPageMixin:
+    """
+    Page which renders identically for every anonymous visitor between publishes.
+
+    Live pages of these types are rendered to static HTML files when they, or a page they depend
+    on, are published. See apps.core.utils.prerender.
+    """
+
+    def get_prerender_dependents(self) -> list:
+        """Return other pages which display content from this page"""
+        return []
+
+
+class CachedPageMixin:
+    """
+    Page whose responses to anonymous visitors can be stored in the full page cache.
+
+    Cached responses are invalidated whenever the page tree or content shown on pages changes.
+    See apps.core.utils.page_cache.
+    """
@@ -1,2 +1,3 @@
 from .custom_image_model import CustomImage as CustomImage
 from .home_page_model import HomePage as HomePage
+from .prerendered_page_model import PrerenderedPage as PrerenderedPage
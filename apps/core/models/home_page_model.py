@@ -3,9 +3,10 @@ from wagtail.fields import RichTextField
 from wagtail.models import Page
 
 from apps.blogs.models import BlogIndexPage
+from apps.core.mixins import CachedPageMixin, PrerenderedPageMixin
 
 
-class HomePage(Page):
+class HomePage(CachedPageMixin, PrerenderedPageMixin, Page):
     about_text = RichTextField()
     content_panels = [
         *Page.content_panels,
@@ -0,0 +1,19 @@
+from django.db import models
+
+
+class PrerenderedPage(models.Model):
+    """
+    Static HTML file rendered for a live page.
+
+    Keeps track of where the file was written, so it can be removed when the page is unpublished,
+    deleted or its URL changes.
+    """
+
+    page = models.OneToOneField(
+        "wagtailcore.Page", on_delete=models.CASCADE, related_name="+", primary_key=True
+    )
+    path = models.CharField(max_length=512, help_text="File path within PRERENDER_ROOT")
+    rendered_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return self.path
@@ -0,0 +1,86 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from wagtail.contrib.redirects.models import Redirect
+from wagtail.models import Page, Site
+from wagtail.signals import page_published, page_unpublished, post_page_move
+
+from apps.core.mixins import PrerenderedPageMixin
+from apps.core.models import CustomImage
+from apps.core.utils.not_found_cache import invalidate_not_found_cache
+from apps.core.utils.page_cache import invalidate_page_cache
+from apps.core.utils.page_routes import invalidate_route_cache
+from apps.core.utils.prerender import (
+    remove_prerendered_page,
+    schedule_prerender,
+    schedule_prerender_pages,
+)
+from apps.core.utils.redirects import invalidate_redirect_index
+from apps.core.utils.richtext_cache import invalidate_richtext_cache
+from apps.core.utils.sites import invalidate_site_cache
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+@receiver(post_page_move)
+def invalidate_page_caches(sender, **kwargs):
+    """Invalidate caches of rendered page content when the page tree changes"""
+    invalidate_richtext_cache()
+    invalidate_page_cache()
+    invalidate_route_cache()
+    invalidate_not_found_cache()
+    # Redirects to pages link to their URLs
+    invalidate_redirect_index()
+
+
+@receiver(post_delete, sender=Page)
+@receiver(post_save, sender=CustomImage)
+@receiver(post_delete, sender=CustomImage)
+def invalidate_page_cache_on_change(sender, **kwargs):
+    """Invalidate cached pages when a page is deleted or an image shown on pages changes"""
+    invalidate_page_cache()
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+def prerender_changed_page(sender, instance, **kwargs):
+    """Render a published page and the pages depending on it, or remove an unpublished one"""
+    schedule_prerender(instance.pk)
+
+
+@receiver(post_page_move)
+def prerender_moved_page(sender, instance, **kwargs):
+    """Render a moved page and its descendants at their new URLs"""
+    schedule_prerender(instance.pk, include_descendants=True)
+
+
+@receiver(pre_delete, sender=Page)
+def remove_deleted_prerendered_page(sender, instance, **kwargs):
+    """Remove the file of a deleted page, and render the pages depending on it"""
+    if not settings.PRERENDER_ENABLED:
+        return
+
+    remove_prerendered_page(instance)
+
+    page = instance.specific
+    if isinstance(page, PrerenderedPageMixin):
+        schedule_prerender_pages(dependent.pk for dependent in page.get_prerender_dependents())
+
+
+@receiver(post_save, sender=Site)
+@receiver(post_delete, sender=Site)
+def invalidate_sites(sender, **kwargs):
+    """Resolve sites and routes from the database again after a site changes"""
+    invalidate_site_cache()
+    invalidate_route_cache()
+    invalidate_not_found_cache()
+    invalidate_redirect_index()
+
+
+@receiver(post_save, sender=Redirect)
+@receiver(post_delete, sender=Redirect)
+def invalidate_not_found_on_redirect(sender, **kwargs):
+    """Load redirects again when they change, and forget missing paths which may now redirect"""
+    invalidate_redirect_index()
+    invalidate_not_found_cache()
@@ -1 +1,2 @@
+from .richtext_tags import cached_richtext as cached_richtext
 from .webpack_tags import webpack_static as webpack_static
@@ -0,0 +1,23 @@
+from django import template
+
+from apps.core.utils.page_urls import get_page_urls
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def page_urls(context, pages):
+    """
+    Get the URLs of a list of pages at once, for listings
+    Usage: {% page_urls blog_pages as blog_urls %}
+    """
+    return get_page_urls(pages, context.get("request"))
+
+
+@register.filter
+def page_url(urls, page):
+    """
+    Get a page's URL from the result of page_urls
+    Usage: {{ blog_urls|page_url:blog }}
+    """
+    return urls.get(page.pk, "")
@@ -0,0 +1,14 @@
+from django import template
+
+from apps.core.utils.richtext_cache import render_cached_richtext
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def cached_richtext(context, page, field_name):
+    """
+    Render a page's rich text field, reusing the expanded HTML until the page is republished
+    Usage: {% cached_richtext page 'body' %}
+    """
+    return render_cached_richtext(page, field_name, context.get("request"))
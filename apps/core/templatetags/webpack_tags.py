@@ -1,10 +1,11 @@
-import json
 from pathlib import Path
 
 from django import template
 from django.conf import settings
 from django.contrib.staticfiles.storage import staticfiles_storage
 
+from apps.core.utils.webpack import get_webpack_manifest
+
 register = template.Library()
 
 
@@ -16,15 +17,9 @@ def webpack_static(asset_name):
     """
 
     manifest_path = Path(settings.BASE_DIR, "static", "dist", "manifest.json")
+    manifest = get_webpack_manifest(manifest_path, reload=bool(settings.WEBPACK_MANIFEST_RELOAD))
 
-    try:
-        with manifest_path.open() as f:
-            manifest = json.load(f)
-
-        # Get the hashed filename from manifest
-        hashed_filename = manifest.get(asset_name, asset_name)
-
-        return staticfiles_storage.url(hashed_filename)
+    # Get the hashed filename from manifest
+    hashed_filename = manifest.get(asset_name) or asset_name
 
-    except (FileNotFoundError, json.JSONDecodeError):
-        return staticfiles_storage.url(asset_name)
+    return staticfiles_storage.url(hashed_filename)
@@ -0,0 +1,35 @@
+from django.utils import timezone
+
+from wagtail.models import Site
+
+from apps.blogs.models import BlogDetailPage, BlogIndexPage
+from apps.core.models import HomePage
+from apps.core.utils.sites import invalidate_site_cache
+
+
+class PageTreeMixin:
+    """Build a site with a home page and blog index served from testserver"""
+
+    def create_page_tree(self):
+        self.addCleanup(invalidate_site_cache)
+
+        site = Site.objects.get(is_default_site=True)
+        self.home_page = HomePage(title="Home", slug="home", about_text="<p>Welcome</p>")
+        site.root_page.add_child(instance=self.home_page)
+        site.root_page = self.home_page
+        site.hostname = "testserver"
+        site.save()
+
+        self.blog_index = BlogIndexPage(title="Blog Index", slug="blog")
+        self.home_page.add_child(instance=self.blog_index)
+
+    def create_blog_post(self, title="Test Blog Post", slug="test-post"):
+        blog_post = BlogDetailPage(
+            title=title,
+            slug=slug,
+            date=timezone.now().date(),
+            intro="Test intro",
+            body="<p>Test content</p>",
+        )
+        self.blog_index.add_child(instance=blog_post)
+        return blog_post
@@ -0,0 +1,59 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.template import Context, Template
+from django.test import RequestFactory, TestCase
+
+from wagtail.models import Site
+
+from apps.core.models.home_page_model import HomePage
+
+
+class CachedRichtextTagTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.root_page = Site.objects.get(is_default_site=True).root_page
+        self.home_page = HomePage(title="Home", slug="home", about_text="<p>Original</p>")
+        self.root_page.add_child(instance=self.home_page)
+        self.home_page.save_revision().publish()
+        self.home_page.refresh_from_db()
+
+        self.template = Template("{% load richtext_tags %}{% cached_richtext page 'about_text' %}")
+        self.factory = RequestFactory()
+
+    def render(self, page, **request_attrs):
+        request = self.factory.get("/")
+        for name, value in request_attrs.items():
+            setattr(request, name, value)
+        return self.template.render(Context({"page": page, "request": request}))
+
+    def test_renders_richtext(self):
+        """Test the tag renders the field through the richtext filter"""
+        self.assertIn("<p>Original</p>", self.render(self.home_page))
+
+    def test_reuses_cached_html_for_same_revision(self):
+        """Test rich text is only expanded once per live revision"""
+        with patch(
+            "apps.core.utils.richtext_cache.richtext", wraps=lambda value: value
+        ) as mock_richtext:
+            self.render(self.home_page)
+            self.render(self.home_page)
+
+        mock_richtext.assert_called_once()
+
+    def test_publishing_invalidates_cached_html(self):
+        """Test publishing a new revision renders the new content"""
+        self.render(self.home_page)
+
+        self.home_page.about_text = "<p>Updated</p>"
+        self.home_page.save_revision().publish()
+        self.home_page.refresh_from_db()
+
+        self.assertIn("<p>Updated</p>", self.render(self.home_page))
+
+    def test_preview_skips_cache(self):
+        """Test previews always render the current field value"""
+        self.render(self.home_page)
+        self.home_page.about_text = "<p>Draft</p>"
+
+        self.assertIn("<p>Draft</p>", self.render(self.home_page, is_preview=True))
@@ -1,11 +1,15 @@
 import json
+import os
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
-from django.test import TestCase, override_settings
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
 
+from apps.core.middleware import PreloadLinkMiddleware
 from apps.core.templatetags.webpack_tags import webpack_static
+from apps.core.utils.webpack import WebpackManifest
 
 
 class WebpackTagsTestCase(TestCase):
@@ -82,3 +86,44 @@ class WebpackTagsTestCase(TestCase):
                 result = webpack_static("js/app.js")
                 mock_storage.url.assert_called_with("js/app.js")
                 self.assertEqual(result, "/static/js/app.js")
+
+
+class WebpackManifestTestCase(TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.manifest_path = Path(temp_dir.name, "manifest.json")
+        self.manifest_path.write_text(json.dumps({"app.js": "app.abc123.js"}))
+
+    def test_loaded_once(self):
+        """Test the manifest isn't read again when reloading is disabled"""
+        manifest = WebpackManifest(self.manifest_path)
+        self.assertEqual(manifest.get("app.js"), "app.abc123.js")
+
+        self.manifest_path.write_text(json.dumps({"app.js": "app.def456.js"}))
+        self.assertEqual(manifest.get("app.js"), "app.abc123.js")
+
+    def test_reload_on_change(self):
+        """Test the manifest is read again when its modification time changes"""
+        manifest = WebpackManifest(self.manifest_path, reload=True)
+        self.assertEqual(manifest.get("app.js"), "app.abc123.js")
+
+        self.manifest_path.write_text(json.dumps({"app.js": "app.def456.js"}))
+        mtime = self.manifest_path.stat().st_mtime + 1
+        os.utime(self.manifest_path, (mtime, mtime))
+        self.assertEqual(manifest.get("app.js"), "app.def456.js")
+
+    @override_settings(WEBPACK_PRELOAD_ASSETS={"styles.css": "style", "app.js": "script"})
+    def test_preload_link_header(self):
+        """Test HTML responses preload the bundles every page uses"""
+        with patch("apps.core.templatetags.webpack_tags.staticfiles_storage") as mock_storage:
+            mock_storage.url.side_effect = lambda name: f"/static/{name}"
+
+            response = PreloadLinkMiddleware(lambda request: HttpResponse("<html></html>"))(
+                RequestFactory().get("/")
+            )
+        self.assertEqual(
+            response["Link"],
+            "</static/styles.css>; rel=preload; as=style, "
+            "</static/app.js>; rel=preload; as=script",
+        )
@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+from unittest import mock
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+
+from apps.core.middleware import (
+    CurrentSiteMiddleware,
+    NotFoundCacheMiddleware,
+    PageCacheMiddleware,
+    PreloadLinkMiddleware,
+    PrerenderedPageMiddleware,
+    RedirectMiddleware,
+)
+
+MIDDLEWARE = [
+    CurrentSiteMiddleware,
+    PreloadLinkMiddleware,
+    PrerenderedPageMiddleware,
+    NotFoundCacheMiddleware,
+    PageCacheMiddleware,
+    RedirectMiddleware,
+]
+
+
+def cacheable_view(request):
+    request.page_cacheable = True
+    request.session = SimpleNamespace(accessed=False)
+    return HttpResponse("Page")
+
+
+async def async_cacheable_view(request):
+    return cacheable_view(request)
+
+
+class SyncAndAsyncMiddlewareTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+
+    def test_middleware_modes(self):
+        """Test middleware runs natively in whichever mode the rest of the chain runs"""
+        for middleware in MIDDLEWARE:
+            with self.subTest(middleware=middleware.__name__):
+                self.assertTrue(iscoroutinefunction(middleware(async_cacheable_view)))
+                self.assertFalse(iscoroutinefunction(middleware(cacheable_view)))
+
+    @override_settings(PAGE_CACHE_ENABLED=True)
+    def test_page_cache_async(self):
+        """Test pages are cached by the async path too"""
+        middleware = PageCacheMiddleware(async_cacheable_view)
+
+        response = async_to_sync(middleware)(self.factory.get("/blog/"))
+        self.assertEqual(response["X-Page-Cache"], "MISS")
+
+        response = async_to_sync(middleware)(self.factory.get("/blog/"))
+        self.assertEqual(response["X-Page-Cache"], "HIT")
+        self.assertEqual(response.content, b"Page")
+
+    @override_settings(WEBPACK_PRELOAD_ASSETS={"js/app.js": "script"})
+    def test_preload_link_async(self):
+        """Test the Link header is added by the async path"""
+        middleware = PreloadLinkMiddleware(async_cacheable_view)
+
+        with mock.patch("apps.core.middleware.webpack_static", return_value="/static/app.js"):
+            response = async_to_sync(middleware)(self.factory.get("/"))
+        self.assertEqual(response["Link"], "</static/app.js>; rel=preload; as=script")
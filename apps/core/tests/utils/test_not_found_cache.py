@@ -0,0 +1,61 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from wagtail.contrib.redirects.models import Redirect
+from wagtail.models import Site
+
+from apps.blogs.models import BlogIndexPage
+from apps.core.utils.not_found_cache import NotFoundCache
+
+
+@override_settings(NOT_FOUND_CACHE_ENABLED=True)
+class NotFoundCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.root_page = Site.objects.get(is_default_site=True).root_page
+
+    def test_repeated_miss_skips_routing(self):
+        """Test a repeated request for a missing path is answered without queries"""
+        response = self.client.get("/missing/")
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn("X-Not-Found-Cache", response)
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/missing/")
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response["X-Not-Found-Cache"], "HIT")
+
+    def test_page_published_invalidates(self):
+        """Test publishing a page at a missing path serves the page"""
+        self.client.get("/blog/")
+
+        blog_index = BlogIndexPage(title="Blog Index", slug="blog")
+        self.root_page.add_child(instance=blog_index)
+        blog_index.save_revision().publish()
+
+        response = self.client.get("/blog/")
+        self.assertEqual(response.status_code, 200)
+
+    def test_redirect_created_invalidates(self):
+        """Test creating a redirect from a missing path redirects"""
+        self.client.get("/old-page/")
+
+        Redirect.objects.create(old_path="/old-page", redirect_link="/new-page/")
+
+        response = self.client.get("/old-page/")
+        self.assertEqual(response.status_code, 301)
+
+    def test_other_views_not_cached(self):
+        """Test 404 responses from views other than Wagtail's aren't cached"""
+        self.client.get("/api/donate/")
+        response = self.client.get("/api/donate/", headers={"HX-Request": "true"})
+        self.assertEqual(response.status_code, 200)
+
+    def test_bounded(self):
+        """Test the least recently used paths are evicted"""
+        not_found = NotFoundCache(max_size=2, timeout=60)
+        for key in ("/a/", "/b/", "/c/"):
+            not_found.add(key, self.client.get(key))
+
+        self.assertIsNone(not_found.get("/a/"))
+        self.assertIsNotNone(not_found.get("/c/"))
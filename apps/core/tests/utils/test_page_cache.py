@@ -0,0 +1,117 @@
+from unittest.mock import patch
+
+from django.contrib.gis.geos import Point
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from apps.accounts.tests.factories import UserFactory
+from apps.core.tests.mixins import PageTreeMixin
+from apps.core.utils.page_cache import get_page_cache_key, invalidate_page_cache
+from apps.sightings.models import SightingModel, SightingPage
+
+
+@override_settings(PAGE_CACHE_ENABLED=True)
+class PageCacheTestCase(PageTreeMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+
+        self.create_page_tree()
+        self.blog_post = self.create_blog_post()
+
+    def test_cache_hit(self):
+        """Test the second anonymous request for a page is served from the cache"""
+        response = self.client.get(self.blog_post.url)
+        self.assertEqual(response["X-Page-Cache"], "MISS")
+
+        response = self.client.get(self.blog_post.url)
+        self.assertEqual(response["X-Page-Cache"], "HIT")
+        self.assertContains(response, "Test content")
+
+    def test_public_page_cookie_free(self):
+        """Test anonymous visitors get pages without cookies which shared caches can store"""
+        response = self.client.get(self.blog_post.url)
+        self.assertFalse(response.cookies)
+        self.assertNotIn("Cookie", response.get("Vary", ""))
+        self.assertIn("public", response["Cache-Control"])
+
+    def test_htmx_requests_cached_separately(self):
+        """Test requests with different vary headers don't share a cache entry"""
+        self.client.get(self.blog_post.url)
+        response = self.client.get(self.blog_post.url, headers={"HX-Request": "true"})
+        self.assertEqual(response["X-Page-Cache"], "MISS")
+
+    def test_authenticated_not_cached(self):
+        """Test responses to logged in users bypass the cache"""
+        self.client.force_login(UserFactory())
+
+        response = self.client.get(self.blog_post.url)
+        self.assertNotIn("X-Page-Cache", response)
+
+    def test_publish_invalidates(self):
+        """Test publishing a page invalidates cached pages showing it"""
+        self.client.get(self.blog_index.url)
+
+        self.blog_post.title = "Updated Blog Post"
+        self.blog_post.save_revision().publish()
+
+        response = self.client.get(self.blog_index.url)
+        self.assertEqual(response["X-Page-Cache"], "MISS")
+        self.assertContains(response, "Updated Blog Post")
+
+    def test_sighting_change_invalidates(self):
+        """Test saving a sighting invalidates the cached sightings map"""
+        sighting_page = SightingPage(
+            title="Sightings Map",
+            slug="sightings",
+            intro="<p>Map of all sightings</p>",
+            map_center=Point(-3.0, 55.0, srid=4326),
+            zoom_level=8,
+        )
+        self.home_page.add_child(instance=sighting_page)
+        self.client.get(sighting_page.url)
+
+        SightingModel.objects.create(
+            location_name="Loch Ness",
+            location_point=Point(-4.5, 57.3, srid=4326),
+            sighted_by="Nessie",
+        )
+
+        response = self.client.get(sighting_page.url)
+        self.assertEqual(response["X-Page-Cache"], "MISS")
+        self.assertContains(response, "Loch Ness")
+
+    def test_stale_served_while_locked(self):
+        """Test a stale entry is served while another request is rendering the page"""
+        self.client.get(self.blog_post.url)
+        invalidate_page_cache()
+
+        cache_key = get_page_cache_key(RequestFactory().get(self.blog_post.url))
+        cache.add(f"{cache_key}:lock", 1)
+
+        response = self.client.get(self.blog_post.url)
+        self.assertEqual(response["X-Page-Cache"], "STALE")
+
+    def test_non_page_never_waits(self):
+        """Test requests for URLs other than pages bypass the cache, even while one is rendering"""
+        url = f"{reverse('blog_search')}?q=unicorn"
+        cache_key = get_page_cache_key(RequestFactory().get(url))
+        cache.add(f"{cache_key}:lock", 1)
+
+        with patch("apps.core.middleware.time.sleep") as sleep:
+            response = self.client.get(url)
+
+        sleep.assert_not_called()
+        self.assertNotIn("X-Page-Cache", response)
+
+    def test_not_found_not_cached(self):
+        """Test responses other than a 200 aren't cached"""
+        self.client.get("/missing/")
+        response = self.client.get("/missing/")
+        self.assertEqual(response["X-Page-Cache"], "MISS")
+
+    @override_settings(PAGE_CACHE_ENABLED=False)
+    def test_disabled(self):
+        """Test pages aren't cached when disabled"""
+        response = self.client.get(self.blog_post.url)
+        self.assertNotIn("X-Page-Cache", response)
@@ -0,0 +1,58 @@
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+
+from apps.blogs.models import BlogDetailPage
+from apps.core.tests.mixins import PageTreeMixin
+from apps.core.utils.page_routes import get_cached_route
+
+
+class PageRoutesTestCase(PageTreeMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.create_page_tree()
+        self.blog_post = self.create_blog_post()
+
+    def route(self, path):
+        return get_cached_route(self.factory.get(f"/{path}"), path)
+
+    def test_cached_route_single_query(self):
+        """Test a cached route loads the specific page with a single query"""
+        self.route("blog/test-post/")
+
+        with self.assertNumQueries(1):
+            route_result = self.route("blog/test-post/")
+        self.assertIsInstance(route_result.page, BlogDetailPage)
+        self.assertEqual(route_result.page, self.blog_post)
+
+    def test_routable_page_route(self):
+        """Test routable page paths are cached along with the rest of the path"""
+        self.route("blog/feed/")
+
+        route_result = self.route("blog/feed/")
+        self.assertEqual(route_result.page, self.blog_index)
+        self.assertTrue(route_result.args)
+
+    def test_slug_change_invalidates(self):
+        """Test publishing a new slug stops the old path routing to the page"""
+        self.route("blog/test-post/")
+
+        self.blog_post.slug = "renamed-post"
+        self.blog_post.save_revision().publish()
+
+        self.assertIsNone(self.route("blog/test-post/"))
+        self.assertEqual(self.route("blog/renamed-post/").page, self.blog_post)
+
+    def test_unpublish_invalidates(self):
+        """Test unpublished pages aren't routed to"""
+        self.route("blog/test-post/")
+
+        self.blog_post.unpublish()
+
+        self.assertIsNone(self.route("blog/test-post/"))
+
+    def test_serve_cached_route(self):
+        """Test pages are served through the route cache"""
+        self.client.get(self.blog_post.url)
+        response = self.client.get(self.blog_post.url)
+        self.assertContains(response, "Test content")
@@ -0,0 +1,38 @@
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+
+from apps.core.tests.mixins import PageTreeMixin
+from apps.core.utils.page_urls import get_page_urls
+
+
+class PageUrlsTestCase(PageTreeMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+
+        self.create_page_tree()
+        self.blog_posts = [
+            self.create_blog_post(title=f"Blog Post {number}", slug=f"post-{number}")
+            for number in range(5)
+        ]
+
+    def test_matches_page_urls(self):
+        """Test URLs match those Wagtail computes for each page"""
+        request = self.factory.get("/")
+        urls = get_page_urls([self.home_page, self.blog_index, *self.blog_posts], request)
+
+        for page in [self.home_page, self.blog_index, *self.blog_posts]:
+            self.assertEqual(urls[page.pk], page.get_url(request))
+
+    def test_no_queries_per_page(self):
+        """Test resolving URLs for a listing doesn't query once root paths are cached"""
+        get_page_urls(self.blog_posts, self.factory.get("/"))
+
+        with self.assertNumQueries(0):
+            urls = get_page_urls(self.blog_posts, self.factory.get("/"))
+        self.assertEqual(urls[self.blog_posts[0].pk], "/blog/post-0/")
+
+    def test_listing_uses_urls(self):
+        """Test the blog index links to each post"""
+        response = self.client.get(self.blog_index.url)
+        self.assertContains(response, 'href="/blog/post-3/"', count=2)
@@ -0,0 +1,109 @@
+import tempfile
+from pathlib import Path
+
+from django.test import TestCase, override_settings
+
+from apps.core.models import PrerenderedPage
+from apps.core.tests.mixins import PageTreeMixin
+from apps.core.utils.prerender import (
+    get_page_prerender_path,
+    prerender_all_pages,
+    prerender_page,
+)
+
+
+class PrerenderTestCase(PageTreeMixin, TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.prerender_root = Path(temp_dir.name)
+
+        settings_override = override_settings(
+            PRERENDER_ENABLED=True, PRERENDER_ROOT=self.prerender_root
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.create_page_tree()
+        self.blog_post = self.create_blog_post()
+
+    def read_prerendered(self, page):
+        return (self.prerender_root / get_page_prerender_path(page)).read_text()
+
+    def test_prerender_all_pages(self):
+        """Test every live page type which can be pre-rendered is written to a file"""
+        self.assertEqual(prerender_all_pages(), 3)
+        self.assertIn("Test content", self.read_prerendered(self.blog_post))
+        self.assertIn("Test Blog Post", self.read_prerendered(self.blog_index))
+        self.assertEqual(PrerenderedPage.objects.count(), 3)
+
+    def test_prerender_path(self):
+        """Test files are stored by site hostname and page path"""
+        self.assertEqual(
+            get_page_prerender_path(self.blog_post), "testserver/blog/test-post/index.html"
+        )
+
+    def test_middleware_serves_prerendered_page(self):
+        """Test anonymous visitors are served the pre-rendered file"""
+        prerender_page(self.blog_post)
+        (self.prerender_root / get_page_prerender_path(self.blog_post)).write_text("Static")
+
+        response = self.client.get(self.blog_post.url)
+        self.assertEqual(response.content, b"Static")
+        self.assertEqual(response["X-Prerendered"], "1")
+
+    def test_middleware_skips_query_strings(self):
+        """Test requests with a query string are rendered by Wagtail"""
+        prerender_page(self.blog_post)
+        response = self.client.get(self.blog_post.url, {"page": 2})
+        self.assertNotIn("X-Prerendered", response)
+        self.assertContains(response, "Test content")
+
+    @override_settings(PRERENDER_ENABLED=False)
+    def test_middleware_disabled(self):
+        """Test pre-rendered files aren't served when disabled"""
+        prerender_page(self.blog_post)
+        response = self.client.get(self.blog_post.url)
+        self.assertNotIn("X-Prerendered", response)
+
+    def test_publish_renders_dependents(self):
+        """Test publishing a post also renders the blog index and home page"""
+        self.blog_post.title = "Updated Blog Post"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.blog_post.save_revision().publish()
+
+        self.assertIn("Updated Blog Post", self.read_prerendered(self.blog_post))
+        self.assertIn("Updated Blog Post", self.read_prerendered(self.blog_index))
+        self.assertIn("Updated Blog Post", self.read_prerendered(self.home_page))
+
+    def test_unpublish_removes_file(self):
+        """Test unpublishing a post removes its file"""
+        prerender_page(self.blog_post)
+        path = self.prerender_root / get_page_prerender_path(self.blog_post)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.blog_post.unpublish()
+
+        self.assertFalse(path.exists())
+        self.assertFalse(PrerenderedPage.objects.filter(page=self.blog_post).exists())
+
+    def test_slug_change_removes_old_file(self):
+        """Test changing a post's slug moves its file"""
+        prerender_page(self.blog_post)
+        old_path = self.prerender_root / get_page_prerender_path(self.blog_post)
+
+        self.blog_post.slug = "renamed-post"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.blog_post.save_revision().publish()
+
+        self.assertFalse(old_path.exists())
+        self.assertTrue((self.prerender_root / "testserver/blog/renamed-post/index.html").exists())
+
+    def test_delete_removes_file(self):
+        """Test deleting a post removes its file"""
+        prerender_page(self.blog_post)
+        path = self.prerender_root / get_page_prerender_path(self.blog_post)
+
+        self.blog_post.delete()
+
+        self.assertFalse(path.exists())
@@ -0,0 +1,86 @@
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from asgiref.sync import async_to_sync
+
+from apps.core.utils.rate_limit import get_client_ip, rate_limit, take_token
+
+
+@rate_limit("test", "TEST_RATE_LIMITS")
+def limited_view(request):
+    return HttpResponse("OK")
+
+
+@override_settings(TEST_RATE_LIMITS={"POST": {"capacity": 2, "refill_rate": 0.01}})
+class RateLimitTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+
+    def test_take_token(self):
+        """Test tokens run out once the bucket is empty"""
+        self.assertEqual(take_token("bucket", capacity=2, refill_rate=0.01), 0)
+        self.assertEqual(take_token("bucket", capacity=2, refill_rate=0.01), 0)
+        self.assertGreater(take_token("bucket", capacity=2, refill_rate=0.01), 0)
+
+    def test_take_token_redis(self):
+        """Test tokens are taken by the Lua script when the default cache is Redis"""
+        script = mock.Mock(return_value=[0, "2.5"])
+
+        with (
+            mock.patch("apps.core.utils.rate_limit.RedisCache", type(caches["default"])),
+            mock.patch("apps.core.utils.rate_limit.get_rate_limit_script", return_value=script),
+        ):
+            retry_after = take_token("bucket", capacity=2, refill_rate=0.01)
+
+        self.assertEqual(retry_after, 2.5)
+        script.assert_called_once_with(
+            keys=[cache.make_key("core:ratelimit:bucket")], args=[2, 0.01]
+        )
+
+    def test_rate_limit(self):
+        """Test clients over the limit get a 429 with Retry-After"""
+        for _ in range(2):
+            self.assertEqual(limited_view(self.factory.post("/")).status_code, 200)
+
+        response = limited_view(self.factory.post("/"))
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "100")
+
+    def test_rate_limit_per_method(self):
+        """Test methods without a limit aren't limited"""
+        for _ in range(5):
+            self.assertEqual(limited_view(self.factory.get("/")).status_code, 200)
+
+    def test_rate_limit_per_session(self):
+        """Test a session is limited even when its requests come from several addresses"""
+        for address in ("10.0.0.1", "10.0.0.2"):
+            request = self.factory.post("/", REMOTE_ADDR=address)
+            request.COOKIES[settings.SESSION_COOKIE_NAME] = "session"
+            self.assertEqual(limited_view(request).status_code, 200)
+
+        request = self.factory.post("/", REMOTE_ADDR="10.0.0.3")
+        request.COOKIES[settings.SESSION_COOKIE_NAME] = "session"
+        self.assertEqual(limited_view(request).status_code, 429)
+
+    @override_settings(RATE_LIMIT_FORWARDED_FOR=True)
+    def test_get_client_ip_forwarded_for(self):
+        """Test the client IP is the address added by the proxy"""
+        request = self.factory.get("/", HTTP_X_FORWARDED_FOR="1.2.3.4, 5.6.7.8")
+        self.assertEqual(get_client_ip(request), "5.6.7.8")
+
+    def test_rate_limit_async_view(self):
+        """Test async views are limited too"""
+
+        @rate_limit("test", "TEST_RATE_LIMITS")
+        async def async_view(request):
+            return HttpResponse("OK")
+
+        statuses = [
+            async_to_sync(async_view)(self.factory.post("/")).status_code for _ in range(3)
+        ]
+        self.assertEqual(statuses, [200, 200, 429])
@@ -0,0 +1,68 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from wagtail.contrib.redirects.models import Redirect
+from wagtail.models import Site
+
+from apps.blogs.models import BlogIndexPage
+from apps.core.utils.redirects import redirect_index
+
+
+class RedirectIndexTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.site = Site.objects.get(is_default_site=True)
+
+        self.blog_index = BlogIndexPage(title="Blog Index", slug="blog")
+        self.site.root_page.add_child(instance=self.blog_index)
+
+    def test_redirect_link(self):
+        """Test a redirect to a link"""
+        Redirect.objects.create(old_path="/old-page", redirect_link="/new-page/")
+
+        response = self.client.get("/old-page/")
+        self.assertRedirects(
+            response, "/new-page/", status_code=301, fetch_redirect_response=False
+        )
+
+    def test_redirect_page(self):
+        """Test a temporary redirect to a page uses the page's URL"""
+        Redirect.objects.create(
+            old_path="/old-blog", redirect_page=self.blog_index, is_permanent=False
+        )
+
+        response = self.client.get("/old-blog/")
+        self.assertRedirects(
+            response, self.blog_index.url, status_code=302, fetch_redirect_response=False
+        )
+
+    def test_find_without_queries(self):
+        """Test redirects are found without queries once loaded"""
+        Redirect.objects.create(old_path="/old-page", redirect_link="/new-page/")
+        redirect_index.load()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(redirect_index.find(None, "/old-page"), ("/new-page/", True))
+            self.assertIsNone(redirect_index.find(None, "/missing"))
+
+    def test_prefers_site_redirect(self):
+        """Test a redirect for the site is preferred over one for all sites"""
+        Redirect.objects.create(old_path="/old-page", redirect_link="/all-sites/")
+        Redirect.objects.create(old_path="/old-page", redirect_link="/site/", site=self.site)
+
+        self.assertEqual(redirect_index.find(self.site.pk, "/old-page"), ("/site/", True))
+
+    def test_query_string(self):
+        """Test the path is tried without its query string"""
+        Redirect.objects.create(old_path="/old-page", redirect_link="/new-page/")
+
+        self.assertEqual(redirect_index.find(None, "/old-page?page=2"), ("/new-page/", True))
+
+    def test_invalidated_on_delete(self):
+        """Test deleted redirects are no longer found"""
+        redirect = Redirect.objects.create(old_path="/old-page", redirect_link="/new-page/")
+        redirect_index.load()
+
+        redirect.delete()
+
+        self.assertIsNone(redirect_index.find(None, "/old-page"))
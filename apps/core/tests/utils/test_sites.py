@@ -0,0 +1,56 @@
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+
+from wagtail.models import Site
+
+from apps.core.context_processors import site_context
+from apps.core.utils.sites import get_site_for_request, invalidate_site_cache
+
+
+class SiteResolverTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(invalidate_site_cache)
+        self.factory = RequestFactory()
+        self.site = Site.objects.get(is_default_site=True)
+
+    def test_resolve_without_queries(self):
+        """Test sites are resolved without queries once a hostname has been seen"""
+        get_site_for_request(self.factory.get("/"))
+
+        with self.assertNumQueries(0):
+            site = get_site_for_request(self.factory.get("/"))
+        self.assertEqual(site, self.site)
+
+    def test_memoized_on_request(self):
+        """Test the site is shared with Wagtail through the request"""
+        request = self.factory.get("/")
+        site = get_site_for_request(request)
+        self.assertIs(Site.find_for_request(request), site)
+
+    def test_instances_not_shared(self):
+        """Test each request gets its own site instance"""
+        first = get_site_for_request(self.factory.get("/"))
+        second = get_site_for_request(self.factory.get("/"))
+        self.assertIsNot(first, second)
+
+    def test_invalidated_on_save(self):
+        """Test saving a site resolves it from the database again"""
+        get_site_for_request(self.factory.get("/"))
+
+        self.site.site_name = "Unicorn Watch"
+        self.site.save()
+
+        self.assertEqual(get_site_for_request(self.factory.get("/")).site_name, "Unicorn Watch")
+
+    def test_invalidated_on_delete(self):
+        """Test deleting a site stops it being resolved"""
+        get_site_for_request(self.factory.get("/"))
+
+        self.site.delete()
+
+        self.assertIsNone(get_site_for_request(self.factory.get("/")))
+
+    def test_site_context(self):
+        """Test the context processor adds the current site"""
+        self.assertEqual(site_context(self.factory.get("/"))["current_site"], self.site)
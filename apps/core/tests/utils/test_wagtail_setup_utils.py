@@ -391,6 +391,19 @@ class WagtailSetupUtilsTestCase(TestCase):
             with self.assertRaises(DatabaseError):
                 self.utils.create_and_publish_page(mock_parent, mock_page)
 
+    def test_publish_page_changes(self):
+        """Test publish_page_changes saves and publishes a new revision"""
+        mock_page = Mock()
+        mock_page.title = "Test Page"
+        mock_revision = Mock()
+        mock_page.save_revision.return_value = mock_revision
+
+        result = self.utils.publish_page_changes(mock_page)
+
+        mock_page.save_revision.assert_called_once()
+        mock_revision.publish.assert_called_once()
+        self.assertEqual(result, mock_page)
+
     @patch('apps.core.models.HomePage.objects.live')
     @patch('wagtail.models.Page.get_first_root_node')
     def test_get_parent_page_homepage_exists(self, mock_get_root, mock_live):
@@ -0,0 +1,40 @@
+from unittest import mock
+
+from django.core.cache import caches
+from django.test import SimpleTestCase
+from django.urls import get_resolver
+
+from apps.core.utils.warmup import close_connections, get_memory_usage, warm_up, warm_up_urls
+
+
+class WarmUpTestCase(SimpleTestCase):
+    def test_warm_up_urls(self):
+        """Test warming up populates the URL resolver"""
+        warm_up_urls()
+        self.assertTrue(get_resolver()._populated)
+
+    def test_warm_up_skips_failed_steps(self):
+        """Test a step which fails is logged and skipped, and the others still run"""
+        with (
+            mock.patch("apps.core.utils.warmup.redirect_index.load", side_effect=ConnectionError),
+            mock.patch("apps.core.utils.warmup.warm_up_pages"),
+            mock.patch("apps.core.utils.warmup.donation_form_shell.get_html"),
+            self.assertLogs("apps.core.utils.warmup", "WARNING"),
+        ):
+            timings = warm_up()
+
+        self.assertNotIn("redirects", timings)
+        self.assertIn("urls", timings)
+
+    def test_close_connections(self):
+        """Test every initialised cache is closed"""
+        with mock.patch.object(caches["default"], "close") as close:
+            close_connections()
+        close.assert_called_once()
+
+    def test_get_memory_usage(self):
+        """Test memory usage is reported in MiB, or not at all off Linux"""
+        usage = get_memory_usage()
+        if usage:
+            self.assertGreater(usage["rss"], 0)
+            self.assertLessEqual(usage["private"], usage["rss"])
@@ -1 +1,11 @@
-app_name = "core"
+from django.urls import re_path
+
+from wagtail import urls as wagtail_urls
+
+from apps.core.views import serve_page
+
+# Wagtail's URLs, with pages served through the route cache
+urlpatterns = [
+    *(pattern for pattern in wagtail_urls.urlpatterns if pattern.name != "wagtail_serve"),
+    re_path(wagtail_urls.serve_pattern, serve_page, name="wagtail_serve"),
+]
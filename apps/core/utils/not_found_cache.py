@@ -0,0 +1,76 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+
+NOT_FOUND_CACHE_GENERATION_KEY = "core:notfound:generation"
+
+
+def get_not_found_generation() -> str:
+    """Return the current generation, which changes whenever a missing path may now exist"""
+    return cache.get_or_set(NOT_FOUND_CACHE_GENERATION_KEY, uuid.uuid4().hex, None)
+
+
+def invalidate_not_found_cache() -> None:
+    """Forget the missing paths of every process by moving to a new generation"""
+    cache.set(NOT_FOUND_CACHE_GENERATION_KEY, uuid.uuid4().hex, None)
+
+
+def get_not_found_key(request: HttpRequest) -> str:
+    """Return the key of a request's path within the cache"""
+    return f"{request.get_host()}{request.get_full_path()}"
+
+
+class NotFoundCache:
+    """
+    Per process LRU cache of recently missed paths, along with the 404 response rendered for each.
+
+    The generation is only checked when a path is found, so requests for paths which exist don't
+    touch the default cache at all.
+    """
+
+    def __init__(self, max_size: int, timeout: float):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.entries: OrderedDict[str, dict] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> dict | None:
+        """Return the entry for a missing path, if it's still current"""
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        expired = time.monotonic() >= entry["expires"]
+        if expired or entry["generation"] != get_not_found_generation():
+            with self.lock:
+                self.entries.pop(key, None)
+            return None
+
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+        return entry
+
+    def add(self, key: str, response: HttpResponse) -> None:
+        """Remember a missing path and its 404 response, evicting the least recently used"""
+        entry = {
+            "content": response.content,
+            "content_type": response.get("Content-Type", "text/html"),
+            "generation": get_not_found_generation(),
+            "expires": time.monotonic() + self.timeout,
+        }
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget every missing path in this process"""
+        with self.lock:
+            self.entries.clear()
@@ -0,0 +1,69 @@
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import patch_cache_control
+
+PAGE_CACHE_PREFIX = "core:pagecache"
+PAGE_CACHE_GENERATION_KEY = f"{PAGE_CACHE_PREFIX}:generation"
+
+# Request headers which change the response for the same URL
+PAGE_CACHE_VARY_HEADERS = ("HX-Request",)
+
+
+def get_page_cache_generation() -> str:
+    """Return the current page cache generation, which changes whenever cached pages are stale"""
+    return cache.get_or_set(PAGE_CACHE_GENERATION_KEY, uuid.uuid4().hex, None)
+
+
+async def aget_page_cache_generation() -> str:
+    """Return the current page cache generation, for async middleware"""
+    return await cache.aget_or_set(PAGE_CACHE_GENERATION_KEY, uuid.uuid4().hex, None)
+
+
+def invalidate_page_cache() -> None:
+    """Mark every cached page as stale by moving to a new generation"""
+    cache.set(PAGE_CACHE_GENERATION_KEY, uuid.uuid4().hex, None)
+
+
+def get_page_cache_key(request: HttpRequest) -> str:
+    """Return the cache key for a request, from its site, path, query string and vary headers"""
+    headers = "|".join(request.headers.get(header, "") for header in PAGE_CACHE_VARY_HEADERS)
+    url = f"{request.scheme}://{request.get_host()}{request.get_full_path()}"
+    digest = hashlib.md5(f"{url}|{headers}".encode(), usedforsecurity=False).hexdigest()
+    return f"{PAGE_CACHE_PREFIX}:page:{digest}"
+
+
+def is_anonymous_request(request: HttpRequest) -> bool:
+    """
+    Return whether a request can't be from a logged in user, without loading its session.
+
+    Loading the session would add Vary: Cookie to the response, so visitors without a session
+    cookie are treated as anonymous and everyone else goes through the usual authentication.
+    """
+    return settings.SESSION_COOKIE_NAME not in request.COOKIES
+
+
+def patch_public_cache_control(response: HttpResponse) -> None:
+    """Allow shared caches such as a CDN to store a response for PAGE_CACHE_SHARED_MAX_AGE"""
+    patch_cache_control(
+        response, public=True, max_age=0, s_maxage=settings.PAGE_CACHE_SHARED_MAX_AGE
+    )
+
+
+def is_response_cacheable(request: HttpRequest, response: HttpResponse) -> bool:
+    """Return whether a response is the same for every anonymous visitor, so can be cached"""
+    cache_control = response.get("Cache-Control", "")
+    return (
+        getattr(request, "page_cacheable", False)
+        and response.status_code == 200
+        and not response.streaming
+        and not response.cookies
+        # Outer middleware would add a session or CSRF cookie, or Vary: Cookie, to the response
+        and not request.session.accessed
+        and not request.META.get("CSRF_COOKIE_NEEDS_UPDATE")
+        and "private" not in cache_control
+        and "no-store" not in cache_control
+    )
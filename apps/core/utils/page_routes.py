@@ -0,0 +1,71 @@
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.http import Http404, HttpRequest
+
+from wagtail.models import Page
+from wagtail.url_routing import RouteResult
+
+from apps.core.utils.sites import get_site_for_request
+
+ROUTE_CACHE_PREFIX = "core:routes"
+ROUTE_CACHE_GENERATION_KEY = f"{ROUTE_CACHE_PREFIX}:generation"
+
+
+def invalidate_route_cache() -> None:
+    """Forget every cached route by moving to a new generation"""
+    cache.set(ROUTE_CACHE_GENERATION_KEY, uuid.uuid4().hex, None)
+
+
+def get_route_cache_key(site_id: int, path_components: list[str]) -> str:
+    """Return the cache key of the route to a path within a site"""
+    digest = hashlib.md5("/".join(path_components).encode(), usedforsecurity=False).hexdigest()
+    return f"{ROUTE_CACHE_PREFIX}:route:{site_id}:{digest}"
+
+
+def get_cached_route(request: HttpRequest, path: str) -> RouteResult | None:
+    """
+    Route a request to a page through the route cache, falling back to Wagtail's tree walk.
+
+    Each path is cached as the id and content type of the page it reached, along with any path
+    components left over for a routable page. The generation is fetched in the same round trip
+    as the route, so a cached route costs one cache hit and one query for the specific page.
+    """
+    site = get_site_for_request(request)
+    if site is None:
+        return None
+
+    path_components = [component for component in path.split("/") if component]
+    cache_key = get_route_cache_key(site.pk, path_components)
+    cached = cache.get_many([ROUTE_CACHE_GENERATION_KEY, cache_key])
+    generation = cached.get(ROUTE_CACHE_GENERATION_KEY)
+
+    entry = cached.get(cache_key)
+    if generation is not None and entry is not None and entry["generation"] == generation:
+        model = ContentType.objects.get_for_id(entry["content_type_id"]).model_class()
+        page = model.objects.filter(pk=entry["page_id"]).first() if model else None
+        if page is not None:
+            try:
+                return page.route(request, entry["remaining"])
+            except Http404:
+                return None
+
+    if generation is None:
+        generation = cache.get_or_set(ROUTE_CACHE_GENERATION_KEY, uuid.uuid4().hex, None)
+
+    route_result = Page.route_for_request(request, path)
+    if route_result is not None:
+        page = route_result.page
+        consumed = page.depth - site.root_page.depth
+        entry = {
+            "generation": generation,
+            "page_id": page.pk,
+            "content_type_id": page.content_type_id,
+            "remaining": path_components[consumed:],
+        }
+        cache.set(cache_key, entry, settings.ROUTE_CACHE_TIMEOUT)
+
+    return route_result
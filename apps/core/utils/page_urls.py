@@ -0,0 +1,64 @@
+from collections.abc import Iterable
+from urllib.parse import quote
+
+from django.http import HttpRequest
+from django.urls import NoReverseMatch, reverse
+from django.utils.http import RFC3986_SUBDELIMS
+
+from wagtail.coreutils import WAGTAIL_APPEND_SLASH
+from wagtail.models import Page, Site
+
+from apps.core.utils.sites import get_site_for_request
+
+
+def get_site_root_paths(request: HttpRequest | None = None) -> list:
+    """Return the cached site root paths, memoized on the request where Wagtail looks for them"""
+    if request is None:
+        return Site.get_site_root_paths()
+    if not hasattr(request, "_wagtail_cached_site_root_paths"):
+        request._wagtail_cached_site_root_paths = Site.get_site_root_paths()
+    return request._wagtail_cached_site_root_paths
+
+
+def get_page_urls(pages: Iterable[Page], request: HttpRequest | None = None) -> dict[int, str]:
+    """
+    Return the URLs of many pages at once, by page id, as Page.get_url would.
+
+    Site root paths, the current site and the URL prefix are looked up once for every page,
+    leaving only string operations per page. Pages which aren't routable are left out.
+    """
+    root_paths = get_site_root_paths(request)
+    multiple_sites = len({root_path.site_id for root_path in root_paths}) > 1
+    current_site = get_site_for_request(request) if request is not None else None
+
+    try:
+        serve_prefix = reverse("wagtail_serve", args=("",))
+    except NoReverseMatch:
+        return {}
+
+    urls = {}
+    for page in pages:
+        possible_sites = [
+            root_path for root_path in root_paths if page.url_path.startswith(root_path.root_path)
+        ]
+        if not possible_sites:
+            continue
+
+        # Root paths are ordered so the first is the best match, unless it's on another site
+        site_root = possible_sites[0]
+        if current_site is not None:
+            site_root = next(
+                (root for root in possible_sites if root.site_id == current_site.pk), site_root
+            )
+
+        # Quoted as reverse() would, for unicode slugs
+        page_path = page.url_path[len(site_root.root_path) :]
+        url = serve_prefix + quote(page_path, safe=RFC3986_SUBDELIMS + "/~:@")
+        if not WAGTAIL_APPEND_SLASH and url != "/":
+            url = url.rstrip("/")
+
+        if multiple_sites and (current_site is None or site_root.site_id != current_site.pk):
+            url = site_root.root_url + url
+        urls[page.pk] = url
+
+    return urls
@@ -0,0 +1,228 @@
+import functools
+import logging
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.handlers.base import BaseHandler
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import transaction
+from django.http import HttpRequest
+from django.http.request import split_domain_port
+from django.utils._os import safe_join
+
+from wagtail.models import Page
+
+from apps.core.mixins import PrerenderedPageMixin
+from apps.core.models import PrerenderedPage
+
+logger = logging.getLogger(__name__)
+
+_deferred = ContextVar("prerender_deferred", default=False)
+
+
+class PrerenderHandler(BaseHandler):
+    """Handler which serves the page attached to a dummy request, through the full middleware"""
+
+    def _get_response(self, request):
+        response = request.prerender_page.serve(request)
+        if hasattr(response, "render") and callable(response.render):
+            response = response.render()
+        return response
+
+
+@functools.cache
+def get_prerender_handler() -> PrerenderHandler:
+    """Return a handler for rendering pages, loading the middleware once per process"""
+    handler = PrerenderHandler()
+    handler.load_middleware()
+    return handler
+
+
+def get_page_prerender_path(page: Page) -> str | None:
+    """Return the path of a page's HTML file within PRERENDER_ROOT, or None if it has no URL"""
+    url_parts = page.get_url_parts()
+    if url_parts is None:
+        return None
+
+    _, root_url, page_path = url_parts
+    return f"{urlsplit(root_url).hostname}{page_path}index.html"
+
+
+def get_request_prerender_file(request: HttpRequest) -> Path | None:
+    """Return the HTML file which would hold a pre-rendered response to a request"""
+    # Parent segments could otherwise reach the files of another site
+    if not request.path.endswith("/") or ".." in request.path.split("/"):
+        return None
+
+    host, _ = split_domain_port(request.get_host())
+    try:
+        return Path(safe_join(settings.PRERENDER_ROOT, f"{host}{request.path}index.html"))
+    except SuspiciousFileOperation:
+        return None
+
+
+def is_prerenderable(page: Page) -> bool:
+    """Return whether a page should have a pre-rendered HTML file"""
+    return (
+        page.live
+        and isinstance(page, PrerenderedPageMixin)
+        and not page.get_view_restrictions().exists()
+    )
+
+
+def render_page(page: Page) -> bytes | None:
+    """Render a page as an anonymous visitor would see it, or return None if it isn't a 200"""
+    request = WSGIRequest(page._get_dummy_headers())
+    # Tells middleware serving pre-rendered pages to pass this request through
+    request.is_dummy = True
+    request.prerender_page = page
+
+    response = get_prerender_handler().get_response(request)
+    if response.status_code != 200:
+        logger.warning("Not pre-rendering %s, status %s", page.url_path, response.status_code)
+        return None
+    return response.content
+
+
+def _write_file(path: str, content: bytes) -> None:
+    """Write a file under PRERENDER_ROOT, replacing it atomically so it's never served partially"""
+    file_path = Path(safe_join(settings.PRERENDER_ROOT, path))
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+
+    temp_fd, temp_path = tempfile.mkstemp(dir=file_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(temp_fd, "wb") as f:
+            f.write(content)
+        Path(temp_path).chmod(0o644)
+        Path(temp_path).replace(file_path)
+    except OSError:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+def _delete_file(path: str) -> None:
+    """Delete a file under PRERENDER_ROOT, if it exists"""
+    Path(safe_join(settings.PRERENDER_ROOT, path)).unlink(missing_ok=True)
+
+
+def prerender_page(page: Page) -> bool:
+    """
+    Render a page to its HTML file, returning whether it was rendered.
+
+    Any previous file for the page is removed if its URL has changed, or if it's no longer live.
+    """
+    page = page.specific
+    previous = PrerenderedPage.objects.filter(page_id=page.pk).first()
+
+    path = get_page_prerender_path(page) if is_prerenderable(page) else None
+    content = render_page(page) if path else None
+
+    if previous and (content is None or previous.path != path):
+        _delete_file(previous.path)
+
+    if content is None:
+        if previous:
+            previous.delete()
+        return False
+
+    _write_file(path, content)
+    PrerenderedPage.objects.update_or_create(page_id=page.pk, defaults={"path": path})
+    return True
+
+
+def remove_prerendered_page(page: Page) -> None:
+    """Remove the HTML file of a page"""
+    previous = PrerenderedPage.objects.filter(page_id=page.pk).first()
+    if previous:
+        _delete_file(previous.path)
+        previous.delete()
+
+
+def get_affected_pages(page: Page, include_descendants: bool = False) -> list[Page]:
+    """Return the page and pages depending on it, along with its descendants if requested"""
+    pages = [page.specific]
+    if include_descendants:
+        pages.extend(page.get_descendants().specific())
+
+    dependents = []
+    for affected_page in pages:
+        if isinstance(affected_page, PrerenderedPageMixin):
+            dependents.extend(affected_page.get_prerender_dependents())
+    return pages + dependents
+
+
+def prerender_pages(page_ids: Iterable[int]) -> int:
+    """Render pages by id, returning how many were rendered"""
+    pages = Page.objects.filter(pk__in=set(page_ids)).specific()
+    return sum(prerender_page(page) for page in pages)
+
+
+def schedule_prerender_pages(page_ids: Iterable[int]) -> None:
+    """Render pages by id once the current transaction commits"""
+    if settings.PRERENDER_ENABLED and not _deferred.get():
+        transaction.on_commit(functools.partial(prerender_pages, list(page_ids)))
+
+
+def prerender_affected_pages(page_id: int, include_descendants: bool = False) -> int:
+    """Render a page which has changed, along with the pages depending on it"""
+    page = Page.objects.filter(pk=page_id).first()
+    if page is None:
+        return 0
+
+    # A changed slug moves the URL of every descendant too
+    previous_path = (
+        PrerenderedPage.objects.filter(page_id=page_id).values_list("path", flat=True).first()
+    )
+    if previous_path is not None and previous_path != get_page_prerender_path(page):
+        include_descendants = True
+
+    affected = get_affected_pages(page, include_descendants=include_descendants)
+    return prerender_pages(affected_page.pk for affected_page in affected)
+
+
+def prerender_all_pages() -> int:
+    """Render every live page which can be pre-rendered, removing the files of any others"""
+    rendered = {
+        page.pk
+        for page in Page.objects.live().specific()
+        if isinstance(page, PrerenderedPageMixin) and prerender_page(page)
+    }
+
+    for previous in PrerenderedPage.objects.exclude(page_id__in=rendered):
+        _delete_file(previous.path)
+        previous.delete()
+
+    return len(rendered)
+
+
+def schedule_prerender(page_id: int, include_descendants: bool = False) -> None:
+    """Render a changed page and its dependents once the current transaction commits"""
+    if not settings.PRERENDER_ENABLED or _deferred.get():
+        return
+
+    transaction.on_commit(
+        functools.partial(
+            prerender_affected_pages, page_id, include_descendants=include_descendants
+        )
+    )
+
+
+@contextmanager
+def defer_prerendering() -> Iterator[None]:
+    """
+    Skip rendering pages as they change, such as while importing many pages at once.
+
+    The caller should render all pages afterwards.
+    """
+    token = _deferred.set(True)
+    try:
+        yield
+    finally:
+        _deferred.reset(token)
@@ -0,0 +1,155 @@
+import functools
+import hashlib
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.http import HttpRequest, HttpResponse
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django_redis import get_redis_connection
+from django_redis.cache import RedisCache
+
+RATE_LIMIT_PREFIX = "core:ratelimit"
+
+# Takes a token from a bucket refilled continuously, returning 1 and 0 when one was available,
+# or 0 and the seconds until one will be. Redis' clock is used so every worker agrees.
+RATE_LIMIT_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local refill_rate = tonumber(ARGV[2])
+local clock = redis.call("TIME")
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "updated")
+local tokens = tonumber(bucket[1]) or capacity
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * refill_rate)
+
+local allowed = 0
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    retry_after = (1 - tokens) / refill_rate
+end
+
+redis.call("HSET", KEYS[1], "tokens", tokens, "updated", now)
+redis.call("EXPIRE", KEYS[1], math.ceil(capacity / refill_rate) + 1)
+return {allowed, tostring(retry_after)}
+"""
+
+local_bucket_lock = threading.Lock()
+
+
+@functools.cache
+def get_rate_limit_script():
+    """Return the rate limit script, registered once per process"""
+    return get_redis_connection("default").register_script(RATE_LIMIT_SCRIPT)
+
+
+def take_token(key: str, capacity: int, refill_rate: float) -> float:
+    """
+    Take a token from a bucket, returning 0 if one was available or the seconds until one is.
+
+    Buckets are updated atomically by a Lua script in Redis, or under a lock in the local memory
+    cache used during development.
+    """
+    cache_key = cache.make_key(f"{RATE_LIMIT_PREFIX}:{key}")
+    # The cache proxy isn't an instance of the backend it wraps
+    if isinstance(caches["default"], RedisCache):
+        allowed, retry_after = get_rate_limit_script()(
+            keys=[cache_key], args=[capacity, refill_rate]
+        )
+        return 0 if allowed else float(retry_after)
+
+    with local_bucket_lock:
+        now = time.time()
+        bucket = cache.get(cache_key) or {"tokens": capacity, "updated": now}
+        tokens = min(capacity, bucket["tokens"] + max(0, now - bucket["updated"]) * refill_rate)
+        retry_after = 0 if tokens >= 1 else (1 - tokens) / refill_rate
+        if not retry_after:
+            tokens -= 1
+        cache.set(
+            cache_key,
+            {"tokens": tokens, "updated": now},
+            math.ceil(capacity / refill_rate) + 1,
+        )
+    return retry_after
+
+
+def get_client_ip(request: HttpRequest) -> str:
+    """Return the IP address of the client, trusting the address added by our proxy if any"""
+    if settings.RATE_LIMIT_FORWARDED_FOR:
+        forwarded_for = request.headers.get("X-Forwarded-For", "")
+        if forwarded_for:
+            return forwarded_for.rsplit(",", 1)[-1].strip()
+    return request.META.get("REMOTE_ADDR", "")
+
+
+def get_client_session(request: HttpRequest) -> str | None:
+    """
+    Return a hash identifying the client's session, without loading it from the session store.
+
+    Anonymous visitors don't have a session, so they're identified by their CSRF cookie instead.
+    """
+    cookie = request.COOKIES.get(settings.SESSION_COOKIE_NAME) or request.COOKIES.get(
+        settings.CSRF_COOKIE_NAME
+    )
+    if not cookie:
+        return None
+    return hashlib.sha256(cookie.encode()).hexdigest()
+
+
+def check_rate_limit(request: HttpRequest, scope: str, limits_setting: str) -> HttpResponse | None:
+    """Take a token for a request, returning a 429 response if the client is over the limit"""
+    limit = getattr(settings, limits_setting).get(request.method)
+    if limit is None:
+        return None
+
+    keys = [f"{scope}:{request.method}:ip:{get_client_ip(request)}"]
+    if session := get_client_session(request):
+        keys.append(f"{scope}:{request.method}:session:{session}")
+
+    retry_after = max(take_token(key, limit["capacity"], limit["refill_rate"]) for key in keys)
+    if not retry_after:
+        return None
+
+    response = HttpResponse("Too many requests", status=429)
+    response["Retry-After"] = str(math.ceil(retry_after))
+    return response
+
+
+def rate_limit(scope: str, limits_setting: str):
+    """
+    Decorate a view to limit requests per client IP and session, with a token bucket for each.
+
+    Limits are a dictionary of methods in the named setting, each giving the bucket capacity and
+    tokens refilled per second. Methods without a limit aren't limited. Clients over the limit
+    get a 429 response before the view runs. Both sync and async views can be decorated.
+    """
+
+    def decorator(view):
+        if iscoroutinefunction(view):
+
+            @functools.wraps(view)
+            async def async_wrapped(request, *args, **kwargs):
+                response = await sync_to_async(check_rate_limit)(request, scope, limits_setting)
+                if response is not None:
+                    return response
+                return await view(request, *args, **kwargs)
+
+            return async_wrapped
+
+        @functools.wraps(view)
+        def wrapped(request, *args, **kwargs):
+            response = check_rate_limit(request, scope, limits_setting)
+            if response is not None:
+                return response
+            return view(request, *args, **kwargs)
+
+        return wrapped
+
+    return decorator
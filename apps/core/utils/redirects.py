@@ -0,0 +1,114 @@
+import threading
+import uuid
+from urllib.parse import urlparse
+
+from django.core.cache import cache
+from django.utils.encoding import uri_to_iri
+
+from wagtail.contrib.redirects.models import Redirect
+from wagtail.models import Page
+
+from apps.core.utils.page_urls import get_page_urls
+
+REDIRECT_INDEX_GENERATION_KEY = "core:redirects:generation"
+
+
+def get_redirect_index_generation() -> str:
+    """Return the current generation, which changes whenever redirects or their targets change"""
+    return cache.get_or_set(REDIRECT_INDEX_GENERATION_KEY, uuid.uuid4().hex, None)
+
+
+def invalidate_redirect_index() -> None:
+    """Make every process load redirects from the database again"""
+    cache.set(REDIRECT_INDEX_GENERATION_KEY, uuid.uuid4().hex, None)
+
+
+def load_redirects() -> dict[tuple[int | None, str], tuple[str, bool]]:
+    """
+    Load every redirect, returning their links and whether they're permanent.
+
+    Redirects are keyed by site id, or None for all sites, and normalised old path. Links to
+    pages are resolved in bulk, except for the rare redirects to a routable page's sub route.
+    """
+    redirects = list(
+        Redirect.objects.values_list(
+            "pk",
+            "site_id",
+            "old_path",
+            "redirect_link",
+            "redirect_page_id",
+            "redirect_page_route_path",
+            "is_permanent",
+        ).iterator(chunk_size=2000)
+    )
+
+    page_ids = {page_id for _, _, _, _, page_id, _, _ in redirects if page_id}
+    page_urls = get_page_urls(Page.objects.filter(pk__in=page_ids).only("pk", "url_path"))
+
+    index = {}
+    for pk, site_id, old_path, redirect_link, page_id, route_path, is_permanent in redirects:
+        if page_id and route_path:
+            link = Redirect.objects.get(pk=pk).link
+        elif page_id:
+            link = page_urls.get(page_id)
+        else:
+            link = redirect_link
+        if link:
+            index[site_id, old_path] = (link, is_permanent)
+    return index
+
+
+class RedirectIndex:
+    """
+    Per process index of every redirect, so finding one is a dictionary lookup.
+
+    Redirects are loaded in bulk on first use, or when a worker starts, and loaded again once
+    the generation in the default cache changes.
+    """
+
+    def __init__(self):
+        self.redirects: dict[tuple[int | None, str], tuple[str, bool]] = {}
+        self.generation = None
+        self.lock = threading.Lock()
+
+    def load(self) -> int:
+        """Load every redirect from the database, returning how many there are"""
+        generation = get_redirect_index_generation()
+        redirects = load_redirects()
+        with self.lock:
+            self.redirects = redirects
+            self.generation = generation
+        return len(redirects)
+
+    def get_redirects(self) -> dict[tuple[int | None, str], tuple[str, bool]]:
+        """Return the redirects, loading them again if they've changed"""
+        if self.generation != get_redirect_index_generation():
+            self.load()
+        return self.redirects
+
+    def find(self, site_id: int | None, path: str) -> tuple[str, bool] | None:
+        """
+        Return the link and permanence of the redirect for a normalised path, if any.
+
+        Matches Wagtail's RedirectMiddleware, preferring redirects for the site over those for
+        all sites, and trying the path unencoded and then without its query string.
+        """
+        # Null characters are rejected by Wagtail, as they crash Postgres
+        if "\0" in path:
+            return None
+
+        redirects = self.get_redirects()
+        path_without_query = urlparse(path).path
+        for candidate in (
+            path,
+            uri_to_iri(path),
+            path_without_query,
+            uri_to_iri(path_without_query),
+        ):
+            redirect = redirects.get((site_id, candidate)) or redirects.get((None, candidate))
+            if redirect is not None:
+                return redirect
+        return None
+
+
+redirect_index = RedirectIndex()
@@ -0,0 +1,59 @@
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest
+from django.utils.safestring import SafeString, mark_safe
+
+from wagtail.models import Page
+from wagtail.templatetags.wagtailcore_tags import richtext
+
+RICHTEXT_CACHE_PREFIX = "core:richtext"
+RICHTEXT_VERSION_CACHE_KEY = f"{RICHTEXT_CACHE_PREFIX}:version"
+
+
+def get_richtext_cache_version(request: HttpRequest | None = None) -> str:
+    """
+    Return the current rich text cache version, memoized on the request.
+
+    The version changes whenever any page is published, unpublished or moved, as rich text can
+    link to other pages and their URLs may have changed.
+    """
+    version = getattr(request, "_richtext_cache_version", None)
+    if version is None:
+        version = cache.get_or_set(RICHTEXT_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+        if request is not None:
+            request._richtext_cache_version = version
+    return version
+
+
+def invalidate_richtext_cache() -> None:
+    """Invalidate all cached rich text by moving to a new cache version"""
+    cache.set(RICHTEXT_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+
+
+def render_cached_richtext(
+    page: Page, field_name: str, request: HttpRequest | None = None
+) -> SafeString:
+    """
+    Render a rich text field of a page, caching the expanded HTML for its live revision.
+
+    Previews and pages without a live revision are rendered without the cache, as their field
+    values may not match the live revision.
+    """
+    value = getattr(page, field_name)
+    revision_id = page.live_revision_id
+
+    if revision_id is None or getattr(request, "is_preview", False):
+        return richtext(value)
+
+    version = get_richtext_cache_version(request)
+    cache_key = f"{RICHTEXT_CACHE_PREFIX}:{version}:{page.pk}:{field_name}:{revision_id}"
+
+    html = cache.get(cache_key)
+    if html is None:
+        html = str(richtext(value))
+        cache.set(cache_key, html, settings.RICHTEXT_CACHE_TIMEOUT)
+
+    # Only ever contains HTML previously rendered by the richtext filter
+    return mark_safe(html)  # noqa:S308
@@ -0,0 +1,86 @@
+import threading
+import uuid
+
+from django.core.cache import cache
+from django.http import HttpRequest
+from django.http.request import split_domain_port
+
+from wagtail.models import Site
+from wagtail.models.sites import get_site_for_hostname
+
+SITE_CACHE_GENERATION_KEY = "core:sites:generation"
+
+# Unknown hostnames are cached too, so bound how many are kept
+SITE_CACHE_MAX_HOSTS = 100
+
+
+class SiteResolver:
+    """
+    Per process cache of which Wagtail site serves each hostname and port.
+
+    Field values are cached rather than Site instances, so every request gets its own instance
+    without a query and nothing loaded onto one, such as its root page, is shared between
+    requests. Other processes notice changes through a generation key in the default cache.
+    """
+
+    def __init__(self):
+        self.sites: dict[tuple[str, str], tuple | None] = {}
+        self.generation = None
+        self.lock = threading.Lock()
+
+    def get_site(self, hostname: str, port: str) -> Site | None:
+        """Return the site for a hostname and port, falling back to the default site"""
+        generation = cache.get_or_set(SITE_CACHE_GENERATION_KEY, uuid.uuid4().hex, None)
+        with self.lock:
+            if generation != self.generation:
+                self.sites.clear()
+                self.generation = generation
+            cached = (hostname, port) in self.sites
+            values = self.sites.get((hostname, port))
+
+        if not cached:
+            try:
+                site = get_site_for_hostname(hostname, port)
+            except Site.DoesNotExist:
+                site = None
+            values = None if site is None else tuple(getattr(site, name) for name in self.fields)
+
+            with self.lock:
+                if len(self.sites) >= SITE_CACHE_MAX_HOSTS:
+                    self.sites.clear()
+                self.sites[hostname, port] = values
+
+        return None if values is None else Site.from_db("default", self.fields, values)
+
+    @property
+    def fields(self) -> list[str]:
+        """Return the names of the site fields which are cached"""
+        return [field.attname for field in Site._meta.concrete_fields]
+
+    def clear(self) -> None:
+        """Forget every site cached by this process"""
+        with self.lock:
+            self.sites.clear()
+            self.generation = None
+
+
+site_resolver = SiteResolver()
+
+
+def get_site_for_request(request: HttpRequest) -> Site | None:
+    """
+    Return the Wagtail site serving a request, resolving it at most once per request.
+
+    The site is stored where Site.find_for_request looks for it, so Wagtail shares the result.
+    """
+    if not hasattr(request, "_wagtail_site"):
+        # Matches Site.find_for_request, which also avoids ALLOWED_HOSTS checks
+        hostname = split_domain_port(request._get_raw_host())[0]
+        request._wagtail_site = site_resolver.get_site(hostname, request.get_port())
+    return request._wagtail_site
+
+
+def invalidate_site_cache() -> None:
+    """Make every process resolve sites from the database again"""
+    site_resolver.clear()
+    cache.set(SITE_CACHE_GENERATION_KEY, uuid.uuid4().hex, None)
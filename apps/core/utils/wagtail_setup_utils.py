@@ -185,6 +185,14 @@ class WagtailSetupUtils:
         else:
             return page_instance
 
+    def publish_page_changes(self, page_instance: Page) -> Page:
+        """Save the current field values of an existing page as a new revision and publish it"""
+        revision = page_instance.save_revision()
+        revision.publish()
+
+        self.styled_output(f"Updated and published: {page_instance.title}")
+        return page_instance
+
     def get_parent_page(self) -> Page | None:
         """Get the parent page for the blog (homepage or root)"""
         try:
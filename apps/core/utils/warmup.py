@@ -0,0 +1,139 @@
+import logging
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import caches
+from django.db import DatabaseError, connections
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
+from django.urls import get_resolver
+
+from wagtail import hooks
+from wagtail.models import get_page_models
+
+from apps.core.utils.redirects import redirect_index
+from apps.core.utils.webpack import get_webpack_manifest
+from apps.donations.utils.form_shell import donation_form_shell
+
+logger = logging.getLogger(__name__)
+
+# Templates used by most requests, along with the templates of every page model
+WARM_UP_TEMPLATES = [
+    "base.html",
+    "404.html",
+    "500.html",
+    "donations/fragments/donate_form_fragment.html",
+    "donations/fragments/donate_success_fragment.html",
+    "donations/fragments/donate_totals_fragment.html",
+]
+
+
+def warm_up_urls() -> None:
+    """Import every view and compile every URL pattern"""
+    resolver = get_resolver()
+    resolver.url_patterns  # noqa:B018
+    resolver._populate()
+
+
+def warm_up_templates() -> None:
+    """Compile the common templates and page templates, into the cached loader in production"""
+    page_templates = [model.template for model in get_page_models()]
+    for template_name in [*WARM_UP_TEMPLATES, *page_templates]:
+        try:
+            get_template(template_name)
+        except TemplateDoesNotExist:
+            pass
+
+
+def warm_up_pages() -> None:
+    """Import Wagtail's hooks and cache the content type of every page model"""
+    hooks.search_for_hooks()
+    ContentType.objects.get_for_models(*get_page_models())
+
+
+def warm_up_assets() -> None:
+    """Load the webpack manifest"""
+    manifest_path = Path(settings.BASE_DIR, "static", "dist", "manifest.json")
+    get_webpack_manifest(manifest_path, reload=bool(settings.WEBPACK_MANIFEST_RELOAD)).load()
+
+
+def warm_up() -> dict[str, float]:
+    """
+    Load everything requests would otherwise load lazily, returning the seconds each step took.
+
+    Meant to run before gunicorn forks its workers, so they share the loaded modules, patterns
+    and templates rather than each loading them on their first requests. Warming up only saves
+    time, so a step which fails, such as while the database or Redis is unavailable, is logged
+    and skipped rather than stopping the server from starting.
+    """
+    steps = {
+        "urls": warm_up_urls,
+        "templates": warm_up_templates,
+        "pages": warm_up_pages,
+        "redirects": redirect_index.load,
+        "assets": warm_up_assets,
+        "donation form": donation_form_shell.get_html,
+    }
+
+    timings = {}
+    for name, step in steps.items():
+        started = time.perf_counter()
+        try:
+            step()
+        except Exception:  # noqa:BLE001
+            logger.warning("Skipped warming up %s", name, exc_info=True)
+            continue
+        timings[name] = time.perf_counter() - started
+    return timings
+
+
+def close_connections() -> None:
+    """Close the database and cache connections of this process, before it forks"""
+    for connection in connections.all(initialized_only=True):
+        connection.close()
+        if connection.settings_dict["OPTIONS"].get("pool"):
+            connection.close_pool()
+
+    for cache in caches.all(initialized_only=True):
+        # django-redis only closes its clients when configured to on every request
+        if hasattr(cache, "client"):
+            cache.client.do_close_clients()
+        else:
+            cache.close()
+
+
+def open_connections() -> None:
+    """Open fresh database and cache connections, so a worker's first request doesn't"""
+    try:
+        connections["default"].ensure_connection()
+    except DatabaseError:
+        logger.warning("Couldn't connect to the database", exc_info=True)
+    # Any cache backend error, such as Redis being unavailable, mustn't stop the worker booting
+    try:
+        caches["default"].get("core:warmup")
+    except Exception:  # noqa:BLE001
+        logger.warning("Couldn't connect to the cache", exc_info=True)
+
+
+def get_memory_usage() -> dict[str, float]:
+    """
+    Return the resident and private memory of this process in MiB, on Linux.
+
+    Memory shared with the master process since forking is resident but not private, so the
+    difference shows what copy-on-write is saving.
+    """
+    usage = {}
+    try:
+        with Path("/proc/self/smaps_rollup").open() as smaps:
+            for line in smaps:
+                field, value, *_ = line.split()
+                if field in ("Rss:", "Private_Clean:", "Private_Dirty:"):
+                    usage[field.rstrip(":")] = int(value) / 1024
+    except OSError:
+        return {}
+    return {
+        "rss": usage.get("Rss", 0.0),
+        "private": usage.get("Private_Clean", 0.0) + usage.get("Private_Dirty", 0.0),
+    }
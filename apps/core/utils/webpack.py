@@ -0,0 +1,51 @@
+import functools
+import json
+import threading
+from pathlib import Path
+
+
+class WebpackManifest:
+    """
+    Webpack manifest mapping asset names to hashed filenames, loaded once per process.
+
+    With reload enabled the file is loaded again whenever its modification time changes, so a
+    running webpack watcher is picked up during development.
+    """
+
+    def __init__(self, path: Path, reload: bool = False):
+        self.path = path
+        self.reload = reload
+        self.assets: dict[str, str] | None = None
+        self.mtime: float | None = None
+        self.lock = threading.Lock()
+
+    def get(self, asset_name: str) -> str | None:
+        """Return the hashed filename of an asset, or None if it isn't in the manifest"""
+        if self.assets is None or self.reload:
+            self.load()
+        return self.assets.get(asset_name)
+
+    def load(self) -> None:
+        """Load the manifest, unless it hasn't changed since it was last loaded"""
+        try:
+            mtime = self.path.stat().st_mtime
+        except OSError:
+            mtime = None
+
+        if self.assets is not None and mtime == self.mtime:
+            return
+
+        with self.lock:
+            try:
+                with self.path.open() as f:
+                    assets = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                assets = {}
+            self.assets = assets
+            self.mtime = mtime
+
+
+@functools.cache
+def get_webpack_manifest(path: Path, reload: bool = False) -> WebpackManifest:
+    """Return the manifest for a path, shared by the whole process"""
+    return WebpackManifest(path, reload=reload)
@@ -1,11 +1,14 @@
 import os
 
-from django.http import HttpRequest, HttpResponseServerError
+from django.http import HttpRequest, HttpResponse, HttpResponseServerError
 from django.template import TemplateDoesNotExist, loader
 from django.template.response import TemplateResponse
 from django.views.decorators.csrf import requires_csrf_token
 
 from sentry_sdk import last_event_id
+from wagtail.views import serve
+
+from apps.core.utils.page_routes import get_cached_route
 
 ERROR_500_TEMPLATE_NAME = "500.html"
 
@@ -33,3 +36,13 @@ def server_error(
             }
         )
     )
+
+
+def serve_page(request: HttpRequest, path: str) -> HttpResponse:
+    """
+    Serve a Wagtail page, routing the request through the route cache.
+
+    Wagtail reuses a route stored on the request, so this only replaces the tree walk.
+    """
+    request._wagtail_route_for_request = get_cached_route(request, path)
+    return serve(request, path)
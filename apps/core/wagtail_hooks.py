@@ -0,0 +1,10 @@
+from wagtail import hooks
+
+from apps.core.mixins import CachedPageMixin
+
+
+@hooks.register("before_serve_page")
+def mark_page_cacheable(page, request, serve_args, serve_kwargs):
+    """Allow responses from pages which render the same for every anonymous visitor to be cached"""
+    if isinstance(page, CachedPageMixin) and not getattr(request, "is_preview", False):
+        request.page_cacheable = True
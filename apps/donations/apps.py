@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class DonationsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.donations"
+
+    def ready(self):
+        from apps.donations import signals  # noqa:F401,PLC0415
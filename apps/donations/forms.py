@@ -1,6 +1,7 @@
 from django import forms
 
 from apps.donations.models import Donation
+from apps.donations.utils.reports import REPORT_PERIODS
 
 
 class DonationForm(forms.ModelForm):
@@ -19,3 +20,11 @@ class DonationForm(forms.ModelForm):
             ),
         }
         labels = {"name": "Your Name", "amount": "Donation Amount (£)"}
+
+
+class DonationReportForm(forms.Form):
+    start = forms.DateField(required=False)
+    end = forms.DateField(required=False)
+    period = forms.ChoiceField(
+        choices=[(period, period.title()) for period in REPORT_PERIODS], required=False
+    )
@@ -0,0 +1,26 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.core.utils import WagtailSetupUtils
+from apps.donations.utils.partitions import create_future_partitions
+
+
+class Command(BaseCommand):
+    help = "Create the monthly donation partitions for this month and the months ahead"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--months", type=int, default=settings.DONATION_PARTITION_MONTHS_AHEAD)
+
+    def handle(self, *args, **options):
+        utils = WagtailSetupUtils(self)
+        started = time.perf_counter()
+
+        created = create_future_partitions(options["months"])
+
+        utils.styled_output(
+            f"Created {len(created)} donation partitions in {time.perf_counter() - started:.2f}s"
+        )
+        for name in created:
+            utils.styled_output(f"  {name}")
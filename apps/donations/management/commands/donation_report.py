@@ -0,0 +1,37 @@
+import datetime
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from apps.donations.utils.reports import (
+    REPORT_PERIODS,
+    get_report_queryset,
+    iter_donation_csv,
+    iter_period_aggregates_csv,
+)
+
+
+class Command(BaseCommand):
+    help = "Write donations, or their aggregates for each period, as CSV"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--start", type=datetime.date.fromisoformat, help="YYYY-MM-DD")
+        parser.add_argument("--end", type=datetime.date.fromisoformat, help="YYYY-MM-DD")
+        parser.add_argument(
+            "--period", choices=REPORT_PERIODS, help="Aggregate donations for each period"
+        )
+        parser.add_argument("--output", help="File to write to, rather than standard output")
+
+    def handle(self, *args, **options):
+        queryset = get_report_queryset(options["start"], options["end"])
+        if options["period"]:
+            rows = iter_period_aggregates_csv(queryset, options["period"])
+        else:
+            rows = iter_donation_csv(queryset)
+
+        if options["output"]:
+            with Path(options["output"]).open("w", newline="") as output:
+                output.writelines(rows)
+        else:
+            for row in rows:
+                self.stdout.write(row, ending="")
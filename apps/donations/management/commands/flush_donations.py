@@ -0,0 +1,69 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.utils import WagtailSetupUtils
+from apps.donations.utils.idempotency import purge_idempotency_keys
+from apps.donations.utils.write_behind import flush_donations, get_write_behind_lag
+
+
+class Command(BaseCommand):
+    help = "Save donations staged in write-behind mode in batches, until stopped"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=settings.DONATION_FLUSH_BATCH_SIZE)
+        parser.add_argument("--interval", type=float, default=settings.DONATION_FLUSH_INTERVAL)
+        parser.add_argument(
+            "--once", action="store_true", help="Flush every staged donation then exit"
+        )
+        parser.add_argument(
+            "--status", action="store_true", help="Report how far the flush is behind then exit"
+        )
+
+    def handle(self, *args, **options):
+        utils = WagtailSetupUtils(self)
+
+        if options["status"]:
+            lag = get_write_behind_lag()
+            message = (
+                f"{lag['pending']} donations totalling £{lag['amount']} pending, "
+                f"oldest {lag['oldest_age']:.1f}s"
+            )
+            if lag["oldest_age"] > settings.DONATION_WRITE_BEHIND_MAX_LAG:
+                raise CommandError(message)
+            utils.styled_output(message)
+            return
+
+        purged_at = None
+        while True:
+            started = time.perf_counter()
+            flushed = flush_donations(options["batch_size"])
+
+            if flushed:
+                lag = get_write_behind_lag()
+                utils.styled_output(
+                    f"Flushed {flushed} donations in {time.perf_counter() - started:.2f}s, "
+                    f"{lag['pending']} pending, oldest {lag['oldest_age']:.1f}s",
+                    style=(
+                        "WARNING"
+                        if lag["oldest_age"] > settings.DONATION_WRITE_BEHIND_MAX_LAG
+                        else "SUCCESS"
+                    ),
+                )
+
+            # Purge expired idempotency keys now and then, as the flush runs throughout appeals
+            if (
+                purged_at is None
+                or started - purged_at > settings.DONATION_IDEMPOTENCY_PURGE_INTERVAL
+            ):
+                purged = purge_idempotency_keys()
+                purged_at = started
+                if purged:
+                    utils.styled_output(f"Purged {purged} expired idempotency keys")
+
+            # Keep going without pausing while there's a backlog
+            if flushed < options["batch_size"]:
+                if options["once"]:
+                    return
+                time.sleep(options["interval"])
@@ -0,0 +1,20 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.core.utils import WagtailSetupUtils
+from apps.donations.utils.idempotency import purge_idempotency_keys
+
+
+class Command(BaseCommand):
+    help = "Delete saved idempotency keys older than DONATION_IDEMPOTENCY_TIMEOUT"
+
+    def handle(self, *args, **options):
+        utils = WagtailSetupUtils(self)
+        started = time.perf_counter()
+
+        purged = purge_idempotency_keys()
+
+        utils.styled_output(
+            f"Purged {purged} expired idempotency keys in {time.perf_counter() - started:.2f}s"
+        )
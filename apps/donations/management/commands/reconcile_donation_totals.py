@@ -0,0 +1,21 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.core.utils import WagtailSetupUtils
+from apps.donations.utils.totals import reconcile_donation_totals
+
+
+class Command(BaseCommand):
+    help = "Recompute the running donation totals from every donation"
+
+    def handle(self, *args, **options):
+        utils = WagtailSetupUtils(self)
+        started = time.perf_counter()
+
+        totals = reconcile_donation_totals()
+
+        utils.styled_output(
+            f"Reconciled {totals['donation_count']} donations totalling "
+            f"£{totals['amount_total']} in {time.perf_counter() - started:.2f}s"
+        )
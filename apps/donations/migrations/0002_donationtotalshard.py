@@ -0,0 +1,48 @@
+# Generated by Django 5.2.6 on 2026-10-19 18:19
+
+from decimal import Decimal
+from django.db import migrations, models
+
+
+def seed_donation_totals(apps, schema_editor):
+    Donation = apps.get_model("donations", "Donation")
+    DonationTotalShard = apps.get_model("donations", "DonationTotalShard")
+    totals = Donation.objects.aggregate(
+        donation_count=models.Count("pk"), amount_total=models.Sum("amount")
+    )
+    DonationTotalShard.objects.create(
+        shard=0,
+        donation_count=totals["donation_count"],
+        amount_total=totals["amount_total"] or Decimal("0.00"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("donations", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DonationTotalShard",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("shard", models.PositiveSmallIntegerField(unique=True)),
+                ("donation_count", models.PositiveBigIntegerField(default=0)),
+                (
+                    "amount_total",
+                    models.DecimalField(decimal_places=2, default=Decimal("0.00"), max_digits=14),
+                ),
+            ],
+            options={
+                "ordering": ["shard"],
+            },
+        ),
+        migrations.RunPython(seed_donation_totals, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.6 on 2026-10-19 18:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("donations", "0002_donationtotalshard"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="donation",
+            name="idempotency_key",
+            field=models.CharField(
+                blank=True, editable=False, max_length=255, null=True, unique=True
+            ),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.6 on 2026-10-19 18:28
+
+from django.db import migrations, models
+
+
+def copy_idempotency_keys(apps, schema_editor):
+    Donation = apps.get_model("donations", "Donation")
+    DonationIdempotencyKey = apps.get_model("donations", "DonationIdempotencyKey")
+    DonationIdempotencyKey.objects.bulk_create(
+        DonationIdempotencyKey(
+            key=donation.idempotency_key,
+            donation_id=donation.pk,
+            donation_created_at=donation.created_at,
+        )
+        for donation in Donation.objects.exclude(idempotency_key=None).iterator()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("donations", "0004_pendingdonation"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DonationIdempotencyKey",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("key", models.CharField(max_length=255, unique=True)),
+                ("donation_id", models.BigIntegerField()),
+                ("donation_created_at", models.DateTimeField()),
+            ],
+        ),
+        migrations.RunPython(copy_idempotency_keys, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name="donation",
+            name="idempotency_key",
+        ),
+    ]
@@ -0,0 +1,157 @@
+import datetime
+
+from django.db import migrations, models, transaction
+
+MONTHS_AHEAD = 3
+
+# Donations copied to the partitioned table per transaction, by range of id
+COPY_BATCH_SIZE = 10000
+
+MIRROR_FUNCTION = """
+CREATE FUNCTION donations_donation_mirror() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO donations_donation_partitioned (id, name, amount, created_at)
+        VALUES (NEW.id, NEW.name, NEW.amount, NEW.created_at) ON CONFLICT DO NOTHING;
+    ELSIF TG_OP = 'UPDATE' THEN
+        UPDATE donations_donation_partitioned
+        SET name = NEW.name, amount = NEW.amount, created_at = NEW.created_at
+        WHERE id = OLD.id AND created_at = OLD.created_at;
+    ELSE
+        DELETE FROM donations_donation_partitioned
+        WHERE id = OLD.id AND created_at = OLD.created_at;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+
+def add_months(month, months):
+    index = month.year * 12 + month.month - 1 + months
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def partition_donations(apps, schema_editor):
+    """
+    Replace the donations table with one partitioned by month of created_at.
+
+    Partitions are created for every month with donations up to a few months ahead. Donations
+    are copied across with their ids in batches, each in its own transaction, while a trigger
+    mirrors donations saved, changed or deleted meanwhile. The tables are only locked to swap
+    them once the copy has caught up, so donations keep being saved during the copy. Postgres 15
+    can't partition a table with an identity column, so ids come from a sequence instead.
+
+    The migration isn't atomic, so a failed copy leaves the original table in place and can be
+    run again.
+    """
+    execute = schema_editor.execute
+    alias = schema_editor.connection.alias
+
+    # Left behind by an earlier failed run
+    execute("DROP TABLE IF EXISTS donations_donation_partitioned")
+    execute("DROP FUNCTION IF EXISTS donations_donation_mirror() CASCADE")
+    execute("DROP SEQUENCE IF EXISTS donations_donation_pk_seq")
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT min(created_at) FROM donations_donation")
+        oldest = cursor.fetchone()[0]
+
+    this_month = datetime.datetime.now(tz=datetime.UTC).date().replace(day=1)
+    month = oldest.astimezone(datetime.UTC).date().replace(day=1) if oldest else this_month
+
+    with transaction.atomic(using=alias):
+        execute("CREATE SEQUENCE donations_donation_pk_seq AS bigint")
+        execute(
+            "CREATE TABLE donations_donation_partitioned ("
+            "id bigint NOT NULL DEFAULT nextval('donations_donation_pk_seq'), "
+            "name varchar(100) NOT NULL, "
+            "amount numeric(10, 2) NOT NULL, "
+            "created_at timestamp with time zone NOT NULL, "
+            "PRIMARY KEY (id, created_at)"
+            ") PARTITION BY RANGE (created_at)"
+        )
+        # Indexed while empty, rather than blocking donations while every partition is indexed
+        execute(
+            "CREATE INDEX donation_created_at_idx "
+            "ON donations_donation_partitioned (created_at, id)"
+        )
+        execute(
+            "CREATE TABLE donations_donation_default "
+            "PARTITION OF donations_donation_partitioned DEFAULT"
+        )
+        while month <= add_months(this_month, MONTHS_AHEAD):
+            next_month = add_months(month, 1)
+            execute(
+                f"CREATE TABLE donations_donation_y{month.year}m{month.month:02d} "
+                "PARTITION OF donations_donation_partitioned "
+                f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+                f"TO ('{next_month.isoformat()} 00:00:00+00')"
+            )
+            month = next_month
+
+        # Waits for donations being saved to commit, so each is either mirrored or copied
+        execute(MIRROR_FUNCTION)
+        execute(
+            "CREATE TRIGGER donations_donation_mirror "
+            "AFTER INSERT OR UPDATE OR DELETE ON donations_donation "
+            "FOR EACH ROW EXECUTE FUNCTION donations_donation_mirror()"
+        )
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT COALESCE(max(id), 0) FROM donations_donation")
+        max_id = cursor.fetchone()[0]
+
+    # Rows are locked while copied, so changes to them are mirrored after the copy commits
+    for batch_start in range(0, max_id, COPY_BATCH_SIZE):
+        with transaction.atomic(using=alias):
+            execute(
+                "WITH batch AS ("
+                "SELECT id, name, amount, created_at FROM donations_donation "
+                "WHERE id > %s AND id <= %s FOR SHARE"
+                ") "
+                "INSERT INTO donations_donation_partitioned (id, name, amount, created_at) "
+                "SELECT id, name, amount, created_at FROM batch ON CONFLICT DO NOTHING",
+                [batch_start, batch_start + COPY_BATCH_SIZE],
+            )
+
+    with transaction.atomic(using=alias):
+        execute("LOCK TABLE donations_donation IN ACCESS EXCLUSIVE MODE")
+        execute(
+            "SELECT setval('donations_donation_pk_seq', "
+            "COALESCE((SELECT max(id) FROM donations_donation), 0) + 1, false)"
+        )
+        execute("DROP TABLE donations_donation")
+        execute("DROP FUNCTION donations_donation_mirror()")
+        execute("ALTER TABLE donations_donation_partitioned RENAME TO donations_donation")
+        execute(
+            "ALTER TABLE donations_donation "
+            "RENAME CONSTRAINT donations_donation_partitioned_pkey TO donations_donation_pkey"
+        )
+        execute("ALTER SEQUENCE donations_donation_pk_seq OWNED BY donations_donation.id")
+
+
+class Migration(migrations.Migration):
+
+    # Donations are copied in batches, see partition_donations
+    atomic = False
+
+    dependencies = [
+        ("donations", "0005_donationidempotencykey"),
+    ]
+
+    operations = [
+        # The partitioned table works the same with earlier migrations, so isn't reverted
+        migrations.RunPython(partition_donations, migrations.RunPython.noop),
+        # The index is created along with the partitioned table
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(
+                    model_name="donation",
+                    index=models.Index(
+                        fields=["created_at", "id"], name="donation_created_at_idx"
+                    ),
+                ),
+            ],
+        ),
+    ]
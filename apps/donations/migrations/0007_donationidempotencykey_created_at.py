@@ -0,0 +1,22 @@
+# Generated by Django 5.2.6 on 2026-10-19 19:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("donations", "0006_partition_donation"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="donationidempotencykey",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True, db_index=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-19 21:10
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("donations", "0007_donationidempotencykey_created_at"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="donation",
+            name="created_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
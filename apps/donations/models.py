@@ -2,17 +2,86 @@ from decimal import Decimal
 
 from django.core.validators import MinValueValidator
 from django.db import models
+from django.utils import timezone
 
 
 class Donation(models.Model):
+    """
+    Donation made through the donation form.
+
+    The table is partitioned by month of created_at, see apps.donations.utils.partitions, so its
+    primary key in the database is (id, created_at) and it can't hold other unique constraints.
+    """
+
     name = models.CharField(max_length=100)
     amount = models.DecimalField(
         max_digits=10, decimal_places=2, validators=[MinValueValidator(Decimal("0.01"))]
     )
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [models.Index(fields=["created_at", "id"], name="donation_created_at_idx")]
+
+    def __str__(self):
+        return f"{self.name} - ${self.amount}"
+
+
+class DonationIdempotencyKey(models.Model):
+    """
+    Idempotency key sent with a saved donation, so a repeated POST can't save it twice.
+
+    Kept apart from the partitioned donations table, which can't enforce a unique key alone.
+    Keys are purged once older than DONATION_IDEMPOTENCY_TIMEOUT, see
+    apps.donations.utils.idempotency.
+    """
+
+    key = models.CharField(max_length=255, unique=True)
+    donation_id = models.BigIntegerField()
+    donation_created_at = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def __str__(self):
+        return self.key
+
+    def get_donation(self) -> Donation:
+        """Return the donation saved with the key, looked up within its partition"""
+        return Donation.objects.get(pk=self.donation_id, created_at=self.donation_created_at)
+
+
+class DonationTotalShard(models.Model):
+    """
+    One of several rows holding running donation totals, see apps.donations.utils.totals.
+
+    Each donation is added to a random shard, so concurrent donations rarely wait on the same
+    row lock, and the totals are the sum of every shard.
+    """
+
+    shard = models.PositiveSmallIntegerField(unique=True)
+    donation_count = models.PositiveBigIntegerField(default=0)
+    amount_total = models.DecimalField(max_digits=14, decimal_places=2, default=Decimal("0.00"))
+
+    class Meta:
+        ordering = ["shard"]
+
+    def __str__(self):
+        return f"Shard {self.shard}"
+
+
+class PendingDonation(models.Model):
+    """
+    Donation accepted in write-behind mode but not yet saved, see apps.donations.utils.write_behind
+    """
+
+    name = models.CharField(max_length=100)
+    amount = models.DecimalField(max_digits=10, decimal_places=2)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    idempotency_key = models.CharField(
+        max_length=255, unique=True, null=True, blank=True, editable=False
+    )
+
+    class Meta:
+        ordering = ["pk"]
 
     def __str__(self):
         return f"{self.name} - ${self.amount}"
@@ -0,0 +1,16 @@
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.donations.models import Donation
+from apps.donations.utils.ticker import notify_donations
+
+
+@receiver(post_save, sender=Donation)
+def notify_donation_ticker(sender, instance, created, **kwargs):
+    """Push new donations to open tickers once their totals have been committed"""
+    if created and settings.DONATION_TICKER_ENABLED:
+        transaction.on_commit(partial(notify_donations, 1, instance.amount))
@@ -1,8 +1,14 @@
 from decimal import Decimal
+from django.conf import settings
+from django.core.cache import cache
 from django.test import TestCase, RequestFactory
 from django.http import Http404
+from django.urls import reverse
+
+from asgiref.sync import async_to_sync
 
 from apps.donations.models import Donation
+from apps.donations.utils.totals import get_donation_totals
 from apps.donations.views import donation_view
 
 
@@ -14,19 +20,19 @@ class DonationViewsTestCase(TestCase):
         """Test that view returns 404 without HTMX header"""
         request = self.factory.get("/")
         with self.assertRaises(Http404):
-            donation_view(request)
+            async_to_sync(donation_view)(request)
 
     def test_donation_view_with_htmx(self):
         """Test that view works with HTMX header"""
         request = self.factory.get("/", HTTP_HX_REQUEST="true")
-        response = donation_view(request)
+        response = async_to_sync(donation_view)(request)
         self.assertEqual(response.status_code, 200)
 
     def test_donation_post_valid_data(self):
         """Test POST request with valid form data"""
         data = {"name": "Test Donor", "amount": "25.50"}
         request = self.factory.post("/", data, HTTP_HX_REQUEST="true")
-        response = donation_view(request)
+        response = async_to_sync(donation_view)(request)
         self.assertEqual(response.status_code, 200)
 
         # Verify donation was created
@@ -37,8 +43,55 @@ class DonationViewsTestCase(TestCase):
         """Test POST request with invalid form data"""
         data = {"name": "", "amount": "0.00"}
         request = self.factory.post("/", data, HTTP_HX_REQUEST="true")
-        response = donation_view(request)
+        response = async_to_sync(donation_view)(request)
         self.assertEqual(response.status_code, 200)
 
         # Verify no donation was created
         self.assertEqual(Donation.objects.count(), 0)
+
+    def test_donation_fragment_issues_csrf_token(self):
+        """Test the form fragment sets the CSRF cookie and isn't cached"""
+        response = self.client.get(reverse("donate"), headers={"HX-Request": "true"})
+        self.assertIn(settings.CSRF_COOKIE_NAME, response.cookies)
+        self.assertContains(response, "csrfmiddlewaretoken")
+        self.assertIn("no-store", response["Cache-Control"])
+
+    def test_donation_post_updates_totals(self):
+        """Test a valid donation is added to the totals shown in the success fragment"""
+        data = {"name": "Test Donor", "amount": "25.50"}
+        response = self.client.post(reverse("donate"), data, headers={"HX-Request": "true"})
+        self.assertContains(response, "£25.50 from 1 donation")
+        self.assertEqual(get_donation_totals()["donation_count"], 1)
+
+    def test_donation_post_idempotency_key(self):
+        """Test repeating a POST with the same idempotency key only saves one donation"""
+        cache.clear()
+        data = {"name": "Test Donor", "amount": "25.50"}
+        headers = {"HX-Request": "true", "Idempotency-Key": "donation-key"}
+        first = self.client.post(reverse("donate"), data, headers=headers)
+        repeat = self.client.post(reverse("donate"), data, headers=headers)
+
+        self.assertEqual(Donation.objects.count(), 1)
+        self.assertEqual(get_donation_totals()["donation_count"], 1)
+        self.assertEqual(repeat.content, first.content)
+        self.assertEqual(repeat["Idempotent-Replayed"], "true")
+
+    def test_donation_post_idempotency_key_not_cached(self):
+        """Test the unique constraint catches a repeated key whose response isn't cached"""
+        cache.clear()
+        data = {"name": "Test Donor", "amount": "25.50"}
+        headers = {"HX-Request": "true", "Idempotency-Key": "donation-key"}
+        self.client.post(reverse("donate"), data, headers=headers)
+        cache.clear()
+        response = self.client.post(reverse("donate"), data, headers=headers)
+
+        self.assertContains(response, "Thank you")
+        self.assertEqual(Donation.objects.count(), 1)
+
+    def test_donation_post_idempotency_key_too_long(self):
+        """Test an overly long idempotency key is rejected"""
+        data = {"name": "Test Donor", "amount": "25.50"}
+        headers = {"HX-Request": "true", "Idempotency-Key": "x" * 256}
+        response = self.client.post(reverse("donate"), data, headers=headers)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Donation.objects.count(), 0)
@@ -0,0 +1,35 @@
+from decimal import Decimal
+from unittest import mock
+
+from django.test import RequestFactory, SimpleTestCase
+
+from apps.donations.forms import DonationForm
+from apps.donations.utils.form_shell import DonationFormShell
+
+TOTALS = {"donation_count": 2, "amount_total": Decimal("5.00")}
+
+
+class DonationFormShellTestCase(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.shell = DonationFormShell()
+
+    def test_render(self):
+        """Test the request's values replace the placeholders"""
+        request = self.factory.get("/")
+        html = self.shell.render(request, TOTALS, "idempotency-key")
+
+        self.assertIn('name="csrfmiddlewaretoken"', html)
+        self.assertIn("CSRF_COOKIE", request.META)
+        self.assertIn('"Idempotency-Key": "idempotency-key"', html)
+        self.assertIn("£5.00 raised from 2 donations", html)
+        self.assertNotIn("__donation_", html)
+
+    def test_rendered_once(self):
+        """Test the form is only rendered on first use"""
+        with mock.patch(
+            "apps.donations.utils.form_shell.DonationForm", wraps=DonationForm
+        ) as form:
+            self.shell.render(self.factory.get("/"), TOTALS, "first")
+            self.shell.render(self.factory.get("/"), TOTALS, "second")
+        form.assert_called_once()
@@ -0,0 +1,43 @@
+import datetime
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.donations.models import Donation, DonationIdempotencyKey
+from apps.donations.utils.idempotency import purge_idempotency_keys
+
+
+@override_settings(DONATION_IDEMPOTENCY_TIMEOUT=60)
+class PurgeIdempotencyKeysTestCase(TestCase):
+    def create_key(self, key):
+        donation = Donation.objects.create(name="Donor", amount=Decimal("10.00"))
+        return DonationIdempotencyKey.objects.create(
+            key=key, donation_id=donation.pk, donation_created_at=donation.created_at
+        )
+
+    def test_purge_expired_keys(self):
+        """Test only keys older than the idempotency timeout are purged"""
+        self.create_key("current")
+        expired = self.create_key("expired")
+        DonationIdempotencyKey.objects.filter(pk=expired.pk).update(
+            created_at=timezone.now() - datetime.timedelta(seconds=120)
+        )
+
+        self.assertEqual(purge_idempotency_keys(), 1)
+        self.assertEqual(
+            list(DonationIdempotencyKey.objects.values_list("key", flat=True)), ["current"]
+        )
+
+    def test_purge_command(self):
+        """Test the management command purges expired keys"""
+        expired = self.create_key("expired")
+        DonationIdempotencyKey.objects.filter(pk=expired.pk).update(
+            created_at=timezone.now() - datetime.timedelta(seconds=120)
+        )
+
+        call_command("purge_idempotency_keys", stdout=StringIO())
+
+        self.assertFalse(DonationIdempotencyKey.objects.exists())
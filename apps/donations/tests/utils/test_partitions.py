@@ -0,0 +1,46 @@
+import datetime
+from decimal import Decimal
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+
+from apps.donations.models import Donation
+from apps.donations.utils.partitions import (
+    add_months,
+    create_future_partitions,
+    create_partition,
+    get_partition_name,
+)
+
+
+class PartitionNamesTestCase(SimpleTestCase):
+    def test_add_months(self):
+        """Test months are added across years"""
+        self.assertEqual(add_months(datetime.date(2025, 11, 1), 3), datetime.date(2026, 2, 1))
+
+    def test_get_partition_name(self):
+        """Test partitions are named after their month"""
+        self.assertEqual(
+            get_partition_name(datetime.date(2026, 3, 1)), "donations_donation_y2026m03"
+        )
+
+
+class PartitionsTestCase(TestCase):
+    def test_existing_partitions(self):
+        """Test partitions for this month and the months ahead already exist"""
+        self.assertEqual(create_future_partitions(months_ahead=3), [])
+
+    def test_create_partition_moves_default_rows(self):
+        """Test donations in the default partition are moved into a new month's partition"""
+        month = datetime.date(2040, 1, 1)
+        created_at = datetime.datetime(2040, 1, 15, tzinfo=datetime.UTC)
+        donation = Donation.objects.create(name="Donor", amount=Decimal("10.00"))
+        Donation.objects.filter(pk=donation.pk).update(created_at=created_at)
+
+        self.assertTrue(create_partition(month))
+        self.assertFalse(create_partition(month))
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT id FROM {get_partition_name(month)}")  # noqa:S608
+            self.assertEqual(cursor.fetchall(), [(donation.pk,)])
+        self.assertEqual(Donation.objects.get(pk=donation.pk).created_at, created_at)
@@ -0,0 +1,98 @@
+import datetime
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.accounts.tests.factories import UserFactory
+from apps.donations.models import Donation
+from apps.donations.utils.reports import (
+    aiter_lines,
+    escape_csv_cell,
+    get_period_aggregates,
+    get_report_queryset,
+    iter_donation_csv,
+    iter_donations,
+)
+
+
+class DonationReportsTestCase(TestCase):
+    def setUp(self):
+        for day, amount in ((1, "10.00"), (1, "20.00"), (2, "30.00"), (40, "5.00")):
+            donation = Donation.objects.create(name="Donor", amount=Decimal(amount))
+            created_at = datetime.datetime(2025, 1, 1, 12, tzinfo=datetime.UTC)
+            Donation.objects.filter(pk=donation.pk).update(
+                created_at=created_at + datetime.timedelta(days=day - 1)
+            )
+
+    def test_iter_donations(self):
+        """Test every donation is yielded in order across batches"""
+        donations = list(iter_donations(get_report_queryset(), batch_size=3))
+        self.assertEqual(
+            [amount for _, _, _, amount in donations],
+            [Decimal("10.00"), Decimal("20.00"), Decimal("30.00"), Decimal("5.00")],
+        )
+
+    def test_iter_donations_same_created_at(self):
+        """Test donations made at the same moment aren't skipped between batches"""
+        Donation.objects.update(created_at=datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC))
+
+        donations = list(iter_donations(get_report_queryset(), batch_size=1))
+        self.assertEqual(len(donations), 4)
+
+    async def test_aiter_lines(self):
+        """Test lines are yielded to ASGI responses in chunks"""
+        chunks = [chunk async for chunk in aiter_lines(iter(["a\n", "b\n", "c\n"]), 2)]
+        self.assertEqual(chunks, ["a\nb\n", "c\n"])
+
+    def test_escape_csv_cell(self):
+        """Test cells which would run as a formula are prefixed, and others kept"""
+        self.assertEqual(escape_csv_cell('=HYPERLINK("x")'), '\'=HYPERLINK("x")')
+        self.assertEqual(escape_csv_cell("@SUM(A1)"), "'@SUM(A1)")
+        self.assertEqual(escape_csv_cell("-1"), "'-1")
+        self.assertEqual(escape_csv_cell("Donor"), "Donor")
+
+    def test_donation_csv_escapes_names(self):
+        """Test donor names can't inject formulas into the CSV"""
+        Donation.objects.update(name="=1+1")
+
+        lines = list(iter_donation_csv(get_report_queryset()))
+        self.assertTrue(all(",'=1+1," in line for line in lines[1:]))
+
+    def test_report_dates(self):
+        """Test donations are limited to the dates given, inclusive"""
+        queryset = get_report_queryset(datetime.date(2025, 1, 2), datetime.date(2025, 1, 2))
+        self.assertEqual(list(queryset.values_list("amount", flat=True)), [Decimal("30.00")])
+
+    def test_period_aggregates(self):
+        """Test donations are aggregated by month"""
+        january, february = get_period_aggregates(get_report_queryset(), "month")
+        self.assertEqual(january["count"], 3)
+        self.assertEqual(january["total"], Decimal("60.00"))
+        self.assertEqual(january["mean"], Decimal("20.00"))
+        self.assertEqual(january["p50"], 20.0)
+        self.assertEqual(february["count"], 1)
+
+    def test_report_command(self):
+        """Test the management command writes donations as CSV"""
+        stdout = StringIO()
+        call_command("donation_report", "--period", "day", stdout=stdout)
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(lines[0], "period,count,total,mean,p50,p90,p99")
+        self.assertEqual(len(lines), 4)
+
+    def test_report_view_staff_only(self):
+        """Test the report endpoint is only for staff"""
+        self.client.force_login(UserFactory(is_staff=False))
+        response = self.client.get(reverse("donation_report"))
+        self.assertEqual(response.status_code, 302)
+
+    def test_report_view(self):
+        """Test the report endpoint streams donations as CSV"""
+        self.client.force_login(UserFactory(is_staff=True))
+        response = self.client.get(reverse("donation_report"), {"start": "2025-01-01"})
+        content = b"".join(response.streaming_content).decode()
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertEqual(len(content.splitlines()), 5)
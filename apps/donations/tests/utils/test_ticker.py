@@ -0,0 +1,48 @@
+import asyncio
+from decimal import Decimal
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from apps.donations.models import Donation
+from apps.donations.utils.ticker import DonationTicker, format_event
+
+
+class DonationTickerTestCase(SimpleTestCase):
+    def test_format_event(self):
+        """Test events are formatted as server-sent events"""
+        self.assertEqual(format_event("totals", "{}"), "event: totals\ndata: {}\n\n")
+
+    @override_settings(DONATION_TICKER_QUEUE_SIZE=1)
+    def test_broadcast_skips_full_queues(self):
+        """Test a slow subscriber doesn't stop others receiving payloads"""
+        ticker = DonationTicker()
+        slow = asyncio.Queue(maxsize=1)
+        slow.put_nowait("old")
+        fast = asyncio.Queue(maxsize=1)
+        ticker.subscribers.update({slow, fast})
+
+        ticker.broadcast("new")
+
+        self.assertEqual(slow.get_nowait(), "old")
+        self.assertEqual(fast.get_nowait(), "new")
+
+
+class DonationTickerSignalTestCase(TestCase):
+    @override_settings(DONATION_TICKER_ENABLED=True)
+    def test_donation_notifies_on_commit(self):
+        """Test saving a donation notifies the ticker once committed"""
+        with (
+            mock.patch("apps.donations.signals.notify_donations") as notify_donations,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            donation = Donation.objects.create(name="Donor", amount=Decimal("5.00"))
+            notify_donations.assert_not_called()
+
+        notify_donations.assert_called_once_with(1, donation.amount)
+
+    def test_ticker_disabled(self):
+        """Test the ticker endpoint doesn't exist while disabled"""
+        response = self.client.get(reverse("donation_ticker"))
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,54 @@
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from apps.donations.models import Donation, DonationTotalShard
+from apps.donations.utils.totals import (
+    get_donation_totals,
+    reconcile_donation_totals,
+    record_donation,
+)
+
+
+@override_settings(DONATION_TOTAL_SHARDS=4)
+class DonationTotalsTestCase(TestCase):
+    def test_record_donation(self):
+        """Test donations are added to the totals"""
+        for amount in ("10.00", "2.50", "7.25"):
+            record_donation(Donation.objects.create(name="Donor", amount=Decimal(amount)))
+
+        totals = get_donation_totals()
+        self.assertEqual(totals["donation_count"], 3)
+        self.assertEqual(totals["amount_total"], Decimal("19.75"))
+        self.assertLessEqual(DonationTotalShard.objects.count(), 4)
+
+    def test_totals_without_donations(self):
+        """Test the totals are zero before any donation"""
+        DonationTotalShard.objects.all().delete()
+        self.assertEqual(
+            get_donation_totals(), {"donation_count": 0, "amount_total": Decimal("0.00")}
+        )
+
+    def test_reconcile_donation_totals(self):
+        """Test the totals are recomputed from donations"""
+        Donation.objects.create(name="Donor", amount=Decimal("5.00"))
+        Donation.objects.create(name="Donor", amount=Decimal("15.00"))
+        DonationTotalShard.objects.update_or_create(
+            shard=1, defaults={"donation_count": 99, "amount_total": Decimal("999.00")}
+        )
+
+        totals = reconcile_donation_totals()
+        self.assertEqual(totals["donation_count"], 2)
+        self.assertEqual(totals["amount_total"], Decimal("20.00"))
+        self.assertEqual(DonationTotalShard.objects.count(), 4)
+
+    def test_reconcile_command(self):
+        """Test the management command reconciles the totals"""
+        Donation.objects.create(name="Donor", amount=Decimal("3.00"))
+        DonationTotalShard.objects.all().delete()
+
+        call_command("reconcile_donation_totals", stdout=StringIO())
+
+        self.assertEqual(get_donation_totals()["amount_total"], Decimal("3.00"))
@@ -0,0 +1,105 @@
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.donations.forms import DonationForm
+from apps.donations.models import Donation, DonationIdempotencyKey, PendingDonation
+from apps.donations.utils.totals import get_donation_totals
+from apps.donations.utils.write_behind import (
+    add_pending_donation,
+    flush_donations,
+    get_write_behind_lag,
+    save_donation,
+)
+
+
+@override_settings(DONATION_WRITE_BEHIND=True)
+class WriteBehindTestCase(TestCase):
+    def save(self, amount, idempotency_key=None):
+        form = DonationForm({"name": "Donor", "amount": amount})
+        self.assertTrue(form.is_valid())
+        return save_donation(form, idempotency_key)
+
+    def test_save_donation_stages(self):
+        """Test donations are staged rather than saved in write-behind mode"""
+        donation = self.save("10.00")
+
+        self.assertIsInstance(donation, PendingDonation)
+        self.assertEqual(Donation.objects.count(), 0)
+        self.assertEqual(get_write_behind_lag()["pending"], 1)
+
+    def test_save_donation_repeated_key(self):
+        """Test a repeated idempotency key returns the staged donation"""
+        first = self.save("10.00", "donation-key")
+        repeat = self.save("10.00", "donation-key")
+
+        self.assertEqual(repeat.pk, first.pk)
+        self.assertEqual(PendingDonation.objects.count(), 1)
+
+    def test_flush_donations(self):
+        """Test staged donations are saved in batches and added to the totals"""
+        for amount in ("10.00", "5.00", "2.50"):
+            self.save(amount)
+
+        self.assertEqual(flush_donations(batch_size=2), 2)
+        self.assertEqual(flush_donations(batch_size=2), 1)
+        self.assertEqual(flush_donations(batch_size=2), 0)
+
+        self.assertEqual(Donation.objects.count(), 3)
+        self.assertEqual(PendingDonation.objects.count(), 0)
+        self.assertEqual(get_donation_totals()["amount_total"], Decimal("17.50"))
+
+    def test_flush_keeps_created_at(self):
+        """Test flushed donations keep the time they were staged rather than the flush time"""
+        staged = self.save("10.00")
+        staged_at = timezone.now() - timedelta(hours=1)
+        PendingDonation.objects.filter(pk=staged.pk).update(created_at=staged_at)
+
+        flush_donations(batch_size=10)
+
+        self.assertEqual(Donation.objects.get().created_at, staged_at)
+
+    @override_settings(DONATION_TICKER_ENABLED=True)
+    def test_flush_notifies_once_per_batch(self):
+        """Test the ticker is told about a flushed batch once, with its count and sum"""
+        for amount in ("10.00", "5.00"):
+            self.save(amount)
+
+        with mock.patch("apps.donations.utils.write_behind.notify_donations") as notify_donations:
+            flush_donations(batch_size=10)
+
+        notify_donations.assert_called_once_with(2, Decimal("15.00"), get_donation_totals())
+
+    def test_add_pending_donation(self):
+        """Test totals shown for a staged donation include it"""
+        totals = add_pending_donation(get_donation_totals(), self.save("10.00"))
+
+        self.assertEqual(totals["donation_count"], 1)
+        self.assertEqual(totals["amount_total"], Decimal("10.00"))
+
+    def test_flush_skips_saved_keys(self):
+        """Test a staged donation whose key was already saved isn't saved again"""
+        donation = Donation.objects.create(name="Donor", amount=Decimal("10.00"))
+        DonationIdempotencyKey.objects.create(
+            key="key", donation_id=donation.pk, donation_created_at=donation.created_at
+        )
+        self.save("10.00", "key")
+
+        flush_donations(batch_size=10)
+
+        self.assertEqual(Donation.objects.count(), 1)
+        self.assertEqual(PendingDonation.objects.count(), 0)
+
+    def test_flush_command(self):
+        """Test the management command flushes every staged donation with --once"""
+        self.save("10.00")
+
+        call_command("flush_donations", once=True, batch_size=10, stdout=StringIO())
+
+        self.assertEqual(Donation.objects.count(), 1)
+        self.assertEqual(get_write_behind_lag()["pending"], 0)
@@ -0,0 +1,58 @@
+from django.conf import settings
+from django.http import HttpRequest
+from django.middleware.csrf import get_token
+from django.template.loader import render_to_string
+
+from apps.donations.forms import DonationForm
+
+FORM_TEMPLATE = "donations/fragments/donate_form_fragment.html"
+TOTALS_TEMPLATE = "donations/fragments/donate_totals_fragment.html"
+
+# Stand-ins for the parts of the form which change with each request
+CSRF_TOKEN_PLACEHOLDER = "__donation_csrf_token__"  # noqa:S105
+IDEMPOTENCY_KEY_PLACEHOLDER = "__donation_idempotency_key__"
+TOTALS_PLACEHOLDER = "__donation_totals__"
+
+
+def render_totals(totals: dict) -> str:
+    """Return the running totals shown above the donation form"""
+    return render_to_string(TOTALS_TEMPLATE, {"totals": totals})
+
+
+class DonationFormShell:
+    """
+    Empty donation form rendered once per process, with placeholders for each request's values.
+
+    The form and its widgets never change between requests, so opening the modal only costs
+    replacing the CSRF token, idempotency key and totals. With reload enabled the form is
+    rendered every time, so template changes are picked up during development.
+    """
+
+    def __init__(self):
+        self.html: str | None = None
+
+    def get_html(self) -> str:
+        """Return the rendered form with placeholders, rendering it on first use"""
+        if self.html is None or settings.DONATION_FORM_SHELL_RELOAD:
+            self.html = render_to_string(
+                FORM_TEMPLATE,
+                {
+                    "form": DonationForm(),
+                    "csrf_token": CSRF_TOKEN_PLACEHOLDER,
+                    "idempotency_key": IDEMPOTENCY_KEY_PLACEHOLDER,
+                    "totals_html": TOTALS_PLACEHOLDER,
+                },
+            )
+        return self.html
+
+    def render(self, request: HttpRequest, totals: dict, idempotency_key: str) -> str:
+        """Return the empty form for a request, with its CSRF token and the current totals"""
+        return (
+            self.get_html()
+            .replace(CSRF_TOKEN_PLACEHOLDER, get_token(request))
+            .replace(IDEMPOTENCY_KEY_PLACEHOLDER, idempotency_key)
+            .replace(TOTALS_PLACEHOLDER, render_totals(totals))
+        )
+
+
+donation_form_shell = DonationFormShell()
@@ -0,0 +1,52 @@
+import datetime
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+from django.utils import timezone
+
+from apps.donations.models import DonationIdempotencyKey
+
+IDEMPOTENCY_CACHE_PREFIX = "donations:idempotency"
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+
+def get_idempotency_key(request: HttpRequest) -> str | None:
+    """Return the Idempotency-Key header of a request, if it has one"""
+    return request.headers.get("Idempotency-Key", "").strip() or None
+
+
+def get_idempotency_cache_key(idempotency_key: str) -> str:
+    """Return the cache key of the response stored for an idempotency key"""
+    digest = hashlib.sha256(idempotency_key.encode()).hexdigest()
+    return f"{IDEMPOTENCY_CACHE_PREFIX}:{digest}"
+
+
+async def aget_stored_response(idempotency_key: str) -> HttpResponse | None:
+    """Return a copy of the response first sent for an idempotency key, if it's still cached"""
+    entry = await cache.aget(get_idempotency_cache_key(idempotency_key))
+    if entry is None:
+        return None
+
+    response = HttpResponse(entry["content"], content_type=entry["content_type"])
+    response["Idempotent-Replayed"] = "true"
+    return response
+
+
+async def astore_response(idempotency_key: str, response: HttpResponse) -> None:
+    """Store the response sent for an idempotency key, so repeats can be answered with it"""
+    entry = {
+        "content": response.content,
+        "content_type": response.get("Content-Type", "text/html"),
+    }
+    await cache.aset(
+        get_idempotency_cache_key(idempotency_key), entry, settings.DONATION_IDEMPOTENCY_TIMEOUT
+    )
+
+
+def purge_idempotency_keys() -> int:
+    """Delete saved idempotency keys older than DONATION_IDEMPOTENCY_TIMEOUT, returning how many"""
+    cutoff = timezone.now() - datetime.timedelta(seconds=settings.DONATION_IDEMPOTENCY_TIMEOUT)
+    deleted, _ = DonationIdempotencyKey.objects.filter(created_at__lt=cutoff).delete()
+    return deleted
@@ -0,0 +1,68 @@
+import datetime
+
+from django.db import connection, transaction
+
+from apps.donations.models import Donation
+
+DONATION_TABLE = Donation._meta.db_table
+DEFAULT_PARTITION = f"{DONATION_TABLE}_default"
+
+
+def add_months(month: datetime.date, months: int) -> datetime.date:
+    """Return the first day of the month a number of months after another"""
+    index = month.year * 12 + month.month - 1 + months
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def get_partition_name(month: datetime.date) -> str:
+    """Return the name of the partition holding a month's donations"""
+    return f"{DONATION_TABLE}_y{month.year}m{month.month:02d}"
+
+
+def get_partition_bounds(month: datetime.date) -> tuple[str, str]:
+    """Return the first moment of a month and of the month after, in UTC"""
+    return f"{month.isoformat()} 00:00:00+00", f"{add_months(month, 1).isoformat()} 00:00:00+00"
+
+
+def create_partition(month: datetime.date) -> bool:
+    """
+    Create the partition for a month unless it exists, returning whether it was created.
+
+    The partition is created on its own and then attached, which doesn't block donations being
+    saved meanwhile. Any of the month's donations which landed in the default partition are
+    moved into it first.
+    """
+    name = get_partition_name(month)
+    start, end = get_partition_bounds(month)
+    quote_name = connection.ops.quote_name
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s)", [name])
+        if cursor.fetchone()[0] is not None:
+            return False
+
+        cursor.execute(
+            f"CREATE TABLE {quote_name(name)} "
+            f"(LIKE {quote_name(DONATION_TABLE)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {quote_name(DEFAULT_PARTITION)} "  # noqa:S608
+            "WHERE created_at >= %s AND created_at < %s RETURNING *) "
+            f"INSERT INTO {quote_name(name)} SELECT * FROM moved",
+            [start, end],
+        )
+        cursor.execute(
+            f"ALTER TABLE {quote_name(DONATION_TABLE)} ATTACH PARTITION {quote_name(name)} "
+            f"FOR VALUES FROM ('{start}') TO ('{end}')"
+        )
+    return True
+
+
+def create_future_partitions(months_ahead: int) -> list[str]:
+    """Create partitions from this month up to a number of months ahead, returning new ones"""
+    this_month = datetime.datetime.now(tz=datetime.UTC).date().replace(day=1)
+    return [
+        get_partition_name(month)
+        for month in (add_months(this_month, months) for months in range(months_ahead + 1))
+        if create_partition(month)
+    ]
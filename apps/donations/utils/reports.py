@@ -0,0 +1,150 @@
+import csv
+import datetime
+import itertools
+from collections.abc import AsyncIterator, Iterator
+
+from django.db.models import Aggregate, Avg, Count, FloatField, Q, QuerySet, Sum
+from django.db.models.functions import Trunc
+from django.utils import timezone
+
+from asgiref.sync import sync_to_async
+
+from apps.donations.models import Donation
+
+REPORT_PERIODS = ("day", "week", "month")
+REPORT_PERCENTILES = (0.5, 0.9, 0.99)
+
+# Leading characters which make spreadsheet applications read a cell as a formula
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class Percentile(Aggregate):
+    """Continuous percentile of an expression, interpolated between values by Postgres"""
+
+    function = "percentile_cont"
+    template = "%(function)s(%(percentile)s) WITHIN GROUP (ORDER BY %(expressions)s)"
+    output_field = FloatField()
+
+    def __init__(self, expression, percentile: float, **extra):
+        super().__init__(expression, percentile=float(percentile), **extra)
+
+
+class Echo:
+    """File-like object which returns what's written, so csv.writer can stream rows"""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def get_report_queryset(
+    start: datetime.date | None = None, end: datetime.date | None = None
+) -> QuerySet:
+    """
+    Return donations made between two dates, inclusive.
+
+    Dates are converted to bounds on created_at, rather than comparing the date of each
+    donation, so only the partitions for the dates are scanned.
+    """
+    queryset = Donation.objects.order_by()
+    if start is not None:
+        queryset = queryset.filter(
+            created_at__gte=timezone.make_aware(datetime.datetime.combine(start, datetime.time()))
+        )
+    if end is not None:
+        end_day = end + datetime.timedelta(days=1)
+        queryset = queryset.filter(
+            created_at__lt=timezone.make_aware(datetime.datetime.combine(end_day, datetime.time()))
+        )
+    return queryset
+
+
+def iter_donations(queryset: QuerySet, batch_size: int = 2000) -> Iterator[tuple]:
+    """
+    Yield the id, created_at, name and amount of donations, oldest first.
+
+    Donations are fetched in batches after the last (created_at, id) seen, so each batch is an
+    index range scan however deep into the report it is, and only one batch is held in memory.
+    Postgres can't bound the scan by the OR of the keyset alone, so it's also given the lower
+    bound on created_at.
+    """
+    queryset = queryset.order_by("created_at", "id").values_list(
+        "id", "created_at", "name", "amount"
+    )
+    batch = list(queryset[:batch_size])
+    while batch:
+        yield from batch
+        _, last_created_at, _, _ = last = batch[-1]
+        batch = list(
+            queryset.filter(
+                Q(created_at__gt=last_created_at) | Q(created_at=last_created_at, id__gt=last[0]),
+                created_at__gte=last_created_at,
+            )[:batch_size]
+        )
+
+
+def escape_csv_cell(value: str) -> str:
+    """Return text which spreadsheet applications show as is, rather than run as a formula"""
+    if value.startswith(CSV_FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+def iter_donation_csv(queryset: QuerySet) -> Iterator[str]:
+    """Yield donations as lines of CSV, starting with a header"""
+    writer = csv.writer(Echo())
+    yield writer.writerow(["id", "created_at", "name", "amount"])
+    for donation_id, created_at, name, amount in iter_donations(queryset):
+        yield writer.writerow([donation_id, created_at.isoformat(), escape_csv_cell(name), amount])
+
+
+def get_period_aggregates(queryset: QuerySet, period: str) -> list[dict]:
+    """
+    Return the count, total, mean and percentiles of donation amounts for each period.
+
+    Everything is computed by one grouped query over date_trunc of created_at, in the current
+    time zone.
+    """
+    percentiles = {
+        f"p{round(percentile * 100)}": Percentile("amount", percentile)
+        for percentile in REPORT_PERCENTILES
+    }
+    return list(
+        queryset.annotate(period=Trunc("created_at", period))
+        .values("period")
+        .annotate(
+            count=Count("id"),
+            total=Sum("amount"),
+            mean=Avg("amount"),
+            **percentiles,
+        )
+        .order_by("period")
+    )
+
+
+def iter_period_aggregates_csv(queryset: QuerySet, period: str) -> Iterator[str]:
+    """Yield the aggregates for each period as lines of CSV, starting with a header"""
+    writer = csv.writer(Echo())
+    rows = get_period_aggregates(queryset, period)
+    statistics = ["mean", *(f"p{round(percentile * 100)}" for percentile in REPORT_PERCENTILES)]
+    yield writer.writerow(["period", "count", "total", *statistics])
+    for row in rows:
+        yield writer.writerow(
+            [
+                row["period"].date().isoformat(),
+                row["count"],
+                row["total"],
+                *(round(row[statistic], 2) for statistic in statistics),
+            ]
+        )
+
+
+async def aiter_lines(lines: Iterator[str], chunk_size: int = 1000) -> AsyncIterator[str]:
+    """
+    Yield lines from a synchronous iterator for an ASGI response, a chunk at a time.
+
+    Lines are read in a thread, as reports query the database, so each chunk rather than each
+    line costs a hop to it.
+    """
+    read_chunk = sync_to_async(lambda: "".join(itertools.islice(lines, chunk_size)))
+    while chunk := await read_chunk():
+        yield chunk
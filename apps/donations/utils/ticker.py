@@ -0,0 +1,108 @@
+import asyncio
+import contextlib
+import json
+import logging
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, connections
+
+import psycopg
+
+from apps.donations.utils.totals import aget_donation_totals, get_donation_totals
+
+logger = logging.getLogger(__name__)
+
+DONATION_TICKER_CHANNEL = "donations"
+
+
+def notify_donations(count: int, amount: Decimal, totals: dict | None = None) -> None:
+    """Tell every listening worker about saved donations and their sum, with the new totals"""
+    if totals is None:
+        totals = get_donation_totals()
+    payload = json.dumps(
+        {"count": count, "amount": amount, "totals": totals}, cls=DjangoJSONEncoder
+    )
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_notify(%s, %s)", [DONATION_TICKER_CHANNEL, payload])
+
+
+def format_event(event: str, data: str) -> str:
+    """Return a server-sent event"""
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+class DonationTicker:
+    """
+    Per process listener which fans donation notifications out to every connected browser.
+
+    A single connection listens for the whole worker, started by the first subscriber and
+    closed once there are none left, so each open ticker only costs a queue in memory.
+    """
+
+    def __init__(self):
+        self.subscribers: set[asyncio.Queue] = set()
+        self.task: asyncio.Task | None = None
+
+    def subscribe(self) -> asyncio.Queue:
+        """Return a queue of payloads for a new subscriber, listening if not already"""
+        queue = asyncio.Queue(maxsize=settings.DONATION_TICKER_QUEUE_SIZE)
+        self.subscribers.add(queue)
+        loop = asyncio.get_running_loop()
+        if self.task is None or self.task.done() or self.task.get_loop() is not loop:
+            self.task = loop.create_task(self.listen())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Stop sending payloads to a subscriber"""
+        self.subscribers.discard(queue)
+
+    def broadcast(self, payload: str) -> None:
+        """Send a payload to every subscriber, skipping those too slow to keep up"""
+        for queue in self.subscribers:
+            with contextlib.suppress(asyncio.QueueFull):
+                queue.put_nowait(payload)
+
+    async def listen(self) -> None:
+        """Listen for notifications while there are subscribers, reconnecting on errors"""
+        params = connections["default"].get_connection_params()
+        # Django's cursor factory and adapters are for synchronous connections
+        params.pop("cursor_factory", None)
+        params.pop("context", None)
+
+        while self.subscribers:
+            try:
+                async with await psycopg.AsyncConnection.connect(
+                    **params, autocommit=True
+                ) as conn:
+                    await conn.execute(f"LISTEN {DONATION_TICKER_CHANNEL}")
+                    while self.subscribers:
+                        notifies = conn.notifies(timeout=settings.DONATION_TICKER_KEEPALIVE)
+                        async for notify in notifies:
+                            self.broadcast(notify.payload)
+            except psycopg.Error:
+                logger.warning("Donation ticker lost its connection", exc_info=True)
+                await asyncio.sleep(settings.DONATION_TICKER_RECONNECT_DELAY)
+
+    async def stream(self):
+        """Yield the current totals then each donation as server-sent events"""
+        queue = self.subscribe()
+        try:
+            totals = await aget_donation_totals()
+            yield format_event("totals", json.dumps(totals, cls=DjangoJSONEncoder))
+            while True:
+                try:
+                    payload = await asyncio.wait_for(
+                        queue.get(), settings.DONATION_TICKER_KEEPALIVE
+                    )
+                except TimeoutError:
+                    # Comments keep proxies from closing an idle connection
+                    yield ": keepalive\n\n"
+                    continue
+                yield format_event("donation", payload)
+        finally:
+            self.unsubscribe(queue)
+
+
+donation_ticker = DonationTicker()
@@ -0,0 +1,81 @@
+import random
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Sum
+
+from apps.donations.models import Donation, DonationTotalShard
+
+
+def _ensure_shards() -> None:
+    """Create any shard rows which don't exist yet"""
+    DonationTotalShard.objects.bulk_create(
+        [DonationTotalShard(shard=shard) for shard in range(settings.DONATION_TOTAL_SHARDS)],
+        ignore_conflicts=True,
+    )
+
+
+def add_to_totals(donation_count: int, amount: Decimal) -> None:
+    """Add donations to the running totals, in the same transaction as saving them"""
+    shard = random.randrange(settings.DONATION_TOTAL_SHARDS)  # noqa:S311
+    changes = {
+        "donation_count": F("donation_count") + donation_count,
+        "amount_total": F("amount_total") + amount,
+    }
+    if not DonationTotalShard.objects.filter(shard=shard).update(**changes):
+        _ensure_shards()
+        DonationTotalShard.objects.filter(shard=shard).update(**changes)
+
+
+def record_donation(donation: Donation) -> None:
+    """Add a donation to the running totals, in the same transaction as saving it"""
+    add_to_totals(1, donation.amount)
+
+
+def format_totals(totals: dict) -> dict:
+    """Return summed shard rows as totals, which are zero before the first donation"""
+    return {
+        "donation_count": totals["donation_count"] or 0,
+        "amount_total": totals["amount_total"] or Decimal("0.00"),
+    }
+
+
+def get_donation_totals() -> dict:
+    """Return the number of donations and the total amount raised, from the shard rows"""
+    return format_totals(
+        DonationTotalShard.objects.aggregate(
+            donation_count=Sum("donation_count"), amount_total=Sum("amount_total")
+        )
+    )
+
+
+async def aget_donation_totals() -> dict:
+    """Return the number of donations and the total amount raised, for async views"""
+    return format_totals(
+        await DonationTotalShard.objects.aaggregate(
+            donation_count=Sum("donation_count"), amount_total=Sum("amount_total")
+        )
+    )
+
+
+def reconcile_donation_totals() -> dict:
+    """
+    Recompute the totals from every donation, returning them.
+
+    Every shard row is locked first, so donations saved meanwhile either commit before the
+    donations are counted, or wait and are added to the shards afterwards.
+    """
+    with transaction.atomic():
+        _ensure_shards()
+        shards = list(DonationTotalShard.objects.select_for_update())
+
+        totals = Donation.objects.aggregate(donation_count=Count("pk"), amount_total=Sum("amount"))
+        for shard in shards:
+            shard.donation_count = 0
+            shard.amount_total = Decimal("0.00")
+        shards[0].donation_count = totals["donation_count"]
+        shards[0].amount_total = totals["amount_total"] or Decimal("0.00")
+        DonationTotalShard.objects.bulk_update(shards, ["donation_count", "amount_total"])
+
+    return get_donation_totals()
@@ -0,0 +1,126 @@
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Min, Sum
+from django.utils import timezone
+
+from apps.donations.forms import DonationForm
+from apps.donations.models import Donation, DonationIdempotencyKey, PendingDonation
+from apps.donations.utils.ticker import notify_donations
+from apps.donations.utils.totals import add_to_totals, get_donation_totals, record_donation
+
+
+def save_donation(form: DonationForm, idempotency_key: str | None) -> Donation | PendingDonation:
+    """
+    Save a valid donation, or stage it for the flush worker in write-behind mode.
+
+    A donation repeating an idempotency key returns the one first saved with the key.
+    """
+    try:
+        with transaction.atomic():
+            if settings.DONATION_WRITE_BEHIND:
+                donation = PendingDonation.objects.create(
+                    idempotency_key=idempotency_key, **form.cleaned_data
+                )
+            else:
+                donation = form.save()
+                if idempotency_key is not None:
+                    DonationIdempotencyKey.objects.create(
+                        key=idempotency_key,
+                        donation_id=donation.pk,
+                        donation_created_at=donation.created_at,
+                    )
+                record_donation(donation)
+    except IntegrityError:
+        # A repeat of a POST which hasn't finished yet, or whose response has expired
+        if idempotency_key is None:
+            raise
+        donation = find_donation(idempotency_key)
+    return donation
+
+
+def find_donation(idempotency_key: str) -> Donation | PendingDonation:
+    """Return the donation saved or staged with an idempotency key"""
+    saved_key = DonationIdempotencyKey.objects.filter(key=idempotency_key).first()
+    if saved_key is not None:
+        return saved_key.get_donation()
+    return PendingDonation.objects.get(idempotency_key=idempotency_key)
+
+
+def flush_donations(batch_size: int) -> int:
+    """
+    Move a batch of pending donations into the donations table, returning how many moved.
+
+    Inserting the donations, updating the totals and deleting the pending rows happen in one
+    transaction, so each pending donation is saved exactly once. Rows are locked with SKIP
+    LOCKED, so several workers can flush at once.
+    """
+    with transaction.atomic():
+        pending = list(
+            PendingDonation.objects.select_for_update(skip_locked=True).order_by("pk")[:batch_size]
+        )
+        if not pending:
+            return 0
+
+        # Keys saved before write-behind was enabled have already been counted
+        keys = [donation.idempotency_key for donation in pending if donation.idempotency_key]
+        saved_keys = set(
+            DonationIdempotencyKey.objects.filter(key__in=keys).values_list("key", flat=True)
+        )
+        unsaved = [donation for donation in pending if donation.idempotency_key not in saved_keys]
+        donations = Donation.objects.bulk_create(
+            [
+                Donation(
+                    name=donation.name, amount=donation.amount, created_at=donation.created_at
+                )
+                for donation in unsaved
+            ]
+        )
+        DonationIdempotencyKey.objects.bulk_create(
+            [
+                DonationIdempotencyKey(
+                    key=staged.idempotency_key,
+                    donation_id=donation.pk,
+                    donation_created_at=donation.created_at,
+                )
+                for staged, donation in zip(unsaved, donations, strict=True)
+                if staged.idempotency_key
+            ]
+        )
+        if donations:
+            add_to_totals(len(donations), sum(donation.amount for donation in donations))
+        PendingDonation.objects.filter(pk__in=[donation.pk for donation in pending]).delete()
+
+    # Bulk inserts don't send post_save, so tell the ticker here, once for the whole batch
+    if donations and settings.DONATION_TICKER_ENABLED:
+        notify_donations(
+            len(donations),
+            sum(donation.amount for donation in donations),
+            get_donation_totals(),
+        )
+
+    return len(pending)
+
+
+def add_pending_donation(totals: dict, donation: Donation | PendingDonation) -> dict:
+    """Return totals including a staged donation, which isn't in them until it's flushed"""
+    if not isinstance(donation, PendingDonation):
+        return totals
+    return {
+        "donation_count": totals["donation_count"] + 1,
+        "amount_total": totals["amount_total"] + donation.amount,
+    }
+
+
+def get_write_behind_lag() -> dict:
+    """Return how many donations are waiting to be flushed, and the age of the oldest"""
+    pending = PendingDonation.objects.aggregate(
+        count=Count("pk"), amount=Sum("amount"), oldest=Min("created_at")
+    )
+    oldest = pending["oldest"]
+    return {
+        "pending": pending["count"],
+        "amount": pending["amount"] or Decimal("0.00"),
+        "oldest_age": (timezone.now() - oldest).total_seconds() if oldest else 0.0,
+    }
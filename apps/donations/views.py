@@ -1,31 +1,131 @@
-from django.http import Http404
+import uuid
+
+from django.conf import settings
+from django.contrib.auth.decorators import user_passes_test
+from django.core.handlers.asgi import ASGIRequest
+from django.http import Http404, HttpResponse, HttpResponseBadRequest, StreamingHttpResponse
 from django.shortcuts import render
+from django.views.decorators.cache import never_cache
+
+from asgiref.sync import sync_to_async
+
+from apps.core.utils.rate_limit import rate_limit
+from apps.donations.forms import DonationForm, DonationReportForm
+from apps.donations.utils.form_shell import donation_form_shell, render_totals
+from apps.donations.utils.idempotency import (
+    IDEMPOTENCY_KEY_MAX_LENGTH,
+    aget_stored_response,
+    astore_response,
+    get_idempotency_key,
+)
+from apps.donations.utils.reports import (
+    aiter_lines,
+    get_report_queryset,
+    iter_donation_csv,
+    iter_period_aggregates_csv,
+)
+from apps.donations.utils.ticker import donation_ticker
+from apps.donations.utils.totals import aget_donation_totals
+from apps.donations.utils.write_behind import add_pending_donation, save_donation
 
-from apps.donations.forms import DonationForm
 
+@never_cache
+@rate_limit("donate", "DONATION_RATE_LIMITS")
+async def donation_view(request):
+    """
+    Render the donation form fragment loaded into the modal on every page, and handle its POST.
 
-def donation_view(request):
+    The CSRF token is only issued here, so pages stay free of cookies and can be cached. Each
+    form carries a new idempotency key, and a POST repeating a key gets the response first sent
+    for it rather than saving the donation again. Clients over the rate limit are turned away
+    before any query or template is run. Saving runs in a thread, as transactions are sync only.
+    """
     if not request.headers.get("HX-Request"):
         raise Http404("Page not found")
 
     if request.method == "POST":
+        idempotency_key = get_idempotency_key(request)
+        if idempotency_key is not None:
+            if len(idempotency_key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+                return HttpResponseBadRequest("Idempotency-Key is too long")
+            if stored_response := await aget_stored_response(idempotency_key):
+                return stored_response
+
         form = DonationForm(request.POST)
         if form.is_valid():
-            donation = form.save()
-            return render(
+            donation = await sync_to_async(save_donation)(form, idempotency_key)
+            # Context processors may query the database, so templates render in a thread
+            response = await sync_to_async(render)(
                 request,
                 "donations/fragments/donate_success_fragment.html",
-                {"donation": donation},
+                {
+                    "donation": donation,
+                    "totals": add_pending_donation(await aget_donation_totals(), donation),
+                },
             )
-        return render(
+            if idempotency_key is not None:
+                await astore_response(idempotency_key, response)
+            return response
+
+        return await sync_to_async(render)(
             request,
             "donations/fragments/donate_form_fragment.html",
-            {"form": form},
+            {
+                "form": form,
+                "totals_html": render_totals(await aget_donation_totals()),
+                "idempotency_key": uuid.uuid4().hex,
+            },
         )
 
-    form = DonationForm()
-    return render(
-        request,
-        "donations/fragments/donate_form_fragment.html",
-        {"form": form},
+    # The empty form is the same for everyone apart from a few values, so isn't rendered again
+    return HttpResponse(
+        donation_form_shell.render(request, await aget_donation_totals(), uuid.uuid4().hex)
+    )
+
+
+async def donation_ticker_view(request):
+    """
+    Stream the running totals and each new donation to the browser as server-sent events.
+
+    Only useful under ASGI, where an open ticker costs a queue rather than a worker thread.
+    """
+    if not settings.DONATION_TICKER_ENABLED:
+        raise Http404("Page not found")
+
+    return StreamingHttpResponse(
+        donation_ticker.stream(),
+        content_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@never_cache
+@user_passes_test(lambda user: user.is_active and user.is_staff, login_url="wagtailadmin_login")
+def donation_report_view(request):
+    """
+    Stream donations between optional start and end dates as CSV, for staff only.
+
+    With a period of day, week or month, the aggregates for each period are sent instead.
+    Under ASGI the rows are streamed from an async iterator, as a sync one would be read into
+    memory whole.
+    """
+    form = DonationReportForm(request.GET)
+    if not form.is_valid():
+        return HttpResponseBadRequest(form.errors.as_text())
+
+    queryset = get_report_queryset(form.cleaned_data["start"], form.cleaned_data["end"])
+    if period := form.cleaned_data["period"]:
+        rows = iter_period_aggregates_csv(queryset, period)
+        filename = f"donations-{period}.csv"
+    else:
+        rows = iter_donation_csv(queryset)
+        filename = "donations.csv"
+
+    if isinstance(request, ASGIRequest):
+        rows = aiter_lines(rows)
+
+    return StreamingHttpResponse(
+        rows,
+        content_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -36,12 +36,18 @@ class Command(BaseCommand):
             action="store_true",
             help="Load location fixtures data",
         )
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Keep the existing sightings page if one has already been set up",
+        )
 
     def handle(self, *args, **options):
         content_file = Path(options["content_file"])
         fixtures_file = Path(options["fixtures_file"])
         force = options["force"]
         load_fixtures = options["load_fixtures"]
+        incremental = options["incremental"]
         utils = WagtailSetupUtils(self)
 
         utils.styled_output("Setting up sightings map page...")
@@ -56,6 +62,10 @@ class Command(BaseCommand):
             )
             return
 
+        if incremental and not force and SightingPage.objects.exists():
+            utils.styled_output("Sightings page already exists, skipping")
+            return
+
         parent_page = utils.get_parent_page()
         if not parent_page:
             return
@@ -8,10 +8,11 @@ from wagtail.admin.panels import FieldPanel
 from wagtail.fields import RichTextField
 from wagtail.models import Page
 
+from apps.core.mixins import CachedPageMixin
 from apps.sightings.models.sighting_model import SightingModel
 
 
-class SightingPage(Page):
+class SightingPage(CachedPageMixin, Page):
     template = "sightings/sighting_index.html"
 
     intro = RichTextField(blank=True)
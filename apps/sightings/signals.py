@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.core.utils.page_cache import invalidate_page_cache
+from apps.sightings.models import SightingModel
+
+
+@receiver(post_save, sender=SightingModel)
+@receiver(post_delete, sender=SightingModel)
+def invalidate_sighting_pages(sender, **kwargs):
+    """Invalidate cached pages when a sighting shown on the map changes"""
+    invalidate_page_cache()
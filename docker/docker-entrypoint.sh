@@ -9,16 +9,24 @@ python manage.py wait_for_db --settings=project.settings.production --timeout 30
 echo "Running migrations..."
 python manage.py migrate --settings=project.settings.production
 
+# Keep donation partitions ahead of the calendar, as containers restart more than monthly
+echo "Creating donation partitions..."
+python manage.py create_donation_partitions --settings=project.settings.production
+
 # Create superuser if it doesn't exist
  python manage.py createsuperuser --noinput --settings=project.settings.production || true
 
 # Setup Wagtail data
 echo "Setting up Wagtail data..."
-python manage.py setup_wagtail --settings=project.settings.production
+python manage.py setup_wagtail --incremental --settings=project.settings.production
 
 # Collect static files
 echo "Collecting static files..."
 python manage.py collectstatic --noinput --settings=project.settings.production
 
+# Render pages with the current templates and static files
+echo "Pre-rendering pages..."
+python manage.py prerender_pages --settings=project.settings.production
+
 echo "Starting application..."
 exec "$@"
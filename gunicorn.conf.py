@@ -1,3 +1,4 @@
+import gc
 import multiprocessing
 import os
 
@@ -6,9 +7,18 @@ bind = "0.0.0.0:8000"
 backlog = 2048
 
 # Worker processes
+# GUNICORN_WORKER_MODE=asgi runs Django under ASGI with uvicorn workers, where each worker serves
+# up to worker_connections requests at once rather than one per thread. Compare the two modes
+# with scripts/benchmark_workers.py
+worker_mode = os.environ.get("GUNICORN_WORKER_MODE", "gthread")
 workers = multiprocessing.cpu_count() * 2 + 1
-worker_class = "gthread"
-threads = 2
+if worker_mode == "asgi":
+    wsgi_app = "project.asgi:application"
+    worker_class = "uvicorn_worker.UvicornWorker"
+else:
+    wsgi_app = "project.wsgi:application"
+    worker_class = "gthread"
+    threads = 2
 worker_connections = 1000
 max_requests = 1000
 max_requests_jitter = 100
@@ -37,3 +47,56 @@ user = "appuser"
 group = "appuser"
 tmp_upload_dir = None
 
+
+# Server hooks
+# With preload_app the master loads Django once and warms up everything requests would otherwise
+# load lazily, then freezes the garbage collector before forking so workers share those objects
+# copy-on-write rather than dirtying their pages on each collection. See apps/core/utils/warmup.py
+def when_ready(server):
+    if not preload_app:
+        return
+
+    from apps.core.utils.warmup import close_connections, get_memory_usage, warm_up  # noqa:PLC0415
+
+    timings = warm_up()
+    server.log.info(
+        "Warmed up %s", ", ".join(f"{name} in {seconds:.3f}s" for name, seconds in timings.items())
+    )
+    close_connections()
+    gc.collect()
+    server.log.info("Master memory: %s", format_memory_usage(get_memory_usage()))
+
+
+def pre_fork(server, worker):
+    if not preload_app:
+        return
+
+    from apps.core.utils.warmup import close_connections  # noqa:PLC0415
+
+    # Workers would otherwise share the master's sockets, if anything reopened them
+    close_connections()
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    if not preload_app:
+        return
+
+    from apps.core.utils.warmup import open_connections  # noqa:PLC0415
+
+    open_connections()
+
+
+def post_worker_init(worker):
+    if not preload_app:
+        return
+
+    from apps.core.utils.warmup import get_memory_usage  # noqa:PLC0415
+
+    worker.log.info("Worker %s memory: %s", worker.pid, format_memory_usage(get_memory_usage()))
+
+
+def format_memory_usage(usage):
+    if not usage:
+        return "unavailable"
+    return f"{usage['rss']:.1f} MiB resident, {usage['private']:.1f} MiB private"
@@ -61,6 +61,7 @@ THIRD_PARTY_APPS = ["axes", "maskpostgresdata", "watchman", "taggit"]
 WAGTAIL_APPS = [
     "wagtail.contrib.forms",
     "wagtail.contrib.redirects",
+    "wagtail.contrib.routable_page",
     "wagtail.embeds",
     "wagtail.sites",
     "wagtail.users",
@@ -89,9 +90,13 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sites.middleware.CurrentSiteMiddleware",
+    "apps.core.middleware.CurrentSiteMiddleware",
+    "apps.core.middleware.PreloadLinkMiddleware",
+    "apps.core.middleware.PrerenderedPageMiddleware",
+    "apps.core.middleware.NotFoundCacheMiddleware",
+    "apps.core.middleware.PageCacheMiddleware",
     "axes.middleware.AxesMiddleware",
-    "wagtail.contrib.redirects.middleware.RedirectMiddleware",
+    "apps.core.middleware.RedirectMiddleware",
 ]
 
 ROOT_URLCONF = "project.urls"
@@ -177,6 +182,7 @@ TEMPLATES = [
                 "django.template.context_processors.request",
                 "django.contrib.messages.context_processors.messages",
                 "apps.core.context_processors.demo",
+                "apps.core.context_processors.donation_ticker",
                 "apps.core.context_processors.sentry_config",
                 "apps.core.context_processors.site_context",
             ]
@@ -275,3 +281,88 @@ AUTH_USER_MODEL = "accounts.User"
 WAGTAIL_SITE_NAME = os.environ.get("SITE_NAME")
 WAGTAILADMIN_BASE_URL = os.environ.get("BASE_URL")
 WAGTAILIMAGES_IMAGE_MODEL = "core.CustomImage"
+WAGTAILSEARCH_BACKENDS = {
+    "default": {
+        "BACKEND": "wagtail.search.backends.database",
+        "SEARCH_CONFIG": "english",
+    }
+}
+
+# Blog search results per page
+BLOG_SEARCH_PAGE_SIZE = 10
+
+# Blog feeds are generated once per publish and then served from the cache
+BLOG_FEED_ITEMS = 20
+BLOG_FEED_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Number of related posts precomputed for each blog post
+RELATED_POSTS_COUNT = 3
+
+# Static HTML files of pages rendered on publish, see apps.core.utils.prerender
+PRERENDER_ENABLED = False
+PRERENDER_ROOT = BASE_DIR / "htdocs/prerendered"
+
+# Responses to anonymous visitors are cached in full, see apps.core.utils.page_cache
+PAGE_CACHE_ENABLED = False
+PAGE_CACHE_TIMEOUT = 60 * 60
+PAGE_CACHE_STALE_TIMEOUT = 60
+PAGE_CACHE_LOCK_TIMEOUT = 30
+PAGE_CACHE_LOCK_WAIT = 2
+# Shared caches can't be invalidated on publish, so only keep pages for a short time
+PAGE_CACHE_SHARED_MAX_AGE = 60 * 5
+
+# Recently missed paths are answered without routing, see apps.core.utils.not_found_cache
+NOT_FOUND_CACHE_ENABLED = False
+NOT_FOUND_CACHE_SIZE = 1000
+NOT_FOUND_CACHE_TIMEOUT = 60 * 10
+
+# Paths are cached as the page they route to until the page tree changes
+ROUTE_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Expanded rich text is cached per page revision, see apps.core.utils.richtext_cache
+RICHTEXT_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Webpack bundles used by every page, preloaded with a Link header
+WEBPACK_PRELOAD_ASSETS = {"styles.css": "style", "app.js": "script"}
+
+# Check the webpack manifest for changes on every lookup, only useful with a webpack watcher
+WEBPACK_MANIFEST_RELOAD = False
+
+# Running donation totals are spread over rows, see apps.donations.utils.totals
+DONATION_TOTAL_SHARDS = 8
+
+# Donations are pushed to browsers as server-sent events, see apps.donations.utils.ticker
+DONATION_TICKER_ENABLED = False
+DONATION_TICKER_KEEPALIVE = 15
+DONATION_TICKER_RECONNECT_DELAY = 5
+DONATION_TICKER_QUEUE_SIZE = 100
+
+# Responses to donations are kept for repeated POSTs, and their keys until purged by
+# purge_idempotency_keys, see apps.donations.utils.idempotency. Schedule the command hourly,
+# flush_donations also runs the purge every DONATION_IDEMPOTENCY_PURGE_INTERVAL seconds
+DONATION_IDEMPOTENCY_TIMEOUT = 60 * 60 * 24
+DONATION_IDEMPOTENCY_PURGE_INTERVAL = 60 * 60
+
+# Donations can be staged and saved in batches by flush_donations during appeals, see
+# apps.donations.utils.write_behind
+DONATION_WRITE_BEHIND = False
+DONATION_FLUSH_BATCH_SIZE = 500
+DONATION_FLUSH_INTERVAL = 1
+# Seconds the oldest staged donation can wait before flush_donations --status reports an error
+DONATION_WRITE_BEHIND_MAX_LAG = 60
+
+# Requests to the donation endpoint per client IP and session, see apps.core.utils.rate_limit
+DONATION_RATE_LIMITS = {
+    "GET": {"capacity": 20, "refill_rate": 0.5},
+    "POST": {"capacity": 5, "refill_rate": 0.1},
+}
+# Take the client IP from the last X-Forwarded-For address, which must be added by our proxy
+RATE_LIMIT_FORWARDED_FOR = False
+
+# Months of donation partitions created ahead by create_donation_partitions, which should run
+# at least monthly, see apps.donations.utils.partitions
+DONATION_PARTITION_MONTHS_AHEAD = 3
+
+# Render the empty donation form on every request, rather than once per process, see
+# apps.donations.utils.form_shell
+DONATION_FORM_SHELL_RELOAD = False
@@ -24,6 +24,8 @@ INSTALLED_APPS += ["django_extensions"]
 
 # Webpack runserver
 TEMPLATES[0]["OPTIONS"]["context_processors"].append("core.context_processors.browsersync")
+WEBPACK_MANIFEST_RELOAD = True
+DONATION_FORM_SHELL_RELOAD = True
 
 # Use vanilla StaticFilesStorage to allow tests to run outside of tox easily
 STORAGES["staticfiles"]["BACKEND"] = "django.contrib.staticfiles.storage.StaticFilesStorage"
@@ -24,6 +24,13 @@ DATABASES = {
     }
 }
 
+# Under ASGI requests don't keep to one thread, so connections are pooled rather than kept open
+# per thread, and the donation ticker's open connections are cheap
+if os.environ.get("GUNICORN_WORKER_MODE") == "asgi":
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"] = {"pool": True}
+    DONATION_TICKER_ENABLED = True
+
 # Use cached templates in production
 TEMPLATES[0]["APP_DIRS"] = False
 TEMPLATES[0]["OPTIONS"]["loaders"] = [
@@ -36,6 +43,15 @@ TEMPLATES[0]["OPTIONS"]["loaders"] = [
     )
 ]
 
+# Serve pages rendered on publish to anonymous visitors
+PRERENDER_ENABLED = True
+
+# Cache responses to anonymous visitors
+PAGE_CACHE_ENABLED = True
+
+# Answer repeated requests for missing paths without routing them
+NOT_FOUND_CACHE_ENABLED = True
+
 # SSL required for session/CSRF cookies
 CSRF_COOKIE_SECURE = True
 SESSION_COOKIE_SECURE = True
@@ -77,3 +93,4 @@ if os.environ.get("REDIS_SERVERS"):
 SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
 USE_X_FORWARDED_HOST = True
 USE_X_FORWARDED_PORT = True
+RATE_LIMIT_FORWARDED_FOR = True
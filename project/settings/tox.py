@@ -27,3 +27,6 @@ PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
 
 # Disable axes during testing
 AXES_ENABLED = False
+
+# Tests make many requests from the same client, so only limit the rate where tested
+DONATION_RATE_LIMITS = {}
@@ -8,8 +8,9 @@ from django.views.decorators.cache import never_cache
 from django.views.generic import TemplateView
 from django.views.static import serve
 
+from apps.blogs.views import search_view
 from apps.core.views import server_error
-from apps.donations.views import donation_view
+from apps.donations.views import donation_report_view, donation_ticker_view, donation_view
 
 admin.site.site_title = "Save The Unicorns"
 admin.site.site_header = "Save The Unicorns"
@@ -22,10 +23,13 @@ urlpatterns = [
     ),
     path("_health/", include("watchman.urls")),
     path("api/donate/", donation_view, name="donate"),
+    path("api/donate/ticker/", donation_ticker_view, name="donation_ticker"),
+    path("api/donations/report/", donation_report_view, name="donation_report"),
+    path("search/", search_view, name="blog_search"),
     path("admin/", include("wagtail.admin.urls")),
     path("documents/", include("wagtail.documents.urls")),
-    # All pages route through Wagtail
-    path("", include("wagtail.urls")),
+    # All pages route through Wagtail, via the route cache
+    path("", include("apps.core.urls")),
 ]
 
 # Make it easier to see a 404-page under debug
@@ -0,0 +1,141 @@
+# ruff: noqa:INP001,T201
+"""
+Compare throughput and latency of the gthread and ASGI gunicorn worker modes.
+
+Starts gunicorn in each mode with gunicorn.conf.py, sends the same requests to both from many
+concurrent clients, and prints requests per second with p50 and p99 latency. Run it with the
+settings to benchmark, for example:
+
+    DJANGO_SETTINGS_MODULE=project.settings.production \\
+        python scripts/benchmark_workers.py --path /api/donate/ --header "HX-Request: true"
+
+The donation endpoint is rate limited, so raise DONATION_RATE_LIMITS or expect 429 responses,
+which are counted separately.
+"""
+
+import argparse
+import collections
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def start_server(mode: str, port: int, workers: int) -> subprocess.Popen:
+    """Start gunicorn in a worker mode, returning once it accepts requests"""
+    pidfile = Path(tempfile.gettempdir(), f"benchmark-{mode}.pid")
+    server = subprocess.Popen(  # noqa:S603
+        [
+            sys.executable,
+            "-m",
+            "gunicorn",
+            "--config",
+            "gunicorn.conf.py",
+            "--bind",
+            f"127.0.0.1:{port}",
+            "--workers",
+            str(workers),
+            "--user",
+            str(os.getuid()),
+            "--group",
+            str(os.getgid()),
+            "--pid",
+            str(pidfile),
+            "--access-logfile",
+            "/dev/null",
+        ],
+        cwd=BASE_DIR,
+        env={**os.environ, "GUNICORN_WORKER_MODE": mode},
+    )
+
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/_health/", timeout=1)
+        except urllib.error.HTTPError:
+            return server
+        except OSError:
+            time.sleep(0.5)
+        else:
+            return server
+
+    server.terminate()
+    message = f"gunicorn didn't start in {mode} mode"
+    raise RuntimeError(message)
+
+
+def send_request(url: str, headers: dict[str, str]) -> tuple[float, int]:
+    """Send a request, returning its latency in seconds and its status code"""
+    request = urllib.request.Request(url, headers=headers)  # noqa:S310
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:  # noqa:S310
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as error:
+        status = error.code
+    except OSError:
+        status = 0
+    return time.perf_counter() - started, status
+
+
+def benchmark(url: str, headers: dict[str, str], requests: int, concurrency: int) -> dict:
+    """Send requests from concurrent clients, returning throughput and latency statistics"""
+    # Warm up every worker before measuring
+    with ThreadPoolExecutor(concurrency) as executor:
+        list(executor.map(lambda _: send_request(url, headers), range(concurrency)))
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as executor:
+        results = list(executor.map(lambda _: send_request(url, headers), range(requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for latency, _ in results)
+    percentiles = statistics.quantiles(latencies, n=100)
+    return {
+        "requests_per_second": requests / elapsed,
+        "p50": percentiles[49] * 1000,
+        "p99": percentiles[98] * 1000,
+        "statuses": collections.Counter(status for _, status in results),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--path", default="/")
+    parser.add_argument("--header", action="append", default=[], help="Name: value")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--modes", nargs="+", default=["gthread", "asgi"])
+    args = parser.parse_args()
+
+    headers = dict(header.split(": ", 1) for header in args.header)
+    print(f"{'mode':<10}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}  statuses")
+    for mode in args.modes:
+        server = start_server(mode, args.port, args.workers)
+        try:
+            url = f"http://127.0.0.1:{args.port}{args.path}"
+            result = benchmark(url, headers, args.requests, args.concurrency)
+        finally:
+            server.terminate()
+            server.wait()
+
+        statuses = ", ".join(f"{status}: {count}" for status, count in result["statuses"].items())
+        print(
+            f"{mode:<10}{result['requests_per_second']:>10.1f}"
+            f"{result['p50']:>10.1f}{result['p99']:>10.1f}  {statuses}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import './base';
 import './modal';
+import './donation_ticker';
 import './mobile_menu';
 import './sightings_map';
@@ -0,0 +1,28 @@
+document.addEventListener('DOMContentLoaded', () => {
+    const $ticker = document.querySelector('[data-donation-ticker]');
+    if (!$ticker || typeof window.EventSource === 'undefined') {
+        return;
+    }
+
+    const currency = new Intl.NumberFormat('en-GB', { style: 'currency', currency: 'GBP' });
+
+    function showTotals(totals) {
+        $ticker.textContent = `${currency.format(totals.amount_total)} raised`;
+        $ticker.hidden = false;
+    }
+
+    // One push connection per browser, fed by the server as donations are made
+    const source = new EventSource($ticker.dataset.donationTicker);
+
+    source.addEventListener('totals', (event) => {
+        showTotals(JSON.parse(event.data));
+    });
+
+    source.addEventListener('donation', (event) => {
+        const donations = JSON.parse(event.data);
+        showTotals(donations.totals);
+        $ticker.title = donations.count === 1
+            ? `Latest donation: ${currency.format(donations.amount)}`
+            : `Latest ${donations.count} donations: ${currency.format(donations.amount)}`;
+    });
+});